@@ -0,0 +1,102 @@
+# benchmarks/bench_feed_encoding.py
+"""
+RSS 피드 인코딩 처리 방식 벤치마크입니다.
+- 기존 방식: response.encoding = response.apparent_encoding 후 ET.fromstring(response.text)
+- 새 방식: ET.fromstring(prepare_feed_bytes(url, response.content))
+
+녹화(저장)해 둔 피드 파일을 인자로 넘기면 해당 파일로 측정하고,
+없으면 보안뉴스 RSS와 같은 형태(EUC-KR, 한글 본문)의 피드를 생성하여 측정합니다.
+
+실행 예:
+    python benchmarks/bench_feed_encoding.py
+    python benchmarks/bench_feed_encoding.py --feed recorded_boannews.xml --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+
+# 벤치마크가 실제 로컬 저장소를 건드리지 않도록 임시 경로를 사용합니다.
+config.LOCAL_DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+
+import requests  # noqa: E402
+
+from modules.feed_encoding import prepare_feed_bytes  # noqa: E402
+
+
+def build_sample_feed(item_count=60, declare_encoding=True):
+    """보안뉴스 RSS와 비슷한 구조의 EUC-KR 피드를 생성합니다."""
+    description = ("보안 전문가들은 최근 발견된 랜섬웨어 공격이 국내 기업의 VPN 장비 취약점을 악용하고 있다고 경고했다. "
+                   "공격자는 패치되지 않은 장비를 통해 내부망에 침투한 뒤 관리자 계정을 탈취하는 것으로 나타났다. ") * 6
+    items = []
+    for i in range(item_count):
+        items.append(
+            "<item>"
+            f"<title>[긴급] 주요 보안 업데이트 권고 {i}호</title>"
+            f"<link>http://www.boannews.com/media/view.asp?idx={100000 + i}</link>"
+            f"<description>{description}</description>"
+            "<pubDate>Mon, 13 Oct 2025 09:00:00 +0900</pubDate>"
+            "</item>"
+        )
+    declaration = '<?xml version="1.0" encoding="euc-kr"?>' if declare_encoding else '<?xml version="1.0"?>'
+    body = (f"{declaration}<rss version=\"2.0\"><channel><title>보안뉴스</title>"
+            + "".join(items) + "</channel></rss>")
+    return body.encode("euc-kr")
+
+
+def make_response(content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.headers["Content-Type"] = "text/xml"
+    return response
+
+
+def old_path(content):
+    response = make_response(content)
+    response.encoding = response.apparent_encoding
+    return ET.fromstring(response.text)
+
+
+def new_path(url, content):
+    response = make_response(content)
+    return ET.fromstring(prepare_feed_bytes(url, response.content))
+
+
+def run_case(label, url, content, repeat):
+    old_root = old_path(content)
+    new_root = new_path(url, content)
+    assert [t.text for t in old_root.iter("title")] == [t.text for t in new_root.iter("title")], "파싱 결과가 다릅니다."
+
+    old_time = min(timeit.repeat(lambda: old_path(content), number=1, repeat=repeat))
+    new_time = min(timeit.repeat(lambda: new_path(url, content), number=1, repeat=repeat))
+    print(f"[{label}] 크기: {len(content) / 1024:.1f}KB")
+    print(f"  기존 (apparent_encoding): {old_time * 1000:8.2f} ms")
+    print(f"  신규 (bytes 직접 파싱):    {new_time * 1000:8.2f} ms  (x{old_time / new_time:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feed", help="녹화해 둔 RSS 피드 파일 경로")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.feed:
+        with open(args.feed, "rb") as f:
+            run_case(os.path.basename(args.feed), f"file://{os.path.abspath(args.feed)}", f.read(), args.repeat)
+        return
+
+    run_case("EUC-KR 선언 포함", "bench://declared", build_sample_feed(), args.repeat)
+    # 선언이 없는 피드는 첫 실행에서만 감지하고 이후에는 저장된 인코딩을 재사용합니다.
+    run_case("선언 없음 (인코딩 메모 사용)", "bench://undeclared", build_sample_feed(declare_encoding=False), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+# benchmarks/bench_markdown_render.py
+"""
+Notion 블록 / Tistory HTML 렌더링 방식 벤치마크입니다.
+- 기존 방식: 줄 단위 parse_markdown_to_notion_blocks(Notion) + markdown2.markdown(Tistory)로 본문을 두 번 파싱
+- 새 방식: markdown_ir.parse_markdown으로 한 번 파싱한 IR을 render_notion_blocks / render_html이 함께 사용
+
+저장해 둔 마크다운 파일을 인자로 넘기면 해당 파일로 측정하고,
+없으면 주간 블로그 글(generate_weekly_tech_blog_post 출력)과 같은 형태의 본문을 지정한 크기로 생성하여 측정합니다.
+markdown2가 설치되어 있지 않으면 기존 방식은 Notion 변환만 측정합니다.
+
+실행 예:
+    python benchmarks/bench_markdown_render.py
+    python benchmarks/bench_markdown_render.py --size-kb 500 --repeat 10
+    python benchmarks/bench_markdown_render.py --markdown weekly_post.md
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.markdown_ir import parse_markdown, render_notion_blocks, render_html  # noqa: E402
+
+try:
+    import markdown2
+except ImportError:
+    markdown2 = None
+
+
+def legacy_parse_markdown_to_notion_blocks(markdown_text):
+    """비교 기준: markdown_ir 도입 전 notion_handler.parse_markdown_to_notion_blocks 구현 (인라인 서식 미지원)."""
+    blocks = []
+    if not markdown_text or not markdown_text.strip():
+        blocks.append({
+            "object": "block", "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": "상세 내용이 제공되지 않았습니다."}}]}
+        })
+        return blocks
+
+    current_paragraph_lines = []
+    max_text_length = 2000
+
+    def create_rich_text_array(text_content):
+        return [{"type": "text", "text": {"content": text_content}}]
+
+    def split_text_and_create_blocks(block_type, text_content, block_specific_data=None):
+        generated_blocks = []
+        if text_content is None: text_content = ""
+
+        while True:
+            part = text_content[:max_text_length]
+            text_content = text_content[max_text_length:]
+
+            block_content_data = {"rich_text": create_rich_text_array(part)}
+
+            if block_type == "code" and block_specific_data:
+                block_content_data["language"] = block_specific_data.get("language", "plaintext")
+
+            generated_blocks.append({"object": "block", "type": block_type, block_type: block_content_data})
+
+            if not text_content: break
+        return generated_blocks
+
+    def flush_paragraph_buffer():
+        if current_paragraph_lines:
+            paragraph_text = "\n".join(current_paragraph_lines).strip()
+            if paragraph_text:
+                blocks.extend(split_text_and_create_blocks("paragraph", paragraph_text))
+            current_paragraph_lines.clear()
+
+    lines = markdown_text.split('\n')
+    i = 0
+    while i < len(lines):
+        line = lines[i].rstrip()
+
+        if line.startswith("### "):
+            flush_paragraph_buffer()
+            blocks.extend(split_text_and_create_blocks("heading_3", line[4:]))
+        elif line.startswith("## "):
+            flush_paragraph_buffer()
+            blocks.extend(split_text_and_create_blocks("heading_2", line[3:]))
+        elif line.startswith("# "):
+            flush_paragraph_buffer()
+            blocks.extend(split_text_and_create_blocks("heading_1", line[2:]))
+        elif line.startswith("- ") or line.startswith("* "):
+            flush_paragraph_buffer()
+            blocks.extend(split_text_and_create_blocks("bulleted_list_item", line[2:]))
+        elif re.match(r"^\d+\.\s", line):
+            flush_paragraph_buffer()
+            content = re.sub(r"^\d+\.\s", "", line)
+            blocks.extend(split_text_and_create_blocks("numbered_list_item", content))
+        elif line.startswith("> "):
+            flush_paragraph_buffer()
+            quote_lines = [line[2:]]
+            while i + 1 < len(lines) and lines[i+1].rstrip().startswith("> "):
+                i += 1
+                quote_lines.append(lines[i].rstrip()[2:])
+            blocks.extend(split_text_and_create_blocks("quote", "\n".join(quote_lines)))
+        elif line.startswith("```"):
+            flush_paragraph_buffer()
+            language = line[3:].strip().lower() or "plaintext"
+            code_block_lines = []
+            i += 1
+            while i < len(lines) and not lines[i].rstrip() == "```":
+                code_block_lines.append(lines[i])
+                i += 1
+            code_content = "\n".join(code_block_lines)
+            blocks.extend(split_text_and_create_blocks("code", code_content, {"language": language}))
+        elif not line.strip():
+            flush_paragraph_buffer()
+        else:
+            current_paragraph_lines.append(line)
+        i += 1
+
+    flush_paragraph_buffer()
+
+    if not blocks:
+        blocks.append({
+            "object": "block", "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": "처리할 수 있는 상세 내용이 없습니다."}}]}
+        })
+    return blocks
+
+
+def build_sample_post(size_kb=200):
+    """주간 CVE/기술 블로그 글과 비슷한 구조의 마크다운 본문을 약 size_kb KB 크기로 생성합니다."""
+    section = (
+        "## **CVE-2025-{n}: Apache Struts 원격 코드 실행 취약점 분석**\n\n"
+        "이번 주에 공개된 **CVE-2025-{n}**은 `OGNL` 표현식 처리 과정의 입력 검증 누락으로 발생합니다. "
+        "공격자는 조작된 요청 하나로 서버에서 임의 명령을 실행할 수 있습니다. 자세한 내용은 "
+        "[NVD 상세 페이지](https://nvd.nist.gov/vuln/detail/CVE-2025-{n})를 참고하세요.\n"
+        "패치가 배포되기 전까지는 WAF 규칙으로 의심스러운 요청을 차단하는 것이 좋습니다.\n\n"
+        "### 영향받는 버전\n\n"
+        "- Struts **2.0.0** ~ 2.5.32\n"
+        "- Struts 6.0.0 ~ 6.3.0.1\n"
+        "- `struts2-core`를 포함한 모든 배포판\n\n"
+        "### 대응 방안\n\n"
+        "1. 최신 버전으로 업데이트합니다.\n"
+        "2. 파일 업로드 기능을 점검합니다.\n"
+        "3. 로그에서 *비정상적인* 요청 패턴을 확인합니다.\n\n"
+        "> 이 취약점은 이미 실제 공격에 악용되고 있으므로\n"
+        "> 가능한 한 빨리 조치해야 합니다.\n\n"
+        "```bash\n"
+        "grep -r \"struts2-core\" /opt/apps --include=*.jar\n"
+        "curl -s -o /dev/null -w \"%{{http_code}}\" https://example.com/upload.action\n"
+        "```\n\n"
+    )
+    parts = ["# 주간 보안 취약점 리포트\n\n"]
+    size = len(parts[0])
+    n = 10000
+    while size < size_kb * 1024:
+        part = section.format(n=n)
+        parts.append(part)
+        size += len(part.encode("utf-8"))
+        n += 1
+    return "".join(parts)
+
+
+def old_path(markdown_text):
+    blocks = legacy_parse_markdown_to_notion_blocks(markdown_text)
+    html_text = markdown2.markdown(markdown_text, extras=["fenced-code-blocks", "tables", "strike"]) if markdown2 else ""
+    return blocks, html_text
+
+
+def new_path(markdown_text):
+    ir_blocks = parse_markdown(markdown_text)
+    return render_notion_blocks(ir_blocks), render_html(ir_blocks)
+
+
+def run_case(label, markdown_text, repeat):
+    old_blocks, _ = old_path(markdown_text)
+    new_blocks, _ = new_path(markdown_text)
+    old_types = [block["type"] for block in old_blocks]
+    new_types = [block["type"] for block in new_blocks]
+    assert old_types == new_types, "Notion 블록 구성이 기존 방식과 다릅니다."
+
+    old_time = min(timeit.repeat(lambda: old_path(markdown_text), number=1, repeat=repeat))
+    new_time = min(timeit.repeat(lambda: new_path(markdown_text), number=1, repeat=repeat))
+    old_label = "기존 (Notion 파싱 + markdown2)" if markdown2 else "기존 (Notion 파싱만, markdown2 없음)"
+    print(f"[{label}] 크기: {len(markdown_text.encode('utf-8')) / 1024:.1f}KB, Notion 블록 {len(new_blocks)}개")
+    print(f"  {old_label}: {old_time * 1000:8.2f} ms")
+    print(f"  신규 (IR 1회 파싱 + 두 렌더러): {new_time * 1000:8.2f} ms  (x{old_time / new_time:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markdown", help="저장해 둔 마크다운 본문 파일 경로")
+    parser.add_argument("--size-kb", type=int, default=200, help="생성할 본문 크기(KB)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.markdown:
+        with open(args.markdown, encoding="utf-8") as f:
+            run_case(os.path.basename(args.markdown), f.read(), args.repeat)
+        return
+
+    run_case("주간 블로그 글 (생성)", build_sample_post(args.size_kb), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# benchmarks/bench_markdown_split.py
+"""
+긴 코드/인용/문단 블록의 Notion 블록 변환(markdown_ir.parse_markdown + render_notion_blocks) 시간이
+입력 크기에 비례해 늘어나는지 확인하는 마이크로 벤치마크입니다.
+
+- 기존 분할 방식: 남은 문자열을 2000자마다 `text[2000:]`로 다시 잘라 복사 (입력 길이의 제곱에 비례)
+- 새 분할 방식: 시작 위치만 옮기며 필요한 구간만 잘라냄 (입력 길이에 비례)
+
+입력 크기를 두 배씩 늘려 가며 측정하고, 두 배로 늘렸을 때 걸린 시간이 --max-growth배를 넘으면
+선형 시간이 깨진 것으로 보고 종료 코드 1로 끝납니다. --legacy를 주면 기존 분할 방식을 끼워 넣어
+검사가 회귀를 잡아내는지 확인할 수 있습니다.
+
+실행 예:
+    python benchmarks/bench_markdown_split.py
+    python benchmarks/bench_markdown_split.py --sizes-kb 256 512 1024 --repeat 7
+    python benchmarks/bench_markdown_split.py --legacy
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import markdown_ir  # noqa: E402
+from modules.markdown_ir import (  # noqa: E402
+    NOTION_MAX_RICH_TEXT_ITEMS, NOTION_MAX_TEXT_LENGTH, _notion_rich_text, parse_markdown, render_notion_blocks,
+)
+
+
+def legacy_split_spans(spans):
+    """비교 기준: 남은 문자열을 매번 다시 잘라 복사하던 기존 _split_spans 구현."""
+    chunks = []
+    current_chunk = []
+    current_length = 0
+    for span_text, bold, italic, strike, code, link in spans:
+        while True:
+            part = span_text[:NOTION_MAX_TEXT_LENGTH - current_length]
+            span_text = span_text[NOTION_MAX_TEXT_LENGTH - current_length:]
+            if part:
+                current_chunk.append(_notion_rich_text(part, bold, italic, strike, code, link))
+                current_length += len(part)
+            if current_length >= NOTION_MAX_TEXT_LENGTH or len(current_chunk) >= NOTION_MAX_RICH_TEXT_ITEMS:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_length = 0
+            if not span_text: break
+    if current_chunk or not chunks:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def build_code_block(size_kb):
+    line = 'curl -s "https://example.com/api/v1/cve?id=CVE-2025-12345" | jq ".items[] | select(.score > 7)"\n'
+    return "```bash\n" + line * (size_kb * 1024 // len(line)) + "```\n"
+
+
+def build_quote_block(size_kb):
+    line = "> 이 취약점은 이미 실제 공격에 악용되고 있으므로 가능한 한 빨리 조치해야 합니다.\n"
+    return line * (size_kb * 1024 // len(line.encode("utf-8")))
+
+
+def build_paragraph(size_kb):
+    line = "공격자는 조작된 요청 하나로 서버에서 임의 명령을 실행할 수 있으며 패치 전까지 WAF 규칙으로 차단해야 합니다.\n"
+    return line * (size_kb * 1024 // len(line.encode("utf-8")))
+
+
+CASES = [
+    ("코드 블록", build_code_block),
+    ("인용 블록", build_quote_block),
+    ("문단", build_paragraph),
+]
+
+
+def render(markdown_text):
+    return render_notion_blocks(parse_markdown(markdown_text))
+
+
+def measure(markdown_text, repeat):
+    return min(timeit.repeat(lambda: render(markdown_text), number=1, repeat=repeat))
+
+
+def run_case(label, builder, sizes_kb, repeat, max_growth):
+    """크기별 시간을 출력하고, 크기를 두 배로 늘렸을 때의 최대 시간 증가율을 반환합니다."""
+    print(f"[{label}]")
+    previous_time = None
+    worst_growth = 0.0
+    for size_kb in sizes_kb:
+        markdown_text = builder(size_kb)
+        elapsed = measure(markdown_text, repeat)
+        line = f"  {size_kb:6d}KB: {elapsed * 1000:9.2f} ms"
+        if previous_time:
+            growth = elapsed / previous_time
+            worst_growth = max(worst_growth, growth)
+            line += f"  (이전 크기 대비 x{growth:.2f}{' <- 선형 초과' if growth > max_growth else ''})"
+        print(line)
+        previous_time = elapsed
+    return worst_growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[256, 512, 1024, 2048],
+                        help="측정할 입력 크기(KB). 두 배씩 늘어나도록 지정하세요.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help="크기를 두 배로 늘렸을 때 허용하는 최대 시간 증가율 (선형이면 약 2, 제곱이면 약 4)")
+    parser.add_argument("--legacy", action="store_true", help="기존 분할 방식으로 바꿔 측정합니다.")
+    args = parser.parse_args()
+
+    if args.legacy:
+        markdown_ir._split_spans = legacy_split_spans
+        print("기존 분할 방식(문자열 재복사)으로 측정합니다.\n")
+
+    regressions = []
+    for label, builder in CASES:
+        worst_growth = run_case(label, builder, args.sizes_kb, args.repeat, args.max_growth)
+        if worst_growth > args.max_growth:
+            regressions.append(f"{label} (최대 x{worst_growth:.2f})")
+
+    if regressions:
+        print(f"\n[FAIL] 입력 크기에 비례하지 않는 변환 시간: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\n[OK] 모든 경우에서 크기 두 배당 시간 증가가 x{args.max_growth} 이하입니다.")
+
+
+if __name__ == "__main__":
+    main()
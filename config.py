@@ -19,6 +19,8 @@ GEMINI_API_KEY = "GEMINI_API_KEY"  # 실제 API 키로 교체해야 합니다.
 # Notion API 설정
 NOTION_API_TOKEN = "NOTION_API_TOKEN" # Notion 통합 토큰
 DATABASE_ID = "DATABASE_ID" # Notion 데이터베이스 ID
+BOANISSUE_DATABASE_ID = "BOANISSUE_DATABASE_ID" # 보안이슈 Notion 데이터베이스 ID
+CVE_DATABASE_ID = "CVE_DATABASE_ID" # CVE Notion 데이터베이스 ID
 
 # Slack Webhook URL (알림용)
 SLACK_WEBHOOK_URL = "https://SLACK_WEBHOOK_URL" # 실제 Slack Webhook URL로 교체해야 합니다. 
@@ -27,3 +29,148 @@ SLACK_WEBHOOK_URL = "https://SLACK_WEBHOOK_URL" # 실제 Slack Webhook URL로 
 TISTORY_EMAIL = "TISTORY_EMAIL@kakao.com"
 TISTORY_PASSWORD = "TISTORY_PASSWORD"
 TISTORY_BLOG_NAME = "TISTORY_BLOG_NAME"
+# Tistory 브라우저 세션 설정
+# TISTORY_COOKIE_PATH: 로그인 후 저장하는 쿠키 파일 경로. 다음 실행에서 이 쿠키로 로그인 없이 세션을 복원합니다.
+# TISTORY_PAGE_TIMEOUT_SECONDS: 페이지 이동·요소 대기의 기본 최대 대기 시간(초)
+TISTORY_COOKIE_PATH = "data/tistory_cookies.json"
+TISTORY_PAGE_TIMEOUT_SECONDS = 20
+# Tistory 발행 큐 설정
+# Notion 페이지 생성 시 글을 큐에 넣고, 별도 작업이 TISTORY_PUBLISH_INTERVAL_MINUTES마다 하나의 브라우저 세션으로 모두 발행합니다.
+# TISTORY_PUBLISH_MAX_ATTEMPTS: 글 하나의 최대 발행 시도 횟수 (넘으면 'failed'로 남겨 둠)
+# TISTORY_PUBLISH_RETENTION_DAYS: 발행을 마친 글을 큐에 남겨 두는 기간(일)
+TISTORY_PUBLISH_INTERVAL_MINUTES = 30
+TISTORY_PUBLISH_MAX_ATTEMPTS = 3
+TISTORY_PUBLISH_RETENTION_DAYS = 7
+# Tistory HTTP 발행 설정
+# TISTORY_HTTP_ENABLED가 True이면 저장된 로그인 쿠키로 HTTP 요청을 보내 발행하고, 발행되지 않은 것이 확실할 때만 Selenium 발행으로 대체합니다.
+#   카테고리 ID가 설정되지 않은(0) 카테고리의 글은 HTTP로 보내지 않고 Selenium으로 발행합니다.
+#   TISTORY_CATEGORY_IDS를 채운 뒤 True로 바꿔 사용합니다.
+# TISTORY_HTTP_BASE_URL: 발행 요청을 보낼 주소 (None이면 https://{TISTORY_BLOG_NAME}.tistory.com).
+#   로컬 테스트 시 tools/tistory_standin_server.py 주소(예: "http://127.0.0.1:8765")로 바꿔 사용합니다.
+# TISTORY_CATEGORY_IDS: 카테고리 이름별 Tistory 카테고리 ID (블로그 관리 > 카테고리 관리에서 확인, 0은 '카테고리 없음')
+TISTORY_HTTP_ENABLED = False
+TISTORY_HTTP_BASE_URL = None
+TISTORY_CATEGORY_IDS = {
+    "CVE": 0,
+    "보안이슈": 0,
+    "기타": 0,
+}
+
+# 로컬 저장소 (SQLite) 경로
+# 이미 발행된 URL 인덱스 등 실행 간에 유지해야 하는 데이터를 저장합니다.
+LOCAL_DB_PATH = "data/local_store.sqlite3"
+# 로컬 URL 인덱스 보관 기간(일). 오래된 항목 보관(90일)과 맞추며, 이 기간 동안 Notion에서 확인되지 않은 URL은 정리됩니다.
+URL_INDEX_RETENTION_DAYS = 90
+
+# 일반 크롤링 작업(보안뉴스, 데일리시큐, KRCERT, NCSC)의 최대 동시 실행 수
+# 1로 설정하면 기존처럼 순차적으로 실행됩니다.
+CRAWLING_MAX_WORKERS = 4
+
+# 공유 HTTP 세션 연결 풀 설정
+# HTTP_POOL_CONNECTIONS: 유지할 호스트별 연결 풀 개수, HTTP_POOL_MAXSIZE: 호스트당 최대 keep-alive 연결 수
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+
+# RSS 피드 조건부 요청(ETag / Last-Modified) 캐시 설정
+# 저장된 검증자가 이 시간(시간 단위)보다 오래되면 무시하고 피드 전체를 다시 처리합니다.
+FEED_CACHE_MAX_AGE_HOURS = 6
+
+# RSS 소스별 '이미 발행된 항목에서 중단' 정책
+# 피드가 최신순으로 정렬되어 있으므로, True인 소스는 이전 실행에서 발행된 항목을 RSS_STOP_AFTER_KNOWN_ITEMS개 연속으로
+# 만나면 나머지 항목을 파싱하지 않습니다. 이번 실행에서 다른 피드가 발행(작성 대기 포함)한 항목은 개수에 넣지 않습니다.
+# 피드 여러 개가 같은 기사를 공유하는 소스(보안뉴스)는 한 피드가 다른 피드의 새 항목을 건너뛸 수 있으므로 꺼 둡니다.
+RSS_STOP_ON_KNOWN = {
+    "보안뉴스": False,
+    "데일리시큐": True,
+    "KRCERT 보안공지": True,
+}
+RSS_STOP_AFTER_KNOWN_ITEMS = 3
+
+# Gemini 응답 캐시 설정
+# 같은 모델·프롬프트·입력 텍스트의 결과를 재사용합니다. TTL(일)이 지나거나 최대 개수를 넘으면 오래된 항목부터 삭제됩니다.
+GEMINI_CACHE_TTL_DAYS = 30
+GEMINI_CACHE_MAX_ENTRIES = 5000
+
+# 소스별 Gemini 통합 생성 모드 사용 여부 (기본값: 모두 사용 안 함)
+# True인 소스는 요약과 상세 분석을 한 번의 API 호출로 생성합니다 (응답 형식이 맞지 않으면 개별 호출로 대체).
+# 통합 호출은 gemini-2.5-flash를 사용하므로, 켜면 요약도 gemini-2.5-flash-lite 대신 flash 모델로 생성됩니다
+# (호출 수는 줄지만 요약 비용이 늘고 결과 문체가 달라질 수 있습니다). 소스별로 확인한 뒤 켜세요.
+GEMINI_COMBINED_ENRICHMENT = {
+    "보안뉴스": False,
+    "데일리시큐": False,
+    "KRCERT 보안공지": False,
+    "NCSC 보안공지": False,
+}
+
+# Gemini 클라이언트 설정
+# GEMINI_MAX_CONCURRENCY: 동시에 진행할 수 있는 최대 Gemini 요청 수
+# GEMINI_RATE_LIMITS: 모델별 분당 요청 수(rpm)와 분당 토큰 수(tpm) 제한 (사용 중인 요금제에 맞게 조정)
+GEMINI_MAX_CONCURRENCY = 4
+GEMINI_RATE_LIMITS = {
+    "gemini-2.5-flash": {"rpm": 10, "tpm": 250000},
+    "gemini-2.5-flash-lite": {"rpm": 15, "tpm": 250000},
+}
+GEMINI_DEFAULT_RATE_LIMIT = {"rpm": 10, "tpm": 250000}
+
+# 주간 CVE 블로그 글의 map-reduce 요약 설정
+# CVE 목록의 추정 토큰 수가 이 값을 넘으면 여러 묶음으로 나눠 병렬 요약한 뒤 최종 글을 생성합니다.
+WEEKLY_CVE_CHUNK_TOKEN_BUDGET = 60000
+
+# NVD CVE API 설정
+# NVD_API_KEY: NVD에서 발급받은 API 키 (비워두면 키 없이 요청하며, 속도 제한이 30초당 5회로 낮아집니다)
+# NVD_RESULTS_PER_PAGE: 페이지당 결과 수 (최대 2000), NVD_MAX_CONCURRENCY: 동시에 미리 요청할 최대 페이지 수
+NVD_API_KEY = ""
+NVD_RESULTS_PER_PAGE = 2000
+NVD_MAX_CONCURRENCY = 3
+
+# 로컬 CVE 저장소 설정
+# 첫 동기화(또는 마지막 동기화 후 120일 이상 지난 경우)에 가져올 최근 게시 기간(일)
+# 로컬에 보관하는 기간도 같으며, 게시일이 이보다 오래된 CVE는 변경분으로 받아도 저장하지 않고 동기화 후 정리합니다.
+# (크롤러가 조회하는 가장 긴 기간인 10일보다 길어야 합니다)
+CVE_STORE_BOOTSTRAP_DAYS = 30
+
+# CVE 우선순위 분류(triage) 설정
+# CVSS 점수, 공격 벡터, 고위험 CWE 여부, 참조 수를 가중합해 0~1 점수를 계산하고 상위 항목만 Gemini로 보냅니다.
+# CVE_TRIAGE_TOP_N: 일일 CVE 크롤링에서 분석할 최대 개수, WEEKLY_CVE_TRIAGE_TOP_N: 주간 글에 포함할 최대 개수
+# CVE_TRIAGE_MIN_PRIORITY: 이 점수 미만인 CVE는 제외 (None이면 기준 없음)
+CVE_TRIAGE_TOP_N = 20
+WEEKLY_CVE_TRIAGE_TOP_N = 100
+CVE_TRIAGE_MIN_PRIORITY = None
+CVE_TRIAGE_WEIGHTS = {
+    "cvss": 0.5,
+    "attack_vector": 0.2,
+    "cwe": 0.2,
+    "references": 0.1,
+}
+CVE_TRIAGE_HIGH_RISK_CWES = [
+    "CWE-78", "CWE-77", "CWE-89", "CWE-94", "CWE-502", "CWE-787", "CWE-416",
+    "CWE-22", "CWE-287", "CWE-306", "CWE-434", "CWE-918", "CWE-862",
+]
+
+# 일일 CVE 묶음 분석 설정
+# CVE_BATCH_ENRICHMENT가 True이면 여러 CVE를 한 번의 Gemini 호출로 묶어 분석합니다 (응답에서 찾지 못한 CVE는 개별 재시도).
+# CVE_BATCH_TOKEN_BUDGET: 한 묶음의 입력 추정 토큰 수 상한, CVE_BATCH_MAX_ITEMS: 한 묶음의 최대 CVE 수 (출력 길이 제한 고려)
+CVE_BATCH_ENRICHMENT = True
+CVE_BATCH_TOKEN_BUDGET = 8000
+CVE_BATCH_MAX_ITEMS = 5
+
+# Notion API 설정
+# NOTION_REQUESTS_PER_SECOND: 모든 Notion 요청이 공유하는 초당 요청 수 제한 (Notion 권장 평균 초당 3회)
+# NOTION_WRITER_MAX_WORKERS: 페이지 생성과 블록 추가를 동시에 진행할 작성 스레드 수
+NOTION_REQUESTS_PER_SECOND = 3
+NOTION_WRITER_MAX_WORKERS = 3
+# NOTION_MAX_RETRIES: 429·일시적 오류 시 최대 재시도 횟수 (Retry-After 헤더가 있으면 그 시간만큼 대기)
+# NOTION_BACKOFF_BASE_SECONDS / NOTION_BACKOFF_MAX_SECONDS: Retry-After가 없을 때 지수 백오프의 시작/최대 대기 시간(초)
+NOTION_MAX_RETRIES = 5
+NOTION_BACKOFF_BASE_SECONDS = 1
+NOTION_BACKOFF_MAX_SECONDS = 30
+# NOTION_BLOCK_APPEND_MAX_ATTEMPTS: 페이지 하나의 블록 추가 최대 시도 횟수 (넘으면 'failed'로 표시하고 더 이상 이어쓰지 않음)
+NOTION_BLOCK_APPEND_MAX_ATTEMPTS = 3
+
+# 오래된 Notion 항목 보관(archive) 작업 설정
+# ARCHIVE_INTERVAL_HOURS: 보관 작업 실행 주기(시간). 매시간 크롤링과 별도로 실행됩니다.
+# NOTION_ARCHIVE_MAX_WORKERS: 동시에 보낼 보관 요청 수 (전체 속도는 NOTION_REQUESTS_PER_SECOND로 제한)
+ARCHIVE_INTERVAL_HOURS = 24
+NOTION_ARCHIVE_MAX_WORKERS = 3
+# NOTION_ARCHIVE_MAX_ATTEMPTS: 페이지 하나의 최대 보관 시도 횟수 (넘으면 한 번 보고하고 더 이상 시도하지 않음)
+NOTION_ARCHIVE_MAX_ATTEMPTS = 5
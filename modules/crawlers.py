@@ -5,11 +5,10 @@
 - KRCERT 보안공지 (RSS)
 - 보안뉴스 (RSS)
 - 데일리시큐 (RSS)
+RSS 소스는 sources.py에 정의되어 있으며 rss_pipeline.py의 공통 파이프라인으로 처리됩니다.
 """
 
 import time
-import urllib.request
-import xml.etree.ElementTree as ET
 import requests
 from bs4 import BeautifulSoup
 import json
@@ -24,10 +23,17 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 
 # 다른 모듈에서 필요한 함수 및 설정값 임포트
-from config import ssl_context, CVE_DATABASE_ID, BOANISSUE_DATABASE_ID
+from config import (CVE_DATABASE_ID, BOANISSUE_DATABASE_ID, GEMINI_COMBINED_ENRICHMENT, WEEKLY_CVE_CHUNK_TOKEN_BUDGET,
+                    CVE_TRIAGE_TOP_N, WEEKLY_CVE_TRIAGE_TOP_N, CVE_TRIAGE_MIN_PRIORITY,
+                    CVE_BATCH_ENRICHMENT, CVE_BATCH_TOKEN_BUDGET, CVE_BATCH_MAX_ITEMS)
 from .utils import date_re, send_slack_message
+from .cve_store import sync_cve_store, iter_stored_cves, english_description
+from .cve_triage import select_priority_cves
+from .sources import get_rss_source
+from .rss_pipeline import run_rss_source
 from .notion_handler import Duplicate_check, create_notion_page, get_recent_entries # get_recent_entries 추가
-from .gemini_handler import summarize_text, details_text, CVE_details_text, extract_and_explain_keywords, generate_weekly_tech_blog_post
+from .notion_writer import enqueue_notion_page
+from .gemini_handler import summarize_text, details_text, summarize_and_detail_text, CVE_details_text, CVE_details_text_map_reduce, CVE_details_text_packed, extract_and_explain_keywords, generate_weekly_tech_blog_post
 
 def crawl_ncsc_page():
     """
@@ -167,8 +173,11 @@ def crawl_ncsc_page():
                         details_for_notion = f"## 🔍 뉴스 요약\n\nNCSC(국가사이버안보센터)에서 '{article_title}'에 대한 보안공지를 발표했습니다.\n\n## 💡 핵심 포인트\n\n- 자세한 내용은 원문 링크를 참조하시기 바랍니다."
                     else:
                         # 텍스트가 성공적으로 추출/구성된 경우 Gemini API 호출
-                        summarized_content = summarize_text(page_text_content)
-                        details_content = details_text(page_text_content)
+                        if GEMINI_COMBINED_ENRICHMENT.get(source_name, False):
+                            summarized_content, details_content = summarize_and_detail_text(page_text_content)
+                        else:
+                            summarized_content = summarize_text(page_text_content)
+                            details_content = details_text(page_text_content)
 
                         if "실패" in summarized_content or "실패" in details_content:
                             send_slack_message(f"[WARN] {source_name} '{article_title}' 처리 중 Gemini API 실패. "
@@ -179,7 +188,7 @@ def crawl_ncsc_page():
 
                     # --- NCSC 상세 페이지 본문 크롤링 로직 끝 ---
 
-                    create_notion_page(article_title, summary_for_notion, article_url, posting_date, "NCSC", details_for_notion, BOANISSUE_DATABASE_ID)
+                    enqueue_notion_page(article_title, summary_for_notion, article_url, posting_date, "NCSC", details_for_notion, BOANISSUE_DATABASE_ID)
 
                 elif duplicate_status == 1:
                     print(f"  [{source_name}-SKIP] 중복된 항목: {article_title}")
@@ -206,258 +215,82 @@ def crawl_ncsc_page():
             
 def securityNotice_crawling():
     """KRCERT(한국인터넷진흥원) 보안 공지 RSS 피드를 크롤링합니다."""
-    source_name = "KRCERT 보안공지"
-    url = 'http://knvd.krcert.or.kr/rss/securityNotice.do'
-    try:
-        print(f"--- {source_name} 크롤링 시작 ({url}) ---")
-        with urllib.request.urlopen(url, context=ssl_context, timeout=15) as response:
-            xml_data = response.read().decode('utf-8')
-
-        root = ET.fromstring(xml_data)
-        channel = root.find('channel')
-        if channel is None:
-            print(f"{source_name} RSS 피드에서 'channel' 태그를 찾을 수 없습니다.")
-            return
-
-        items_processed = 0
-        for item_elem in channel.findall('item'):
-            items_processed +=1
-            title = item_elem.findtext('title', default='제목 없음').strip()
-            link_url = item_elem.findtext('link', default='').strip()
-            original_content = item_elem.findtext('description', default='내용 없음').strip()
-            pub_date_str = item_elem.findtext('pubDate', default='').strip()
-            category_ = "KRCERT"
-
-            if not link_url:
-                print(f"[{source_name}-SKIP] URL 없는 항목: {title}")
-                continue
-
-            posting_date = date_re(pub_date_str)
-            if not posting_date:
-                print(f"[{source_name}-SKIP] 날짜 변환 실패 항목: {title} (원본 날짜: {pub_date_str})")
-                continue
-
-            duplicate_status = Duplicate_check(link_url,BOANISSUE_DATABASE_ID)
-            if duplicate_status == 0:
-                print(f"[{source_name}-PROCESSING] 새 항목: {title}")
-                summarized_content = summarize_text(original_content)
-                details_content = details_text(original_content)
-
-                if "실패" in summarized_content or "실패" in details_content:
-                    send_slack_message(f"[WARN] {source_name} '{title}' 처리 중 Gemini API 실패. "
-                                       f"요약: {summarized_content}, 상세: {details_content}")
-
-                create_notion_page(title, summarized_content, link_url, posting_date, category_, details_content,BOANISSUE_DATABASE_ID)
-            elif duplicate_status == 1:
-                print(f"[{source_name}-SKIP] 중복된 항목: {title}")
-            else:
-                 print(f"[{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {title}")
-
-    except urllib.error.URLError as e:
-        print(f"{source_name} RSS URL({url}) 열기 실패: {e}")
-        send_slack_message(f"[ERROR] {source_name} RSS URL 열기 실패: {e}")
-    except ET.ParseError as e:
-        print(f"{source_name} RSS XML 파싱 실패: {e}")
-        send_slack_message(f"[ERROR] {source_name} RSS XML 파싱 실패: {e}")
-    except Exception as e:
-        print(f"{source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
-        send_slack_message(f"[ERROR] {source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
+    run_rss_source(get_rss_source("KRCERT 보안공지"))
 
 
 def boanNews_crawling():
     """보안뉴스 RSS 피드를 크롤링합니다. pubDate와 dc:date 태그를 모두 확인합니다."""
-    source_name = "보안뉴스"
-    namespaces = {'dc': 'http://purl.org/dc/elements/1.1/'}
-
-    try:
-        urls = [
-            'http://www.boannews.com/media/news_rss.xml?skind=5',
-            'http://www.boannews.com/media/news_rss.xml?skind=6',
-            'http://www.boannews.com/media/news_rss.xml?mkind=1'
-        ]
-        print(f"--- {source_name} 크롤링 시작 ---")
-        for rss_url in urls:
-            print(f"  - {rss_url} 처리 중...")
-            try:
-                response = requests.get(rss_url, timeout=15)
-                response.raise_for_status()
-                response.encoding = response.apparent_encoding
-                root = ET.fromstring(response.text)
-                channel = root.find('channel')
-
-                if channel is None:
-                    print(f"  [{source_name}-WARN] RSS ({rss_url})에서 'channel' 태그를 찾을 수 없습니다.")
-                    continue
-
-                for item_elem in channel.findall('item'):
-                    title = item_elem.findtext('title', default='제목 없음').strip()
-                    link_url = item_elem.findtext('link', default='').strip()
-                    original_content = item_elem.findtext('description', default='내용 없음').strip()
-                    category_ = "보안뉴스"
-
-                    pub_date_str = item_elem.findtext('pubDate', default='').strip()
-                    if not pub_date_str:
-                        dc_date_element = item_elem.find('dc:date', namespaces)
-                        if dc_date_element is None:
-                            dc_date_element = item_elem.find('{http://purl.org/dc/elements/1.1/}date')
-                        if dc_date_element is not None and dc_date_element.text:
-                            pub_date_str = dc_date_element.text.strip()
-
-                    if not link_url:
-                        print(f"  [{source_name}-SKIP] URL 없는 항목: {title}")
-                        continue
-
-                    posting_date = date_re(pub_date_str)
-                    if not posting_date:
-                        print(f"  [{source_name}-SKIP] 날짜 변환 실패 항목: {title} (원본 날짜: '{pub_date_str}')")
-                        continue
-
-                    if rss_url.endswith('mkind=1') and "[긴급]" not in title:
-                        continue
-
-                    duplicate_status = Duplicate_check(link_url,BOANISSUE_DATABASE_ID)
-                    if duplicate_status == 0:
-                        print(f"  [{source_name}-PROCESSING] 새 항목: {title}")
-                        summarized_content = summarize_text(original_content)
-                        details_content = details_text(original_content)
-                        if "실패" in summarized_content or "실패" in details_content:
-                            send_slack_message(f"[WARN] {source_name} '{title}' 처리 중 Gemini API 실패. "
-                                               f"요약: {summarized_content}, 상세: {details_content}")
-                        create_notion_page(title, summarized_content, link_url, posting_date, category_, details_content,BOANISSUE_DATABASE_ID)
-                    elif duplicate_status == 1:
-                        print(f"  [{source_name}-SKIP] 중복된 항목: {title}")
-                    else:
-                        print(f"  [{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {title}")
-
-            except requests.exceptions.RequestException as e:
-                print(f"  [{source_name}-ERROR] RSS ({rss_url}) 요청 실패: {e}")
-                send_slack_message(f"[ERROR] {source_name} RSS ({rss_url}) 요청 실패: {e}")
-                continue
-            except ET.ParseError as e:
-                print(f"  [{source_name}-ERROR] RSS ({rss_url}) XML 파싱 실패: {e}")
-                send_slack_message(f"[ERROR] {source_name} RSS ({rss_url}) XML 파싱 실패: {e}")
-                continue
-    except Exception as e:
-        print(f"{source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
-        send_slack_message(f"[ERROR] {source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
+    run_rss_source(get_rss_source("보안뉴스"))
 
 
 def dailysecu_crawling():
     """데일리시큐 RSS 피드를 크롤링합니다."""
-    source_name = "데일리시큐"
-    url = 'https://www.dailysecu.com/rss/S1N2.xml'
+    run_rss_source(get_rss_source("데일리시큐"))
+
+def nvd_cve_crawling():
+    """로컬 CVE 저장소를 NVD와 동기화한 뒤 최근 10일간 게시된 CVE를 Notion에 등록합니다."""
+    source_name = "NVD CVE"
+
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=10)
+
     try:
-        print(f"--- {source_name} 크롤링 시작 ({url}) ---")
+        print(f"--- {source_name} 크롤링 시작 (로컬 CVE 저장소) ---")
         try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding
-            root = ET.fromstring(response.text)
-            channel = root.find('channel')
-            if channel is None:
-                print(f"{source_name} RSS ({url})에서 'channel' 태그를 찾을 수 없습니다.")
-                return
-
-            for item_elem in channel.findall('item'):
-                title = item_elem.findtext('title', default='제목 없음').strip()
-                link_url = item_elem.findtext('link', default='').strip()
-                original_content = item_elem.findtext('description', default='내용 없음').strip()
-                category_ = "데일리시큐"
-
-                pub_date_str = item_elem.findtext('pubDate', default='').strip()
-                if not pub_date_str:
-                    dc_date_elem = item_elem.find('{http://purl.org/dc/elements/1.1/}date')
-                    if dc_date_elem is not None and dc_date_elem.text:
-                        pub_date_str = dc_date_elem.text.strip()
-
-                if not link_url:
-                    print(f"[{source_name}-SKIP] URL 없는 항목: {title}")
-                    continue
-
-                posting_date = date_re(pub_date_str)
-                if not posting_date:
-                    print(f"[{source_name}-SKIP] 날짜 변환 실패 항목: {title} (원본 날짜: {pub_date_str})")
-                    continue
+            # NVD에서 변경분만 받아 로컬 저장소를 갱신한 뒤, 게시일 기준으로 로컬에서 조회합니다.
+            sync_cve_store()
+            new_vulnerabilities = []
+            for vuln in iter_stored_cves(start_date, end_date):
+                cve_id = vuln.get('cve', {}).get('id', '제목 없음')
+                link_url = f"https://nvd.nist.gov/vuln/detail/{cve_id}"
 
-                duplicate_status = Duplicate_check(link_url,BOANISSUE_DATABASE_ID)
+                duplicate_status = Duplicate_check(link_url, CVE_DATABASE_ID)
                 if duplicate_status == 0:
-                    print(f"[{source_name}-PROCESSING] 새 항목: {title}")
-                    summarized_content = summarize_text(original_content)
-                    details_content = details_text(original_content)
-                    if "실패" in summarized_content or "실패" in details_content:
-                        send_slack_message(f"[WARN] {source_name} '{title}' 처리 중 Gemini API 실패. "
-                                           f"요약: {summarized_content}, 상세: {details_content}")
-                    create_notion_page(title, summarized_content, link_url, posting_date, category_, details_content,BOANISSUE_DATABASE_ID)
+                    new_vulnerabilities.append(vuln)
                 elif duplicate_status == 1:
-                    print(f"[{source_name}-SKIP] 중복된 항목: {title}")
+                    print(f"[{source_name}-SKIP] 중복된 항목: {cve_id}")
                 else:
-                    print(f"[{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {title}")
-
-        except requests.exceptions.RequestException as e:
-            print(f"{source_name} RSS ({url}) 요청 실패: {e}")
-            send_slack_message(f"[ERROR] {source_name} RSS ({url}) 요청 실패: {e}")
-        except ET.ParseError as e:
-            print(f"{source_name} RSS ({url}) XML 파싱 실패: {e}")
-            send_slack_message(f"[ERROR] {source_name} RSS ({url}) XML 파싱 실패: {e}")
-    except Exception as e:
-        print(f"{source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
-        send_slack_message(f"[ERROR] {source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
+                    print(f"[{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {cve_id}")
 
-def nvd_cve_crawling():
-    """NVD API v2.0 JSON 데이터를 크롤링합니다 (최근 90일만)."""
-    source_name = "NVD CVE"
-    base_url = 'https://services.nvd.nist.gov/rest/json/cves/2.0'
+            # 새 CVE 전체의 우선순위를 계산해 상위 항목만 Gemini로 분석합니다.
+            selected_vulnerabilities = select_priority_cves(
+                new_vulnerabilities, top_n=CVE_TRIAGE_TOP_N, min_priority=CVE_TRIAGE_MIN_PRIORITY)
+            print(f"[{source_name}] 새 CVE {len(new_vulnerabilities)}개 중 우선순위 상위 {len(selected_vulnerabilities)}개 처리")
 
-    end_date = datetime.utcnow()
-    start_date = end_date - timedelta(days=10) # NVD API는 최대 120일
-    pubStartDate = start_date.strftime("%Y-%m-%dT00:00:00.000")
-    pubEndDate = end_date.strftime("%Y-%m-%dT23:59:59.999")
-
-    params = {
-        "pubStartDate": pubStartDate,
-        "pubEndDate": pubEndDate,
-        "resultsPerPage": 2000
-    }
+            cve_items = []
+            for vuln in selected_vulnerabilities:
+                cve = vuln.get('cve', {})
+                cve_items.append((cve.get('id', '제목 없음'), english_description(cve)))
+                print(f"[{source_name}-PROCESSING] 새 항목: {cve_items[-1][0]}")
 
-    try:
-        print(f"--- {source_name} 크롤링 시작 ({base_url}) ---")
-        try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            if CVE_BATCH_ENRICHMENT:
+                # 여러 CVE를 토큰 예산 안에서 한 프롬프트로 묶어 분석하고, 결과를 CVE별로 나눕니다.
+                enrichment_results = CVE_details_text_packed(cve_items, CVE_BATCH_TOKEN_BUDGET, CVE_BATCH_MAX_ITEMS)
+            else:
+                enrichment_results = []
+                for cve_id, description_en in cve_items:
+                    # CVE_details_text가 이제 (제목, 본문) 튜플을 반환합니다.
+                    generated_cve_title, generated_cve_body = CVE_details_text(description_en)
+                    # 요약은 별도로 summarize_text로 만들거나, generated_cve_body에서 일부 발췌
+                    summarized_content = summarize_text(description_en) # 원래대로 원문으로 요약
+                    enrichment_results.append((generated_cve_title, summarized_content, generated_cve_body))
 
-            vulnerabilities = data.get('vulnerabilities', [])
-            for vuln in vulnerabilities:
+            for vuln, (generated_cve_title, summarized_content, generated_cve_body) in zip(selected_vulnerabilities, enrichment_results):
                 cve = vuln.get('cve', {})
                 cve_id = cve.get('id', '제목 없음')
                 published = cve.get('published', '')
-                descriptions = cve.get('descriptions', [])
-                description_en = next((desc['value'] for desc in descriptions if desc['lang'] == 'en'), '내용 없음')
 
                 category_ = "CVE"
                 link_url = f"https://nvd.nist.gov/vuln/detail/{cve_id}"
 
                 posting_date = date_re(published)
 
-                duplicate_status = Duplicate_check(link_url, CVE_DATABASE_ID)
-                if duplicate_status == 0:
-                    print(f"[{source_name}-PROCESSING] 새 항목: {cve_id}")
-                    # CVE_details_text가 이제 (제목, 본문) 튜플을 반환합니다.
-                    generated_cve_title, generated_cve_body = CVE_details_text(description_en)
-                    
-                    # 요약은 별도로 summarize_text로 만들거나, generated_cve_body에서 일부 발췌
-                    summarized_content = summarize_text(description_en) # 원래대로 원문으로 요약
-
-                    if "실패" in generated_cve_title or "실패" in generated_cve_body:
-                        send_slack_message(f"[WARN] {source_name} '{cve_id}' 처리 중 Gemini API 실패. "
-                                           f"생성 제목: {generated_cve_title}, 생성 본문: {generated_cve_body}")
+                if "실패" in generated_cve_title or "실패" in generated_cve_body:
+                    send_slack_message(f"[WARN] {source_name} '{cve_id}' 처리 중 Gemini API 실패. "
+                                       f"생성 제목: {generated_cve_title}, 생성 본문: {generated_cve_body}")
 
-                    # Notion 페이지 생성 시, Gemini가 생성한 제목과 본문을 사용합니다.
-                    create_notion_page(generated_cve_title, summarized_content, link_url, posting_date, category_, generated_cve_body, CVE_DATABASE_ID)
-                elif duplicate_status == 1:
-                    print(f"[{source_name}-SKIP] 중복된 항목: {cve_id}")
-                else:
-                    print(f"[{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {cve_id}")
+                # Notion 페이지 생성 시, Gemini가 생성한 제목과 본문을 사용합니다. (작성 큐에 넣고 바로 다음 항목 처리)
+                enqueue_notion_page(generated_cve_title, summarized_content, link_url, posting_date, category_, generated_cve_body, CVE_DATABASE_ID)
 
         except requests.exceptions.RequestException as e:
             print(f"{source_name} API 요청 실패: {e}")
@@ -472,48 +305,39 @@ def nvd_cve_crawling():
 
 # Week_nvd_cve_crawling 함수 내부 수정:
 def Week_nvd_cve_crawling():
-    """NVD API v2.0 JSON 데이터를 크롤링하여 최근 7일치 CVE를 하나의 Notion 페이지로 등록합니다."""
+    """로컬 CVE 저장소를 NVD와 동기화한 뒤 최근 7일치 CVE를 하나의 Notion 페이지로 등록합니다."""
     source_name = "NVD CVE 주간 요약" # 이름 변경으로 명확화
-    base_url = 'https://services.nvd.nist.gov/rest/json/cves/2.0'
 
     # 최근 7일 구간 계산
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=7)
-    pubStartDate = start_date.strftime("%Y-%m-%dT00:00:00.000")
-    pubEndDate = end_date.strftime("%Y-%m-%dT23:59:59.999")
-
-    params = {
-        "pubStartDate": pubStartDate,
-        "pubEndDate": pubEndDate,
-        "resultsPerPage": 2000
-    }
 
     try:
-        print(f"--- {source_name} 크롤링 시작 ({base_url}) ---")
+        print(f"--- {source_name} 크롤링 시작 (로컬 CVE 저장소) ---")
         try:
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            vulnerabilities = data.get('vulnerabilities', [])
             all_descriptions_for_summary = []  # 모든 CVE 원문을 요약용으로 모을 리스트
 
-            for vuln in vulnerabilities:
+            # NVD에서 변경분만 받아 로컬 저장소를 갱신한 뒤, 최근 7일 게시분을 로컬에서 조회합니다.
+            sync_cve_store()
+            weekly_vulnerabilities = list(iter_stored_cves(start_date, end_date))
+            # 우선순위 상위 CVE만 블로그 글 생성 프롬프트에 포함합니다.
+            selected_vulnerabilities = select_priority_cves(
+                weekly_vulnerabilities, top_n=WEEKLY_CVE_TRIAGE_TOP_N, min_priority=CVE_TRIAGE_MIN_PRIORITY)
+            print(f"[{source_name}] 최근 7일 CVE {len(weekly_vulnerabilities)}개 중 우선순위 상위 {len(selected_vulnerabilities)}개 사용")
+            for vuln in selected_vulnerabilities:
                 cve = vuln.get('cve', {})
                 cve_id = cve.get('id', '제목 없음')
-                descriptions = cve.get('descriptions', [])
-                description_en = next((desc['value'] for desc in descriptions if desc['lang'] == 'en'), '내용 없음')
+                description_en = english_description(cve)
                 
                 # 주간 요약용 텍스트에 각 CVE ID와 설명을 추가
                 all_descriptions_for_summary.append(f"CVE ID: {cve_id}\n설명: {description_en}\n")
 
-            # 모든 CVE 원문을 하나의 텍스트로 결합
-            combined_cve_text = "\n---\n".join(all_descriptions_for_summary)
-
             if all_descriptions_for_summary:
-                print(f"총 {len(vulnerabilities)}개의 CVE를 기반으로 블로그 포스트 생성 요청 중...")
-                # CVE_details_text 함수를 호출하여 (제목, 본문) 튜플을 받습니다.
-                raw_generated_blog_title, generated_blog_body = CVE_details_text(combined_cve_text)
+                print(f"총 {len(all_descriptions_for_summary)}개의 CVE를 기반으로 블로그 포스트 생성 요청 중...")
+                # CVE 목록이 크면 토큰 예산 단위로 나눠 병렬 요약(map)한 뒤 최종 글을 생성(reduce)합니다.
+                # (제목, 본문) 튜플을 받습니다.
+                raw_generated_blog_title, generated_blog_body = CVE_details_text_map_reduce(
+                    all_descriptions_for_summary, WEEKLY_CVE_CHUNK_TOKEN_BUDGET)
                 
                 # Notion 속성용 요약은 별도로 생성 (예: 처음 200자)
                 page_summary_for_notion_property = "최근 7일간의 주요 CVE를 분석한 상세 보고서입니다."
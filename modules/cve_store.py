@@ -0,0 +1,188 @@
+# modules/cve_store.py
+"""
+NVD CVE 데이터를 로컬 저장소(SQLite)에 미러링하는 모듈입니다.
+- 첫 실행에서는 최근 CVE_STORE_BOOTSTRAP_DAYS일 치를 게시일 기준으로 가져옵니다.
+- 이후에는 마지막 동기화 시점부터 lastModStartDate/lastModEndDate로 변경분만 가져와 반영합니다.
+- 크롤러는 게시일, CVSS 점수 등으로 로컬에서 바로 조회합니다.
+- 게시일이 CVE_STORE_BOOTSTRAP_DAYS일보다 오래된 CVE는 NVD가 다시 수정해도 저장하지 않고, 동기화할 때마다 정리합니다.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import requests
+
+from config import CVE_STORE_BOOTSTRAP_DAYS
+from .local_store import ensure_schema, execute, executemany
+from .nvd_client import iter_nvd_vulnerabilities
+from .utils import send_slack_message
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS cves (
+        cve_id TEXT PRIMARY KEY,
+        published TEXT NOT NULL,
+        last_modified TEXT,
+        base_score REAL,
+        severity TEXT,
+        attack_vector TEXT,
+        description TEXT,
+        raw_json TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cves_published ON cves (published)",
+    """
+    CREATE TABLE IF NOT EXISTS cve_sync_state (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+]
+
+# NVD API는 한 번의 검색 기간을 최대 120일로 제한합니다.
+_NVD_MAX_RANGE_DAYS = 120
+_NVD_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000"
+_UPSERT_BATCH_SIZE = 500
+
+
+def extract_cvss(cve):
+    """
+    CVE JSON에서 CVSS 기본 점수, 심각도, 공격 벡터를 추출합니다. (v3.1 → v3.0 → v2 순서로 확인)
+    값이 없으면 (None, None, None)을 반환합니다.
+    """
+    metrics = cve.get('metrics', {})
+    for metric_key in ('cvssMetricV31', 'cvssMetricV30'):
+        entries = metrics.get(metric_key) or []
+        if entries:
+            cvss_data = entries[0].get('cvssData', {})
+            return cvss_data.get('baseScore'), cvss_data.get('baseSeverity'), cvss_data.get('attackVector')
+    entries = metrics.get('cvssMetricV2') or []
+    if entries:
+        cvss_data = entries[0].get('cvssData', {})
+        return cvss_data.get('baseScore'), entries[0].get('baseSeverity'), cvss_data.get('accessVector')
+    return None, None, None
+
+
+def english_description(cve):
+    """CVE JSON에서 영어 설명을 반환합니다."""
+    return next((desc['value'] for desc in cve.get('descriptions', []) if desc.get('lang') == 'en'), '내용 없음')
+
+
+def _to_row(vuln):
+    cve = vuln.get('cve', {})
+    base_score, severity, attack_vector = extract_cvss(cve)
+    return (
+        cve.get('id'),
+        cve.get('published', ''),
+        cve.get('lastModified'),
+        base_score,
+        severity,
+        attack_vector,
+        english_description(cve),
+        json.dumps(cve, ensure_ascii=False),
+    )
+
+
+def _get_state(key):
+    rows = execute("SELECT value FROM cve_sync_state WHERE key = ?", (key,))
+    return rows[0][0] if rows else None
+
+
+def _set_state(key, value):
+    execute("INSERT OR REPLACE INTO cve_sync_state (key, value) VALUES (?, ?)", (key, value), commit=True)
+
+
+def _upsert_vulnerabilities(vulnerabilities, published_cutoff):
+    count = 0
+    batch = []
+    for vuln in vulnerabilities:
+        row = _to_row(vuln)
+        # 오래된 CVE의 점수 재산정 등은 조회 기간 밖이므로 저장하지 않습니다.
+        if not row[0] or row[1] < published_cutoff:
+            continue
+        batch.append(row)
+        if len(batch) >= _UPSERT_BATCH_SIZE:
+            executemany("INSERT OR REPLACE INTO cves VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        executemany("INSERT OR REPLACE INTO cves VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        count += len(batch)
+    return count
+
+
+def _prune_old_cves(published_cutoff):
+    """게시일이 기준보다 오래된 CVE를 저장소에서 제거하고 제거한 개수를 반환합니다."""
+    expired = execute("SELECT COUNT(*) FROM cves WHERE published < ?", (published_cutoff,))[0][0]
+    if expired:
+        execute("DELETE FROM cves WHERE published < ?", (published_cutoff,), commit=True)
+    return expired
+
+
+def sync_cve_store():
+    """
+    로컬 CVE 저장소를 NVD와 동기화합니다.
+    마지막 동기화 기록이 없거나 120일 이상 지났으면 최근 CVE_STORE_BOOTSTRAP_DAYS일 치를 게시일 기준으로 다시 가져오고,
+    그렇지 않으면 마지막 동기화 이후 변경(추가/수정)된 CVE만 가져옵니다.
+    성공하면 True, 실패하면 False를 반환합니다 (실패 시 기존 로컬 데이터는 그대로 사용할 수 있습니다).
+    """
+    try:
+        ensure_schema("cves", _SCHEMA)
+        sync_started_at = datetime.utcnow()
+        last_sync_str = _get_state("last_sync")
+        last_sync = datetime.strptime(last_sync_str, _NVD_DATE_FORMAT) if last_sync_str else None
+
+        if last_sync is None or sync_started_at - last_sync >= timedelta(days=_NVD_MAX_RANGE_DAYS):
+            start_date = sync_started_at - timedelta(days=CVE_STORE_BOOTSTRAP_DAYS)
+            params = {
+                "pubStartDate": start_date.strftime("%Y-%m-%dT00:00:00.000"),
+                "pubEndDate": sync_started_at.strftime("%Y-%m-%dT23:59:59.999"),
+            }
+            print(f"로컬 CVE 저장소 초기 동기화: 최근 {CVE_STORE_BOOTSTRAP_DAYS}일 게시분")
+        else:
+            params = {
+                "lastModStartDate": last_sync.strftime(_NVD_DATE_FORMAT),
+                "lastModEndDate": sync_started_at.strftime(_NVD_DATE_FORMAT),
+            }
+            print(f"로컬 CVE 저장소 변경분 동기화: {last_sync_str} 이후 수정분")
+
+        published_cutoff = (sync_started_at - timedelta(days=CVE_STORE_BOOTSTRAP_DAYS)).strftime("%Y-%m-%dT00:00:00.000")
+        upserted_count = _upsert_vulnerabilities(iter_nvd_vulnerabilities(params), published_cutoff)
+        # 동기화 도중 수정된 항목을 놓치지 않도록 요청을 시작한 시각을 기록합니다.
+        _set_state("last_sync", sync_started_at.strftime(_NVD_DATE_FORMAT))
+        pruned_count = _prune_old_cves(published_cutoff)
+        print(f"로컬 CVE 저장소 동기화 완료: {upserted_count}개 반영, 보관 기간이 지난 {pruned_count}개 정리")
+        return True
+    except (requests.exceptions.RequestException, ValueError, sqlite3.Error) as e:
+        print(f"[ERROR] 로컬 CVE 저장소 동기화 실패 (기존 로컬 데이터 사용): {e}")
+        send_slack_message(f"[ERROR] 로컬 CVE 저장소 동기화 실패 (기존 로컬 데이터 사용): {e}")
+        return False
+
+
+def iter_stored_cves(published_from, published_to, min_base_score=None, batch_size=500):
+    """
+    게시일이 [published_from, published_to] 범위인 CVE를 게시일 순서로 반환하는 제너레이터입니다.
+    각 항목은 NVD API 응답과 같은 {'cve': {...}} 형태입니다.
+    min_base_score를 지정하면 CVSS 기본 점수가 그 이상인 항목만 반환합니다.
+    결과는 batch_size개씩 나눠 읽으므로 메모리 사용량이 일정합니다.
+    """
+    ensure_schema("cves", _SCHEMA)
+    published_from_str = published_from.strftime("%Y-%m-%dT00:00:00.000")
+    published_to_str = published_to.strftime("%Y-%m-%dT23:59:59.999")
+    score_condition = "AND base_score >= ?" if min_base_score is not None else ""
+    score_params = (min_base_score,) if min_base_score is not None else ()
+
+    last_key = ("", "")
+    while True:
+        rows = execute(
+            "SELECT published, cve_id, raw_json FROM cves "
+            "WHERE published BETWEEN ? AND ? AND (published, cve_id) > (?, ?) "
+            f"{score_condition} ORDER BY published, cve_id LIMIT ?",
+            (published_from_str, published_to_str, *last_key, *score_params, batch_size),
+        )
+        if not rows:
+            return
+        for published, cve_id, raw_json in rows:
+            yield {'cve': json.loads(raw_json)}
+        last_key = (rows[-1][0], rows[-1][1])
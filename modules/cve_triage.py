@@ -0,0 +1,99 @@
+# modules/cve_triage.py
+"""
+Gemini로 보내기 전에 CVE 목록의 우선순위를 매기는 분류(triage) 모듈입니다.
+- NVD JSON에서 CVSS 기본 점수, 공격 벡터, CWE, 참조 수를 추출해 열(column) 단위 NumPy 배열로 만듭니다.
+- 전체 배치의 우선순위 점수를 벡터 연산으로 한 번에 계산합니다.
+- 상위 N개 또는 기준 점수 이상인 CVE만 골라 LLM 호출 수를 줄입니다.
+"""
+
+import numpy as np
+
+from config import CVE_TRIAGE_WEIGHTS, CVE_TRIAGE_HIGH_RISK_CWES
+from .cve_store import extract_cvss
+
+# 공격 벡터별 가중치 (원격 공격이 가능할수록 높음)
+_ATTACK_VECTOR_WEIGHTS = {
+    'NETWORK': 1.0,
+    'ADJACENT_NETWORK': 0.6,
+    'ADJACENT': 0.6,
+    'LOCAL': 0.3,
+    'PHYSICAL': 0.1,
+}
+# 아직 분석되지 않아 값이 없는 CVE는 중간값으로 간주해 지나치게 밀려나지 않도록 합니다.
+_UNKNOWN_ATTACK_VECTOR_WEIGHT = 0.5
+_UNSCORED_BASE_SCORE = 5.0
+# 참조 수는 이 값에서 1.0으로 포화됩니다.
+_REFERENCE_COUNT_SATURATION = 20
+
+
+def _cwe_ids(cve):
+    return {
+        desc.get('value')
+        for weakness in cve.get('weaknesses', [])
+        for desc in weakness.get('description', [])
+    }
+
+
+def build_feature_arrays(vulnerabilities):
+    """
+    취약점 항목({'cve': {...}}) 목록에서 우선순위 계산에 필요한 특성을 열 단위 NumPy 배열로 추출합니다.
+    """
+    count = len(vulnerabilities)
+    base_scores = np.full(count, np.nan, dtype=np.float64)
+    attack_vector_weights = np.full(count, _UNKNOWN_ATTACK_VECTOR_WEIGHT, dtype=np.float64)
+    high_risk_cwe = np.zeros(count, dtype=np.float64)
+    reference_counts = np.zeros(count, dtype=np.float64)
+
+    high_risk_cwes = set(CVE_TRIAGE_HIGH_RISK_CWES)
+    for index, vuln in enumerate(vulnerabilities):
+        cve = vuln.get('cve', {})
+        base_score, _, attack_vector = extract_cvss(cve)
+        if base_score is not None:
+            base_scores[index] = base_score
+        if attack_vector in _ATTACK_VECTOR_WEIGHTS:
+            attack_vector_weights[index] = _ATTACK_VECTOR_WEIGHTS[attack_vector]
+        if _cwe_ids(cve) & high_risk_cwes:
+            high_risk_cwe[index] = 1.0
+        reference_counts[index] = len(cve.get('references', []))
+
+    return {
+        'base_score': base_scores,
+        'attack_vector': attack_vector_weights,
+        'high_risk_cwe': high_risk_cwe,
+        'reference_count': reference_counts,
+    }
+
+
+def compute_priority_scores(features):
+    """
+    특성 배열로부터 0~1 범위의 우선순위 점수 배열을 계산합니다. 가중치는 config.CVE_TRIAGE_WEIGHTS를 따릅니다.
+    """
+    base_score = np.nan_to_num(features['base_score'], nan=_UNSCORED_BASE_SCORE) / 10.0
+    reference_score = np.minimum(
+        np.log1p(features['reference_count']) / np.log1p(_REFERENCE_COUNT_SATURATION), 1.0)
+
+    weighted_sum = (
+        CVE_TRIAGE_WEIGHTS['cvss'] * base_score
+        + CVE_TRIAGE_WEIGHTS['attack_vector'] * features['attack_vector']
+        + CVE_TRIAGE_WEIGHTS['cwe'] * features['high_risk_cwe']
+        + CVE_TRIAGE_WEIGHTS['references'] * reference_score
+    )
+    return weighted_sum / sum(CVE_TRIAGE_WEIGHTS.values())
+
+
+def select_priority_cves(vulnerabilities, top_n=None, min_priority=None):
+    """
+    우선순위 점수가 높은 순서로 정렬한 뒤 min_priority 이상, 최대 top_n개의 취약점 항목을 반환합니다.
+    top_n이나 min_priority가 None이면 해당 조건은 적용하지 않습니다.
+    """
+    if not vulnerabilities:
+        return []
+
+    scores = compute_priority_scores(build_feature_arrays(vulnerabilities))
+    # 점수가 같으면 원래 순서(게시일 순)를 유지하도록 안정 정렬을 사용합니다.
+    order = np.argsort(-scores, kind='stable')
+    if min_priority is not None:
+        order = order[scores[order] >= min_priority]
+    if top_n is not None:
+        order = order[:top_n]
+    return [vulnerabilities[index] for index in order]
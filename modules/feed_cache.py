@@ -0,0 +1,122 @@
+# modules/feed_cache.py
+"""
+RSS 피드용 HTTP 검증자(ETag / Last-Modified) 캐시 모듈입니다.
+- 이전 응답의 검증자를 로컬 저장소에 보관하고 If-None-Match / If-Modified-Since 헤더로 조건부 요청을 보냅니다.
+- 서버가 304를 반환하거나, 검증자를 무시하더라도 본문 해시가 이전과 같으면 변경 없음으로 처리합니다.
+"""
+
+import hashlib
+import re
+import sqlite3
+import time
+import warnings
+from urllib.parse import urlparse
+
+from urllib3.exceptions import InsecureRequestWarning
+
+from config import FEED_CACHE_MAX_AGE_HOURS
+from .http_client import get_session
+from .local_store import ensure_schema, execute
+from .sources import RSS_SOURCES
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS feed_validators (
+        url TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        body_hash TEXT,
+        updated_at REAL NOT NULL
+    )
+    """,
+]
+
+
+def _ignore_insecure_warnings_for_unverified_feeds():
+    """
+    인증서 검증 없이 요청하는 피드(request_options의 verify=False, 예: KRCERT)의 호스트에 대해서만
+    InsecureRequestWarning을 끄는 필터를 설치합니다. 다른 호스트의 TLS 경고는 그대로 표시됩니다.
+    warnings.catch_warnings()는 스레드 안전하지 않아 병렬로 도는 크롤러에서 쓰지 않고, 모듈을 불러올 때 한 번만 설치합니다.
+    """
+    for source in RSS_SOURCES:
+        if source.get("request_options", {}).get("verify") is not False:
+            continue
+        for feed in source["feeds"]:
+            host = urlparse(feed["url"]).hostname
+            if host:
+                warnings.filterwarnings(
+                    "ignore",
+                    message=rf"Unverified HTTPS request is being made to host '{re.escape(host)}'",
+                    category=InsecureRequestWarning,
+                )
+
+
+_ignore_insecure_warnings_for_unverified_feeds()
+
+
+def _load_validators(url):
+    ensure_schema("feed_validators", _SCHEMA)
+    rows = execute(
+        "SELECT etag, last_modified, body_hash, updated_at FROM feed_validators WHERE url = ?",
+        (url,),
+    )
+    if not rows:
+        return None
+    etag, last_modified, body_hash, updated_at = rows[0]
+    # 처리 도중 실패한 항목이 영구히 누락되지 않도록, 오래된 검증자는 무시하고 전체를 다시 받습니다.
+    if time.time() - updated_at > FEED_CACHE_MAX_AGE_HOURS * 3600:
+        return None
+    return {"etag": etag, "last_modified": last_modified, "body_hash": body_hash}
+
+
+def fetch_feed(url, timeout=15, **kwargs):
+    """
+    조건부 GET으로 피드를 요청합니다.
+    피드가 이전 실행 이후 변경되지 않았다면 None을, 변경되었다면 requests.Response 객체를 반환합니다.
+    HTTP 오류는 requests.exceptions.RequestException으로 전달됩니다.
+    """
+    try:
+        validators = _load_validators(url)
+    except sqlite3.Error as e:
+        print(f"피드 검증자 캐시 조회 실패 ({url}): {e}")
+        validators = None
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if validators:
+        if validators["etag"]:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    # 서버가 검증자를 지원하지 않는 경우 본문 해시로 변경 여부를 판단합니다.
+    if validators and validators["body_hash"] == hashlib.sha256(response.content).hexdigest():
+        return None
+    return response
+
+
+def remember_feed(url, response):
+    """
+    피드를 모두 처리한 뒤 호출하여 응답의 검증자와 본문 해시를 저장합니다.
+    처리 도중 예외가 발생했거나 항목의 Notion 작성이 실패한 경우에는 호출하지 않아야 다음 실행에서 다시 처리됩니다.
+    """
+    try:
+        ensure_schema("feed_validators", _SCHEMA)
+        execute(
+            "INSERT OR REPLACE INTO feed_validators (url, etag, last_modified, body_hash, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                hashlib.sha256(response.content).hexdigest(),
+                time.time(),
+            ),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        print(f"피드 검증자 캐시 저장 실패 ({url}): {e}")
@@ -0,0 +1,124 @@
+# modules/feed_encoding.py
+"""
+RSS 피드 본문(bytes)을 XML 파서에 그대로 넘길 수 있도록 준비하는 모듈입니다.
+- 기본적으로 XML 선언(<?xml ... encoding="..."?>)이 인코딩을 결정하도록 bytes를 그대로 사용합니다.
+- 전체 본문 문자셋 감지(apparent_encoding)는 꼭 필요한 경우에만 수행하고, 결과는 피드 URL별로 저장해 재사용합니다.
+"""
+
+import codecs
+import re
+import sqlite3
+import time
+
+from requests.compat import chardet
+
+from .local_store import ensure_schema, execute
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS feed_encodings (
+        url TEXT PRIMARY KEY,
+        encoding TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+]
+
+# XML 선언은 문서 맨 앞에 위치하므로 앞부분만 검사합니다.
+_XML_DECLARATION_RE = re.compile(rb'^\s*<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+
+# expat이 직접 디코딩할 수 있는 인코딩 (그 외 멀티바이트 인코딩은 UTF-8로 변환해야 합니다)
+# _normalize_encoding 결과(codecs 정식 이름, 예: latin-1 -> iso8859-1)와 비교하므로 같은 방식으로 정규화해 둡니다.
+_EXPAT_NATIVE_ENCODINGS = {
+    codecs.lookup(name).name for name in ("utf-8", "utf-16", "utf-16-le", "utf-16-be", "ascii", "latin-1")
+}
+
+# 프로세스 내 메모 (url -> encoding). 로컬 저장소에 저장된 값도 처음 조회 시 여기에 채워집니다.
+_encoding_memo = {}
+
+
+def _normalize_encoding(name):
+    try:
+        return codecs.lookup(name).name
+    except (LookupError, TypeError):
+        return None
+
+
+def _load_memo(url):
+    if url in _encoding_memo:
+        return _encoding_memo[url]
+    try:
+        ensure_schema("feed_encodings", _SCHEMA)
+        rows = execute("SELECT encoding FROM feed_encodings WHERE url = ?", (url,))
+    except sqlite3.Error as e:
+        print(f"피드 인코딩 메모 조회 실패 ({url}): {e}")
+        return None
+    encoding = rows[0][0] if rows else None
+    _encoding_memo[url] = encoding
+    return encoding
+
+
+def _save_memo(url, encoding):
+    _encoding_memo[url] = encoding
+    try:
+        ensure_schema("feed_encodings", _SCHEMA)
+        execute(
+            "INSERT OR REPLACE INTO feed_encodings (url, encoding, updated_at) VALUES (?, ?, ?)",
+            (url, encoding, time.time()),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        print(f"피드 인코딩 메모 저장 실패 ({url}): {e}")
+
+
+def _to_utf8_document(content, encoding, errors="strict"):
+    """
+    주어진 인코딩으로 본문을 디코딩한 뒤, XML 선언을 UTF-8로 바꿔 UTF-8 bytes로 반환합니다.
+    """
+    text = content.decode(encoding, errors)
+    text = re.sub(r'^(\s*<\?xml[^>]*?encoding\s*=\s*["\'])[A-Za-z0-9._-]+(["\'])', r'\1utf-8\2', text, count=1)
+    return text.encode("utf-8")
+
+
+def prepare_feed_bytes(url, content):
+    """
+    피드 본문(bytes)을 ET.fromstring 등 XML 파서에 바로 넘길 수 있는 bytes로 반환합니다.
+
+    1. BOM이 있거나 XML 선언의 인코딩을 expat이 지원하면 본문을 그대로 반환합니다.
+    2. 선언된 인코딩이 멀티바이트(euc-kr 등)이면 해당 인코딩으로만 디코딩하여 UTF-8로 변환합니다.
+    3. 선언이 없거나 UTF-8이면 UTF-8 유효성만 확인하고, 실패한 경우에만 피드별 메모 또는 문자셋 감지 결과를 사용합니다.
+    """
+    if content.startswith((codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return content
+
+    match = _XML_DECLARATION_RE.match(content[:512])
+    if match:
+        declared = _normalize_encoding(match.group(1).decode("ascii"))
+        if declared in _EXPAT_NATIVE_ENCODINGS and declared != "utf-8":
+            return content
+        if declared and declared != "utf-8":
+            try:
+                return _to_utf8_document(content, declared)
+            except UnicodeDecodeError:
+                print(f"피드 선언 인코딩({declared})으로 디코딩 실패, 문자셋 감지로 대체합니다: {url}")
+
+    try:
+        content.decode("utf-8")
+        return content
+    except UnicodeDecodeError:
+        pass
+
+    memo_encoding = _load_memo(url)
+    if memo_encoding:
+        try:
+            return _to_utf8_document(content, memo_encoding)
+        except (UnicodeDecodeError, LookupError):
+            print(f"저장된 피드 인코딩({memo_encoding})이 맞지 않아 다시 감지합니다: {url}")
+
+    # 여기까지 왔을 때만 전체 본문 문자셋 감지를 수행합니다.
+    detected = _normalize_encoding(chardet.detect(content).get("encoding"))
+    if not detected:
+        return content
+    _save_memo(url, detected)
+    # 기존 response.text와 마찬가지로 디코딩할 수 없는 바이트는 대체 문자로 바꿉니다.
+    return _to_utf8_document(content, detected, errors="replace")
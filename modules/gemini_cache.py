@@ -0,0 +1,79 @@
+# modules/gemini_cache.py
+"""
+Gemini API 응답을 로컬 저장소에 보관하는 내용 주소 기반(content-addressed) 캐시 모듈입니다.
+- 키: hash(모델명, 프롬프트 템플릿 이름/버전, 입력 텍스트)
+- 오래된 항목은 TTL에 따라 만료되고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 삭제(LRU)합니다.
+"""
+
+import hashlib
+import sqlite3
+import time
+
+from config import GEMINI_CACHE_TTL_DAYS, GEMINI_CACHE_MAX_ENTRIES
+from .local_store import ensure_schema, execute
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS gemini_cache (
+        cache_key TEXT PRIMARY KEY,
+        response TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        last_access REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_gemini_cache_last_access ON gemini_cache (last_access)",
+]
+
+
+def make_cache_key(model_name, prompt_name, prompt_version, text):
+    """
+    모델명, 프롬프트 템플릿 이름과 버전, 입력 텍스트로 캐시 키(SHA-256)를 만듭니다.
+    """
+    hasher = hashlib.sha256()
+    for part in (model_name, prompt_name, str(prompt_version), text or ""):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+def get_cached_response(cache_key):
+    """
+    캐시된 응답 텍스트를 반환합니다. 없거나 TTL이 지난 경우 None을 반환합니다.
+    """
+    try:
+        ensure_schema("gemini_cache", _SCHEMA)
+        rows = execute("SELECT response, created_at FROM gemini_cache WHERE cache_key = ?", (cache_key,))
+        if not rows:
+            return None
+        response_text, created_at = rows[0]
+        now = time.time()
+        if now - created_at > GEMINI_CACHE_TTL_DAYS * 86400:
+            execute("DELETE FROM gemini_cache WHERE cache_key = ?", (cache_key,), commit=True)
+            return None
+        execute("UPDATE gemini_cache SET last_access = ? WHERE cache_key = ?", (now, cache_key), commit=True)
+        return response_text
+    except sqlite3.Error as e:
+        print(f"Gemini 캐시 조회 실패: {e}")
+        return None
+
+
+def store_cached_response(cache_key, response_text):
+    """
+    응답 텍스트를 캐시에 저장하고, 만료되었거나 최대 개수를 넘는 항목을 정리합니다.
+    """
+    try:
+        ensure_schema("gemini_cache", _SCHEMA)
+        now = time.time()
+        execute(
+            "INSERT OR REPLACE INTO gemini_cache (cache_key, response, created_at, last_access) VALUES (?, ?, ?, ?)",
+            (cache_key, response_text, now, now),
+        )
+        execute("DELETE FROM gemini_cache WHERE created_at < ?", (now - GEMINI_CACHE_TTL_DAYS * 86400,))
+        execute(
+            "DELETE FROM gemini_cache WHERE cache_key IN ("
+            "SELECT cache_key FROM gemini_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (GEMINI_CACHE_MAX_ENTRIES,),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        print(f"Gemini 캐시 저장 실패: {e}")
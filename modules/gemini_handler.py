@@ -3,19 +3,123 @@
 Google Gemini API를 사용하여 텍스트를 요약하고 상세 분석하는 모듈입니다.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import google.generativeai as genai
-from config import GEMINI_API_KEY
+from config import GEMINI_API_KEY, GEMINI_MAX_CONCURRENCY, GEMINI_RATE_LIMITS, GEMINI_DEFAULT_RATE_LIMIT
 from .utils import send_slack_message
+from .gemini_cache import make_cache_key, get_cached_response, store_cached_response
+from .rate_limiter import TokenBucket
 import re # <-- 이 줄을 추가해주세요!
 
+# 프롬프트 템플릿 버전. 템플릿을 수정하면 버전을 올려 이전 캐시 결과가 재사용되지 않도록 합니다.
+PROMPT_VERSIONS = {
+    "details_text": 1,
+    "summarize_text": 1,
+    "CVE_details_text": 1,
+    "extract_and_explain_keywords": 1,
+    "generate_weekly_tech_blog_post": 1,
+    "summarize_and_detail_text": 1,
+    "summarize_cve_chunk": 1,
+    "CVE_details_text_batch": 1,
+}
+
+# --- Gemini 클라이언트 공용 자원 ---
+# 모델 객체와 모델별 속도 제한기는 한 번만 만들어 모든 호출(스레드)이 재사용합니다.
+_client_lock = threading.Lock()
+_configured = False
+_models = {}
+_rate_limiters = {}
+_executor = None
+
+
+def estimate_tokens(text):
+    """
+    텍스트의 대략적인 토큰 수를 추정합니다. (한글 기준 약 2자당 1토큰으로 보수적으로 계산)
+    """
+    return max(1, len(text or "") // 2)
+
+
+def _get_model(model_name):
+    """모델 객체를 처음 요청될 때 한 번만 만들고 이후에는 재사용합니다."""
+    global _configured
+    with _client_lock:
+        if not _configured:
+            genai.configure(api_key=GEMINI_API_KEY)
+            _configured = True
+        if model_name not in _models:
+            _models[model_name] = genai.GenerativeModel(model_name)
+        return _models[model_name]
+
+
+def _get_rate_limiters(model_name):
+    """모델별 분당 요청 수(RPM)와 분당 토큰 수(TPM) 제한기를 반환합니다."""
+    with _client_lock:
+        if model_name not in _rate_limiters:
+            limits = GEMINI_RATE_LIMITS.get(model_name, GEMINI_DEFAULT_RATE_LIMIT)
+            _rate_limiters[model_name] = (TokenBucket.per_minute(limits["rpm"]), TokenBucket.per_minute(limits["tpm"]))
+        return _rate_limiters[model_name]
+
+
+def _get_executor():
+    global _executor
+    with _client_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(1, GEMINI_MAX_CONCURRENCY), thread_name_prefix="gemini")
+        return _executor
+
+
+def submit_gemini_task(function, *args):
+    """
+    Gemini 처리 함수(summarize_text 등)를 공용 작업자 풀에 제출하고 Future를 반환합니다.
+    동시에 진행되는 요청 수는 GEMINI_MAX_CONCURRENCY로 제한됩니다.
+    """
+    return _get_executor().submit(function, *args)
+
+
+def run_gemini_tasks(calls):
+    """
+    (함수, 인자 튜플) 목록을 작업자 풀에서 병렬로 실행하고, 입력 순서대로 결과 리스트를 반환합니다.
+    각 Gemini 처리 함수는 오류 시 실패 문자열을 반환하므로 예외는 전파되지 않습니다.
+    """
+    futures = [submit_gemini_task(function, *args) for function, args in calls]
+    return [future.result() for future in futures]
+
+
+def _has_title_and_body_sections(response_text):
+    """응답에 제목/본문 구분 표시가 모두 있는지 확인합니다."""
+    return "---제목 end---" in response_text and "---본문 end---" in response_text
+
+def _generate_text(prompt_name, model_name, prompt, source_text, is_cacheable=None):
+    """
+    프롬프트로 Gemini 응답 텍스트를 생성합니다.
+    같은 모델·프롬프트 버전·입력 텍스트에 대한 결과가 캐시에 있으면 API를 호출하지 않고 재사용합니다.
+    응답이 비어 있거나 is_cacheable(응답)이 False이면 캐시에 저장하지 않습니다.
+    """
+    cache_key = make_cache_key(model_name, prompt_name, PROMPT_VERSIONS[prompt_name], source_text)
+    cached_text = get_cached_response(cache_key)
+    if cached_text is not None:
+        print(f"Gemini 캐시 적중 ({prompt_name}, {model_name})")
+        return cached_text
+
+    model = _get_model(model_name)
+    request_limiter, token_limiter = _get_rate_limiters(model_name)
+    request_limiter.acquire()
+    token_limiter.acquire(estimate_tokens(prompt))
+    response = model.generate_content(prompt)
+    response_text = response.text.strip() if response.text else ""
+    if response_text and (is_cacheable is None or is_cacheable(response_text)):
+        store_cached_response(cache_key, response_text)
+    return response_text
+
 def details_text(text):
     """
     입력된 텍스트[본문]를 바탕으로 Gemini API를 사용하여
     정보 보안 기술에 대한 상세 설명을 생성합니다. (상세 분석용 프롬프트 사용)
     """
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash") # 모델명은 최신 버전으로 사용하는 것을 권장합니다.
+        model_name = "gemini-2.5-flash" # 모델명은 최신 버전으로 사용하는 것을 권장합니다.
 
         prompt = f"""
 정보 보안 관련 기술에 대한 상세 설명을 제공하는 블로그 작성 AI입니다.
@@ -56,8 +160,8 @@ def details_text(text):
 **[본문]**
 {text}
 """
-        response = model.generate_content(prompt)
-        return response.text.strip() if response.text else "상세 분석 실패 (내용 없음)"
+        response_text = _generate_text("details_text", model_name, prompt, text)
+        return response_text if response_text else "상세 분석 실패 (내용 없음)"
 
     except Exception as e:
         print(f"Gemini API (details_text) 호출 중 오류 발생: {e}")
@@ -71,8 +175,7 @@ def summarize_text(text):
     300자 이내의 간결한 요약문을 생성합니다.
     """
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash-lite") # 요약에는 flash 모델이 효율적입니다.
+        model_name = "gemini-2.5-flash-lite" # 요약에는 flash 모델이 효율적입니다.
 
         prompt = f"""
 당신은 핵심 정보를 정확하고 명료하게 전달하는 요약 AI입니다. 제시된 [본문] 텍스트를 바탕으로, 객관적인 사실에 기반하여 핵심 내용을 간결하게 전달하는 뉴스 보도와 같이 독자들이 사건의 핵심을 쉽게 파악하도록 돕는 역할을 수행합니다.
@@ -94,8 +197,8 @@ def summarize_text(text):
 {text}
 [/본문]
 """
-        response = model.generate_content(prompt)
-        return response.text.strip() if response.text else "요약 실패 (내용 없음)"
+        response_text = _generate_text("summarize_text", model_name, prompt, text)
+        return response_text if response_text else "요약 실패 (내용 없음)"
 
     except Exception as e:
         print(f"Gemini API (summarize_text) 오류: {e}")
@@ -103,14 +206,91 @@ def summarize_text(text):
         return "요약 실패 (API 오류)"
 
 
+def _has_summary_and_details_sections(response_text):
+    """응답에 요약/상세 구분 표시가 모두 있는지 확인합니다."""
+    return "---요약 end---" in response_text and "---상세 end---" in response_text
+
+
+def summarize_and_detail_text(text):
+    """
+    입력된 텍스트[본문]를 바탕으로 한 번의 Gemini API 호출로
+    300자 이내의 요약문과 상세 분석(마크다운)을 함께 생성하여 (요약, 상세) 튜플로 반환합니다.
+    응답에서 두 구역을 모두 찾지 못하면 summarize_text와 details_text를 각각 호출하여 대체합니다.
+    """
+    try:
+        model_name = "gemini-2.5-flash"
+
+        prompt = f"""
+당신은 정보 보안 뉴스를 요약하고, 언급된 보안 기술을 상세히 설명하는 블로그 작성 AI입니다.
+제시된 **[본문]**을 바탕으로 아래 두 가지 결과물을 한 번에 한국어로 작성해 주십시오.
+
+1. 요약
+- 객관적인 사실에 기반하여 핵심 내용을 뉴스 보도처럼 간결하게 전달합니다.
+- 중복되는 내용은 생략하고, 여러 번 언급된 중요한 정보에 비중을 둡니다.
+- 쉽고 명확한 표현과 능동적이고 간결한 문장을 사용합니다.
+- 가독성 좋게 줄바꿈하고, 분량은 공백 포함 200자 이상 300자 이내로 작성합니다.
+
+2. 상세
+- 본문에 언급된 보안 관련 기술을 분석하여 자세한 설명을 작성합니다.
+- 필요 없는 정보는 제거하고, 이모지를 활용해 깔끔하고 구체적으로 정리합니다.
+- 기술적 용어나 고유명사같은건 영어 그대로 사용합니다.
+- 세부내용에는 최대한 놓치는 정보나 생략 없이 자세하게 정리합니다.
+- 본문에서 강조하는 내용은 반드시 핵심 포인트 항목에 정리합니다.
+- 노션에 작성할 마크다운이며, 마크다운 코드 블럭으로 감싸지 않습니다.
+
+<공통 참고 사항>
+- 글씨를 굵게 표현하는 "**"표시는 제거해줘
+- <출력 형식>의 구분 표시(start/end 줄)는 그대로 출력해줘.
+
+<출력 형식>
+
+--요약 start---
+(200자 이상 300자 이내 요약)
+---요약 end---
+--상세 start---
+## 🔍 내용 요약
+
+(전체 내용을 간략히 요약)
+
+## 💡 핵심 포인트
+
+- (핵심 포인트 정리)
+
+## 📚 기술 세부 내용
+
+### 1️⃣ (제목)
+
+- (내용)
+---상세 end---
+</출력 형식>
+
+**[본문]**
+{text}
+"""
+        full_response = _generate_text("summarize_and_detail_text", model_name, prompt, text,
+                                       is_cacheable=_has_summary_and_details_sections)
+
+        summary_match = re.search(r'--요약 start---\s*\n(.*?)\n---요약 end---', full_response, re.DOTALL)
+        details_match = re.search(r'--상세 start---\s*\n(.*?)\n---상세 end---', full_response, re.DOTALL)
+
+        if summary_match and details_match and summary_match.group(1).strip() and details_match.group(1).strip():
+            return summary_match.group(1).strip(), details_match.group(1).strip()
+
+        print("Gemini API (summarize_and_detail_text) 응답에서 요약/상세 구역을 찾지 못해 개별 호출로 대체합니다.")
+
+    except Exception as e:
+        print(f"Gemini API (summarize_and_detail_text) 호출 중 오류 발생: {e}. 개별 호출로 대체합니다.")
+
+    return summarize_text(text), details_text(text)
+
+
 def CVE_details_text(text):
     """
     입력된 텍스트(CVE (Common Vulnerabilities and Exposures))를 바탕으로 Gemini API를 사용하여
     CVE 관련 블로그 글을 생성합니다. (기존 블로그 글 형식 프롬프트 사용)
     """
     try:
-        genai.configure(api_key=GEMINI_API_KEY) # GEMINI_API_TOKEN 사용
-        model = genai.GenerativeModel("gemini-2.5-flash")
+        model_name = "gemini-2.5-flash"
 
         # CVE 내용에 대한 블로그 글을 생성하도록 프롬프트를 조정합니다.
         # 기존 블로그 프롬프트의 {주제} 부분에 'CVE (Common Vulnerabilities and Exposures)'를 명시하고,
@@ -144,9 +324,10 @@ H2·H3 소제목을 섞어서 3개 이상
 **[CVE 본문]**
 {text}
 """
-        response = model.generate_content(prompt)
-        
-        full_response = response.text.strip()
+        full_response = _generate_text("CVE_details_text", model_name, prompt, text,
+                                       is_cacheable=_has_title_and_body_sections)
+        if not full_response:
+            return "블로그 글 생성 실패 (내용 없음)", "블로그 글 생성 실패 (내용 없음)"
         
         # 제목과 본문을 정규표현식으로 파싱
         title_match = re.search(r'--제목 start---\s*\n(.*?)\n---제목 end---', full_response, re.DOTALL)
@@ -162,14 +343,217 @@ H2·H3 소제목을 섞어서 3개 이상
         send_slack_message(f"[ERROR] Gemini API (CVE_details_text) 호출 중 오류 발생: {e}")
         return "블로그 글 생성 실패 (API 오류)", "블로그 글 생성 실패 (API 오류)"
 
+def chunk_texts_by_token_budget(texts, token_budget, separator="\n---\n", max_items=None):
+    """
+    텍스트 목록을 순서대로 묶어, 각 묶음의 추정 토큰 수가 token_budget을 넘지 않도록 나눕니다.
+    max_items를 지정하면 한 묶음의 텍스트 수도 그 이하로 제한합니다.
+    하나의 텍스트가 예산보다 크면 단독 묶음이 됩니다. 각 묶음은 텍스트 리스트입니다.
+    """
+    chunks = []
+    current_chunk = []
+    current_tokens = 0
+    separator_tokens = estimate_tokens(separator)
+    for text in texts:
+        text_tokens = estimate_tokens(text)
+        is_full = max_items is not None and len(current_chunk) >= max_items
+        if current_chunk and (is_full or current_tokens + separator_tokens + text_tokens > token_budget):
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_tokens = 0
+        current_tokens += text_tokens + (separator_tokens if current_chunk else 0)
+        current_chunk.append(text)
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def summarize_cve_chunk(text):
+    """
+    여러 CVE 설명이 담긴 묶음(chunk)을 주간 블로그 글 작성을 위한 중간 요약 노트로 정리합니다. (map 단계)
+    결과는 입력 텍스트 기준으로 캐시되므로, reduce 단계가 실패해도 재실행 시 다시 호출하지 않습니다.
+    요약에 실패하면 None을 반환합니다. (정리 노트 자체에 '인증 실패' 같은 표현이 들어갈 수 있으므로 실패 문구를 반환하지 않습니다.)
+    """
+    try:
+        model_name = "gemini-2.5-flash-lite"
+
+        prompt = f"""
+다음은 최근 7일 간 발표된 CVE (Common Vulnerabilities and Exposures) 목록의 일부입니다.
+이후 여러 묶음의 정리 결과를 합쳐 하나의 블로그 글을 작성할 예정이므로, 아래 지침에 따라 중간 정리 노트를 작성해 주세요.
+
+- 영향받는 제품/벤더별로 묶어서 정리합니다.
+- 각 항목에는 CVE ID, 취약점 유형(예: RCE, SQL Injection, XSS), 공격 조건, 영향을 간결하게 적습니다.
+- 원격 코드 실행, 인증 우회 등 심각한 취약점은 맨 앞에 정리합니다.
+- 비슷한 취약점이 많은 경우 대표 CVE ID와 개수만 적어 요약합니다.
+- 기술적 용어나 고유명사같은건 영어 그대로 사용해줘.
+- 글씨를 굵게 표현하는 "**"표시는 제거해줘
+- 머리말이나 맺음말 없이 정리 노트만 출력해줘.
+
+**[CVE 목록]**
+{text}
+"""
+        response_text = _generate_text("summarize_cve_chunk", model_name, prompt, text)
+        if not response_text:
+            print("Gemini API (summarize_cve_chunk) 응답 내용 없음")
+            return None
+        return response_text
+
+    except Exception as e:
+        print(f"Gemini API (summarize_cve_chunk) 호출 중 오류 발생: {e}")
+        send_slack_message(f"[ERROR] Gemini API (summarize_cve_chunk) 호출 중 오류 발생: {e}")
+        return None
+
+
+def CVE_details_text_map_reduce(cve_texts, chunk_token_budget):
+    """
+    CVE 설명 목록을 토큰 예산 단위로 나눠 병렬로 중간 요약(map)한 뒤,
+    중간 요약들을 합쳐 CVE_details_text로 최종 블로그 글(제목, 본문)을 생성(reduce)합니다.
+    입력이 한 묶음에 들어가면 기존처럼 CVE_details_text를 한 번만 호출합니다.
+    """
+    chunks = chunk_texts_by_token_budget(cve_texts, chunk_token_budget)
+    if len(chunks) <= 1:
+        return CVE_details_text("\n---\n".join(cve_texts))
+
+    print(f"CVE {len(cve_texts)}개를 {len(chunks)}개 묶음으로 나눠 병렬 요약합니다...")
+    partial_summaries = run_gemini_tasks([(summarize_cve_chunk, ("\n---\n".join(chunk),)) for chunk in chunks])
+
+    successful_summaries = [summary for summary in partial_summaries if summary is not None]
+    failed_count = len(partial_summaries) - len(successful_summaries)
+    if failed_count:
+        print(f"CVE 묶음 요약 {failed_count}/{len(chunks)}개 실패. 성공한 묶음만으로 최종 글을 생성합니다.")
+        send_slack_message(f"[WARN] 주간 CVE 묶음 요약 {failed_count}/{len(chunks)}개 실패")
+    if not successful_summaries:
+        return "블로그 글 생성 실패 (묶음 요약 실패)", "블로그 글 생성 실패 (묶음 요약 실패)"
+
+    combined_summaries = "\n\n".join(
+        f"[묶음 {index} 정리]\n{summary}" for index, summary in enumerate(successful_summaries, start=1)
+    )
+    return CVE_details_text(combined_summaries)
+
+
+def _format_cve_batch_item(cve_id, description):
+    return f"CVE ID: {cve_id}\n설명: {description}"
+
+
+def _parse_cve_batch_response(full_response, cve_ids):
+    """
+    묶음 응답에서 CVE별 구역을 찾아 {CVE ID: (제목, 요약, 본문)} 딕셔너리로 반환합니다.
+    제목·요약·본문 중 하나라도 비어 있는 CVE는 결과에서 제외합니다.
+    """
+    results = {}
+    for cve_id in cve_ids:
+        escaped_id = re.escape(cve_id)
+        block_match = re.search(rf'===CVE start: {escaped_id}===\s*\n(.*?)\n===CVE end: {escaped_id}===', full_response, re.DOTALL)
+        if not block_match:
+            continue
+        block = block_match.group(1)
+        title_match = re.search(r'--제목 start---\s*\n(.*?)\n---제목 end---', block, re.DOTALL)
+        summary_match = re.search(r'--요약 start---\s*\n(.*?)\n---요약 end---', block, re.DOTALL)
+        body_match = re.search(r'--본문 start---\s*\n(.*?)\n---본문 end---', block, re.DOTALL)
+        sections = [match.group(1).strip() if match else "" for match in (title_match, summary_match, body_match)]
+        if all(sections):
+            results[cve_id] = tuple(sections)
+    return results
+
+
+def CVE_details_text_batch(cve_items):
+    """
+    여러 CVE를 한 번의 Gemini API 호출로 분석합니다.
+    cve_items는 (CVE ID, 설명) 튜플 리스트이며, 응답을 CVE별로 나눠 {CVE ID: (제목, 요약, 본문)} 딕셔너리로 반환합니다.
+    응답 형식이 맞지 않아 찾지 못한 CVE는 결과에 포함되지 않으므로 호출한 쪽에서 개별 처리해야 합니다.
+    """
+    cve_ids = [cve_id for cve_id, _ in cve_items]
+    try:
+        model_name = "gemini-2.5-flash"
+        packed_text = "\n---\n".join(_format_cve_batch_item(cve_id, description) for cve_id, description in cve_items)
+
+        prompt = f"""
+당신은 CVE (Common Vulnerabilities and Exposures)의 기술적 내용을 설명하는 보안 블로그 작성 AI입니다.
+아래 **[CVE 목록]**에 있는 CVE 각각에 대해 제목, 요약, 본문을 한국어로 작성해 주십시오.
+
+<작성 지침>
+- CVE마다 독립된 글로 작성하고, 다른 CVE의 내용을 섞지 않습니다.
+- 요약: 객관적인 사실에 기반하여 뉴스 보도처럼 공백 포함 200자 이상 300자 이내로 작성합니다.
+- 본문: 취약점 개요, 영향받는 대상, 공격 시나리오, 대응 방안을 H2·H3 소제목으로 나눠 자세히 설명합니다.
+- 문체는 친구에게 설명하듯 편안하고 능동적으로 작성하되, 반말은 사용하지 않습니다.
+- 기술적 용어나 고유명사같은건 영어 그대로 사용해줘.
+- 글씨를 굵게 표현하는 "**"표시는 제거해줘
+- 목록에 있는 모든 CVE를 목록 순서대로 빠짐없이 출력하고, <출력 형식>의 구분 표시(start/end 줄)는 그대로 출력해줘.
+</작성 지침>
+
+<출력 형식>
+===CVE start: (CVE ID)===
+--제목 start---
+(글 내용에 맞는 제목)
+---제목 end---
+--요약 start---
+(200자 이상 300자 이내 요약)
+---요약 end---
+--본문 start---
+(본문 내용 작성)
+---본문 end---
+===CVE end: (CVE ID)===
+</출력 형식>
+
+**[CVE 목록]**
+{packed_text}
+"""
+        full_response = _generate_text(
+            "CVE_details_text_batch", model_name, prompt, packed_text,
+            is_cacheable=lambda response_text: len(_parse_cve_batch_response(response_text, cve_ids)) == len(cve_ids))
+        return _parse_cve_batch_response(full_response, cve_ids)
+
+    except Exception as e:
+        print(f"Gemini API (CVE_details_text_batch) 호출 중 오류 발생: {e}")
+        send_slack_message(f"[ERROR] Gemini API (CVE_details_text_batch) 호출 중 오류 발생: {e}")
+        return {}
+
+
+def _CVE_details_text_single(cve_id, description):
+    """CVE 하나를 기존 방식(CVE_details_text + summarize_text)으로 처리해 (제목, 요약, 본문)을 반환합니다."""
+    generated_title, generated_body = CVE_details_text(description)
+    return generated_title, summarize_text(description), generated_body
+
+
+def CVE_details_text_packed(cve_items, token_budget, max_items):
+    """
+    (CVE ID, 설명) 목록을 토큰 예산과 최대 개수 단위로 묶어 CVE_details_text_batch로 병렬 처리하고,
+    입력 순서대로 (제목, 요약, 본문) 리스트를 반환합니다.
+    묶음 응답에서 결과를 찾지 못한 CVE는 CVE_details_text와 summarize_text로 개별 재시도합니다.
+    """
+    if not cve_items:
+        return []
+
+    descriptions = dict(cve_items)
+    item_texts = [_format_cve_batch_item(cve_id, description) for cve_id, description in cve_items]
+    text_chunks = chunk_texts_by_token_budget(item_texts, token_budget, max_items=max_items)
+
+    batches = []
+    position = 0
+    for text_chunk in text_chunks:
+        batches.append(cve_items[position:position + len(text_chunk)])
+        position += len(text_chunk)
+
+    print(f"CVE {len(cve_items)}개를 {len(batches)}개 묶음으로 나눠 분석합니다...")
+    results = {}
+    for batch_result in run_gemini_tasks([(CVE_details_text_batch, (batch,)) for batch in batches]):
+        results.update(batch_result)
+
+    failed_ids = [cve_id for cve_id, _ in cve_items if cve_id not in results]
+    if failed_ids:
+        print(f"묶음 응답에서 찾지 못한 CVE {len(failed_ids)}개를 개별로 재시도합니다: {', '.join(failed_ids)}")
+        retried = run_gemini_tasks([(_CVE_details_text_single, (cve_id, descriptions[cve_id])) for cve_id in failed_ids])
+        results.update(zip(failed_ids, retried))
+
+    return [results[cve_id] for cve_id, _ in cve_items]
+
+
 def extract_and_explain_keywords(text):
     """
     입력된 텍스트를 바탕으로 Gemini API를 사용하여
     최근 7일간의 주요 기술 키워드 10개와 각 설명을 생성합니다.
     """
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash") # 상세한 설명을 위해 pro 모델 사용
+        model_name = "gemini-2.5-flash" # 상세한 설명을 위해 pro 모델 사용
 
         prompt = f"""
 다음은 최근 7일간의 정보 보안 및 기술 관련 뉴스 또는 보고서 내용입니다.
@@ -187,8 +571,8 @@ def extract_and_explain_keywords(text):
 **[본문]**
 {text}
 """
-        response = model.generate_content(prompt)
-        return response.text.strip() if response.text else "기술 키워드 추출 및 설명 실패 (내용 없음)"
+        response_text = _generate_text("extract_and_explain_keywords", model_name, prompt, text)
+        return response_text if response_text else "기술 키워드 추출 및 설명 실패 (내용 없음)"
 
     except Exception as e:
         print(f"Gemini API (extract_and_explain_keywords) 호출 중 오류 발생: {e}")
@@ -201,8 +585,7 @@ def generate_weekly_tech_blog_post(topic_or_combined_text):
     블로그 글 작성 프롬프트에 따라 롱테일 키워드 기반의 기술 블로그 글을 생성합니다.
     """
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash") # 긴 글 생성을 위해 Pro 모델 권장
+        model_name = "gemini-2.5-flash" # 긴 글 생성을 위해 Pro 모델 권장
 
         # {주제} 부분에 들어갈 내용을 프롬프트 템플릿에 맞춰 조정합니다.
         # 여기서는 topic_or_combined_text를 바로 '주제'로 사용하거나,
@@ -243,10 +626,12 @@ H2·H3 소제목을 섞어서 3개 이상
 ---본문 end---
 </출력 형식>
 """
-        response = model.generate_content(prompt)
+        full_response = _generate_text("generate_weekly_tech_blog_post", model_name, prompt, topic_or_combined_text,
+                                       is_cacheable=_has_title_and_body_sections)
+        if not full_response:
+            return "블로그 글 생성 실패 (내용 없음)", "블로그 글 생성 실패 (내용 없음)"
         
         # 응답 텍스트에서 제목과 본문을 분리
-        full_response = response.text.strip()
         
         title_match = re.search(r'--제목 start---\s*\n(.*?)\n---제목 end---', full_response, re.DOTALL)
         body_match = re.search(r'--본문 start---\s*\n(.*?)\n---본문 end---', full_response, re.DOTALL)
@@ -0,0 +1,47 @@
+# modules/http_client.py
+"""
+모든 외부 HTTP 호출(Notion, RSS 피드, NVD, Slack 등)이 공유하는 세션 모듈입니다.
+- 호스트별 keep-alive 연결 풀을 재사용하여 매 요청마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    session = requests.Session()
+    # pool_connections: 유지할 호스트별 연결 풀 개수, pool_maxsize: 호스트당 최대 연결 수
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """
+    프로세스 전체에서 공유하는 requests.Session 객체를 반환합니다.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session():
+    """
+    공유 세션과 열려 있는 연결을 모두 닫습니다. 다음 호출 시 새 세션이 생성됩니다.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
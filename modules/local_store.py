@@ -0,0 +1,71 @@
+# modules/local_store.py
+"""
+프로젝트 전반에서 공유하는 로컬 SQLite 저장소 모듈입니다.
+- 하나의 DB 파일과 연결을 모든 모듈이 함께 사용합니다.
+- 여러 스레드에서 호출될 수 있으므로 모든 접근은 전역 잠금(lock)으로 직렬화합니다.
+"""
+
+import os
+import sqlite3
+import threading
+
+from config import LOCAL_DB_PATH
+
+_connection = None
+_lock = threading.RLock()
+_initialized_schemas = set()
+
+
+def get_connection():
+    """
+    공유 SQLite 연결을 반환합니다. 처음 호출될 때 DB 파일과 상위 디렉토리를 생성합니다.
+    """
+    global _connection
+    with _lock:
+        if _connection is None:
+            db_dir = os.path.dirname(LOCAL_DB_PATH)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            _connection = sqlite3.connect(LOCAL_DB_PATH, check_same_thread=False)
+            _connection.execute("PRAGMA journal_mode=WAL")
+            _connection.execute("PRAGMA synchronous=NORMAL")
+        return _connection
+
+
+def ensure_schema(name, ddl_statements):
+    """
+    주어진 이름의 스키마(테이블, 인덱스)가 한 번만 생성되도록 보장합니다.
+    """
+    if name in _initialized_schemas:
+        return
+    with _lock:
+        if name in _initialized_schemas:
+            return
+        conn = get_connection()
+        for ddl in ddl_statements:
+            conn.execute(ddl)
+        conn.commit()
+        _initialized_schemas.add(name)
+
+
+def execute(sql, params=(), commit=False):
+    """
+    SQL 문을 실행하고 모든 결과 행을 리스트로 반환합니다.
+    """
+    with _lock:
+        conn = get_connection()
+        cursor = conn.execute(sql, params)
+        rows = cursor.fetchall()
+        if commit:
+            conn.commit()
+        return rows
+
+
+def executemany(sql, seq_of_params):
+    """
+    여러 행에 대해 동일한 SQL 문을 실행하고 커밋합니다.
+    """
+    with _lock:
+        conn = get_connection()
+        conn.executemany(sql, seq_of_params)
+        conn.commit()
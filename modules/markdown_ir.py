@@ -0,0 +1,292 @@
+# modules/markdown_ir.py
+"""
+Gemini가 생성한 마크다운을 한 번만 파싱해 간단한 중간 표현(IR)으로 만들고,
+같은 IR로 Notion 블록과 Tistory용 HTML을 모두 렌더링하는 모듈입니다.
+
+IR은 (블록 종류, 내용, 추가 정보) 튜플의 리스트입니다.
+- 텍스트 블록(heading_1~3, paragraph, bulleted_list_item, numbered_list_item, quote):
+  내용은 인라인 구간(span) 리스트, 추가 정보는 None
+- code: 내용은 코드 문자열, 추가 정보는 언어
+- table: 내용은 셀 문자열 리스트의 리스트(첫 행이 머리글), 추가 정보는 원본 텍스트
+- divider: 내용과 추가 정보 모두 None
+
+인라인 구간은 (텍스트, 굵게, 기울임, 취소선, 코드, 링크 URL) 튜플이며,
+Notion rich_text의 annotations/link로 바로 옮겨집니다.
+"""
+
+import html
+import re
+
+# Notion 블록 하나의 rich_text 최대 길이와 최대 원소 수
+NOTION_MAX_TEXT_LENGTH = 2000
+NOTION_MAX_RICH_TEXT_ITEMS = 100
+
+# 인라인 문법: `코드`, **굵게**, ~~취소선~~, [텍스트](URL), *기울임*
+_INLINE_PATTERN = re.compile(
+    r"(?P<code_ticks>`+)(?P<code>.+?)(?P=code_ticks)"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|~~(?P<strike>.+?)~~"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)\s]+)\)"
+    r"|(?<![\*\w])\*(?!\s)(?P<italic>[^*]+?)(?<!\s)\*(?!\*)"
+)
+# 블록 문법: 번호 목록, 구분선, 표 구분 줄
+_NUMBERED_ITEM_PATTERN = re.compile(r"\d+\.\s")
+_DIVIDER_PATTERN = re.compile(r"(\*\s*){3,}$|(-\s*){3,}$|(_\s*){3,}$")
+_TABLE_SEPARATOR_PATTERN = re.compile(r"\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
+
+
+def parse_inline(text, bold=False, italic=False, strike=False, link=None):
+    """
+    인라인 마크다운을 (텍스트, 굵게, 기울임, 취소선, 코드, 링크 URL) 구간 리스트로 변환합니다.
+    굵게/취소선/링크 안의 문법은 바깥 서식을 이어받아 다시 파싱합니다.
+    """
+    spans = []
+    position = 0
+    for match in _INLINE_PATTERN.finditer(text):
+        if match.start() > position:
+            spans.append((text[position:match.start()], bold, italic, strike, False, link))
+        if match.group("code") is not None:
+            spans.append((match.group("code"), bold, italic, strike, True, link))
+        elif match.group("bold") is not None:
+            spans.extend(parse_inline(match.group("bold"), True, italic, strike, link))
+        elif match.group("strike") is not None:
+            spans.extend(parse_inline(match.group("strike"), bold, italic, True, link))
+        elif match.group("link_text") is not None:
+            spans.extend(parse_inline(match.group("link_text"), bold, italic, strike, match.group("link_url")))
+        else:
+            spans.extend(parse_inline(match.group("italic"), bold, True, strike, link))
+        position = match.end()
+    if position < len(text):
+        spans.append((text[position:], bold, italic, strike, False, link))
+    return spans
+
+
+def _split_table_row(line):
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_markdown(markdown_text):
+    """
+    마크다운 텍스트를 한 번 훑어 IR 블록 리스트로 변환합니다.
+    헤딩, 목록, 인용, 코드 블록, 표, 구분선을 인식하고, 나머지 연속된 줄은 하나의 문단으로 묶습니다.
+    """
+    ir_blocks = []
+    if not markdown_text or not markdown_text.strip():
+        return ir_blocks
+
+    current_paragraph_lines = []
+
+    def flush_paragraph_buffer():
+        if current_paragraph_lines:
+            paragraph_text = "\n".join(current_paragraph_lines).strip()
+            if paragraph_text:
+                ir_blocks.append(("paragraph", parse_inline(paragraph_text), None))
+            current_paragraph_lines.clear()
+
+    raw_lines = markdown_text.split('\n')
+    lines = [line.rstrip() for line in raw_lines]
+    line_count = len(lines)
+    i = 0
+    while i < line_count:
+        line = lines[i]
+
+        if line.startswith("### "):
+            flush_paragraph_buffer()
+            ir_blocks.append(("heading_3", parse_inline(line[4:]), None))
+        elif line.startswith("## "):
+            flush_paragraph_buffer()
+            ir_blocks.append(("heading_2", parse_inline(line[3:]), None))
+        elif line.startswith("# "):
+            flush_paragraph_buffer()
+            ir_blocks.append(("heading_1", parse_inline(line[2:]), None))
+        elif _DIVIDER_PATTERN.match(line.strip()):
+            flush_paragraph_buffer()
+            ir_blocks.append(("divider", None, None))
+        elif line.startswith("- ") or line.startswith("* "):
+            flush_paragraph_buffer()
+            ir_blocks.append(("bulleted_list_item", parse_inline(line[2:]), None))
+        elif line[:1].isdigit() and _NUMBERED_ITEM_PATTERN.match(line):
+            flush_paragraph_buffer()
+            content = line[_NUMBERED_ITEM_PATTERN.match(line).end():]
+            ir_blocks.append(("numbered_list_item", parse_inline(content), None))
+        elif line.startswith("> "):
+            flush_paragraph_buffer()
+            quote_lines = [line[2:]]
+            while i + 1 < line_count and lines[i+1].startswith("> "):
+                i += 1
+                quote_lines.append(lines[i][2:])
+            ir_blocks.append(("quote", parse_inline("\n".join(quote_lines)), None))
+        elif line.startswith("```"):
+            flush_paragraph_buffer()
+            language = line[3:].strip().lower() or "plaintext"
+            code_start = i + 1
+            i = code_start
+            while i < line_count and lines[i] != "```":
+                i += 1
+            # 코드 블록은 원본 줄(끝 공백 포함)을 그대로 유지합니다.
+            ir_blocks.append(("code", "\n".join(raw_lines[code_start:i]), language))
+        elif (line.lstrip().startswith("|") and i + 1 < line_count
+              and _TABLE_SEPARATOR_PATTERN.match(lines[i+1].strip())):
+            flush_paragraph_buffer()
+            table_lines = [line, lines[i+1]]
+            rows = [_split_table_row(line)]
+            i += 1
+            while i + 1 < line_count and lines[i+1].lstrip().startswith("|"):
+                i += 1
+                table_lines.append(lines[i])
+                rows.append(_split_table_row(lines[i]))
+            ir_blocks.append(("table", rows, "\n".join(table_lines)))
+        elif not line.strip():
+            flush_paragraph_buffer()
+        else:
+            current_paragraph_lines.append(line)
+        i += 1
+
+    flush_paragraph_buffer()
+    return ir_blocks
+
+
+def _is_http_link(link):
+    """http/https 절대 URL인지 확인합니다. javascript: 같은 다른 스킴의 링크는 텍스트만 남깁니다."""
+    return bool(link) and link.lower().startswith(("http://", "https://"))
+
+
+# --- Notion 렌더러 ---
+
+def _notion_rich_text(span_text, bold, italic, strike, code, link):
+    text_object = {"content": span_text}
+    # Notion은 절대 URL만 링크로 허용하므로 그 외의 링크는 텍스트만 남깁니다.
+    if _is_http_link(link):
+        text_object["link"] = {"url": link}
+    rich_text = {"type": "text", "text": text_object}
+    if bold or italic or strike or code:
+        rich_text["annotations"] = {"bold": bold, "italic": italic, "strikethrough": strike, "code": code}
+    return rich_text
+
+
+def _split_spans(spans):
+    """
+    구간 리스트를 Notion 텍스트 제한(2000자, rich_text 100개)에 맞춰 여러 블록 분량으로 나눕니다.
+    각 원소는 한 블록에 들어갈 rich_text 리스트입니다.
+    남은 문자열을 매번 잘라 복사하지 않고 시작 위치(offset)만 옮기므로 입력 길이에 비례하는 시간에 끝납니다.
+    """
+    chunks = []
+    current_chunk = []
+    current_length = 0
+    for span_text, bold, italic, strike, code, link in spans:
+        span_length = len(span_text)
+        offset = 0
+        while offset < span_length:
+            end = min(span_length, offset + NOTION_MAX_TEXT_LENGTH - current_length)
+            current_chunk.append(_notion_rich_text(span_text[offset:end], bold, italic, strike, code, link))
+            current_length += end - offset
+            offset = end
+            if current_length >= NOTION_MAX_TEXT_LENGTH or len(current_chunk) >= NOTION_MAX_RICH_TEXT_ITEMS:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_length = 0
+    if current_chunk or not chunks:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def _notion_block(block_type, rich_text, language=None):
+    block_content_data = {"rich_text": rich_text}
+    if block_type == "code":
+        block_content_data["language"] = language or "plaintext"
+    return {"object": "block", "type": block_type, block_type: block_content_data}
+
+
+def render_notion_blocks(ir_blocks):
+    """
+    IR 블록 리스트를 Notion 블록 객체 리스트로 변환합니다.
+    인라인 서식은 rich_text annotations/link로 옮기고, 각 블록 텍스트는 2000자 제한에 맞춰 분할합니다.
+    """
+    blocks = []
+    for block_type, content, extra in ir_blocks:
+        if block_type == "divider":
+            blocks.append({"object": "block", "type": "divider", "divider": {}})
+        elif block_type == "code":
+            for rich_text in _split_spans([(content, False, False, False, False, None)]):
+                blocks.append(_notion_block("code", rich_text, extra))
+        elif block_type == "table":
+            # 표는 원본 텍스트를 그대로 문단으로 남깁니다.
+            for rich_text in _split_spans([(extra, False, False, False, False, None)]):
+                blocks.append(_notion_block("paragraph", rich_text))
+        else:
+            for rich_text in _split_spans(content):
+                blocks.append(_notion_block(block_type, rich_text))
+
+    if not blocks:
+        blocks.append({
+            "object": "block", "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": "처리할 수 있는 상세 내용이 없습니다."}}]}
+        })
+    return blocks
+
+
+# --- HTML 렌더러 ---
+
+_HTML_HEADING_TAGS = {"heading_1": "h1", "heading_2": "h2", "heading_3": "h3"}
+_HTML_LIST_TAGS = {"bulleted_list_item": "ul", "numbered_list_item": "ol"}
+
+
+def _render_html_spans(spans):
+    parts = []
+    for span_text, bold, italic, strike, code, link in spans:
+        rendered = html.escape(span_text, quote=False)
+        if code:
+            rendered = f"<code>{rendered}</code>"
+        if italic:
+            rendered = f"<em>{rendered}</em>"
+        if bold:
+            rendered = f"<strong>{rendered}</strong>"
+        if strike:
+            rendered = f"<del>{rendered}</del>"
+        if _is_http_link(link):
+            rendered = f'<a href="{html.escape(link)}">{rendered}</a>'
+        parts.append(rendered)
+    return "".join(parts)
+
+
+def render_html(ir_blocks):
+    """
+    IR 블록 리스트를 Tistory 포스팅용 HTML 문자열로 변환합니다.
+    연속된 목록 항목은 하나의 <ul>/<ol>로 묶습니다.
+    """
+    parts = []
+    open_list_tag = None
+    for block_type, content, extra in ir_blocks:
+        list_tag = _HTML_LIST_TAGS.get(block_type)
+        if open_list_tag and list_tag != open_list_tag:
+            parts.append(f"</{open_list_tag}>")
+            open_list_tag = None
+        if list_tag and not open_list_tag:
+            parts.append(f"<{list_tag}>")
+            open_list_tag = list_tag
+
+        if list_tag:
+            parts.append(f"<li>{_render_html_spans(content)}</li>")
+        elif block_type in _HTML_HEADING_TAGS:
+            tag = _HTML_HEADING_TAGS[block_type]
+            parts.append(f"<{tag}>{_render_html_spans(content)}</{tag}>")
+        elif block_type == "quote":
+            parts.append(f"<blockquote><p>{_render_html_spans(content)}</p></blockquote>")
+        elif block_type == "code":
+            parts.append(f'<pre><code class="language-{html.escape(extra)}">{html.escape(content, quote=False)}</code></pre>')
+        elif block_type == "divider":
+            parts.append("<hr />")
+        elif block_type == "table":
+            header, body_rows = content[0], content[1:]
+            header_html = "".join(f"<th>{_render_html_spans(parse_inline(cell))}</th>" for cell in header)
+            body_html = "".join(
+                "<tr>" + "".join(f"<td>{_render_html_spans(parse_inline(cell))}</td>" for cell in row) + "</tr>"
+                for row in body_rows
+            )
+            parts.append(f"<table><thead><tr>{header_html}</tr></thead><tbody>{body_html}</tbody></table>")
+        else:
+            parts.append(f"<p>{_render_html_spans(content)}</p>")
+
+    if open_list_tag:
+        parts.append(f"</{open_list_tag}>")
+    return "\n".join(parts)
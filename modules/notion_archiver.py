@@ -0,0 +1,165 @@
+# modules/notion_archiver.py
+"""
+Notion 데이터베이스의 오래된 항목을 한꺼번에 보관(archive) 처리하는 모듈입니다.
+- 보관할 페이지 ID를 로컬 저장소(SQLite)에 먼저 기록(체크포인트)한 뒤,
+  제한된 수의 스레드로 동시에 보관 요청을 보냅니다.
+- 요청 속도는 notion_client의 공용 속도 제한기로 다른 Notion 작업과 함께 제한됩니다.
+- 중간에 중단되어도 다음 실행에서 남은 페이지부터 이어서 처리하며, 끝나면 결과를 한 번에 보고합니다.
+- NOTION_ARCHIVE_MAX_ATTEMPTS번 실패한 페이지는 한 번 보고한 뒤 체크포인트에 남겨 두고 더 이상 시도하지 않습니다.
+"""
+
+import datetime
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from config import NOTION_ARCHIVE_MAX_WORKERS, NOTION_ARCHIVE_MAX_ATTEMPTS
+from .local_store import ensure_schema, execute, executemany
+from .notion_client import notion_request
+from .recent_entries import remove_recent_entries
+from .utils import send_slack_message
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS notion_archive_queue (
+        database_id TEXT NOT NULL,
+        page_id TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (database_id, page_id)
+    )
+    """,
+]
+
+
+def _query_expired_page_ids(DATABASE_ID, threshold_date):
+    """기준일 이전 항목의 페이지 ID를 모두 조회합니다. 조회에 실패하면 None을 반환합니다."""
+    query_path = f"/databases/{DATABASE_ID}/query"
+    page_ids = []
+    has_more = True
+    start_cursor = None
+
+    while has_more:
+        query_payload = {
+            "filter": {
+                "property": "date",
+                "date": {"before": threshold_date.isoformat()}
+            },
+            "page_size": 100
+        }
+        if start_cursor:
+            query_payload["start_cursor"] = start_cursor
+
+        try:
+            response = notion_request("POST", query_path, json=query_payload, timeout=20)
+            response.raise_for_status()
+            data = response.json()
+
+            page_ids.extend(page["id"] for page in data.get("results", []))
+            has_more = data.get("has_more", False)
+            start_cursor = data.get("next_cursor")
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] 오래된 항목 조회 실패: {e}")
+            send_slack_message(f"[ERROR] 오래된 항목 조회 실패: {e}")
+            return None
+    return page_ids
+
+
+def _archive_page(DATABASE_ID, page_id):
+    """
+    페이지 하나를 보관 처리하고 체크포인트를 갱신합니다. 성공하면 True를 반환합니다.
+    어떤 예외도 밖으로 내보내지 않으므로 한 페이지의 오류가 다른 페이지의 결과를 잃게 하지 않습니다.
+    """
+    try:
+        patch_response = notion_request("PATCH", f"/pages/{page_id}", json={"archived": True}, timeout=10)
+        # 이미 보관된 페이지(404 등)도 다시 시도할 필요가 없으므로 완료로 처리합니다.
+        if patch_response.status_code in (200, 404):
+            execute("DELETE FROM notion_archive_queue WHERE database_id = ? AND page_id = ?",
+                    (DATABASE_ID, page_id), commit=True)
+            return True
+        print(f"   - [ERROR] 항목 보관 실패 ({page_id}): {patch_response.status_code} - {patch_response.text}")
+    except requests.exceptions.RequestException as e:
+        print(f"   - [ERROR] 항목 보관 요청 중 네트워크 오류 ({page_id}): {e}")
+    except Exception as e:
+        print(f"   - [ERROR] 항목 보관 중 오류 ({page_id}): {e}")
+
+    try:
+        execute("UPDATE notion_archive_queue SET attempts = attempts + 1, updated_at = ? WHERE database_id = ? AND page_id = ?",
+                (datetime.datetime.now().isoformat(), DATABASE_ID, page_id), commit=True)
+    except sqlite3.Error as e:
+        print(f"   - [WARN] 보관 실패 횟수 기록 실패 ({page_id}): {e}")
+    return False
+
+
+def _find_given_up_page_ids(DATABASE_ID, page_ids):
+    """이번 실행에서 처리한 페이지 중 최대 시도 횟수에 도달한 페이지 ID를 반환합니다."""
+    if not page_ids:
+        return []
+    try:
+        capped_ids = {row[0] for row in execute(
+            "SELECT page_id FROM notion_archive_queue WHERE database_id = ? AND attempts >= ?",
+            (DATABASE_ID, NOTION_ARCHIVE_MAX_ATTEMPTS))}
+    except sqlite3.Error as e:
+        print(f"[WARN] 보관 포기 항목 조회 실패: {e}")
+        return []
+    return [page_id for page_id in page_ids if page_id in capped_ids]
+
+
+def archive_old_entries(DATABASE_ID, days=90):
+    """
+    Notion 데이터베이스에서 `days`일 이상 지난 항목을 찾아 병렬로 보관 처리합니다.
+    이전 실행에서 처리하지 못한 페이지도 함께 처리하며, (보관 완료 수, 실패 수)를 반환합니다.
+    """
+    start_time = time.time()
+    threshold_date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
+    print(f"{days}일 이전 (기준일: {threshold_date.strftime('%Y-%m-%d')}) 항목 삭제(보관) 작업 시작...")
+
+    try:
+        ensure_schema("notion_archive_queue", _SCHEMA)
+        expired_page_ids = _query_expired_page_ids(DATABASE_ID, threshold_date)
+        if expired_page_ids:
+            now = datetime.datetime.now().isoformat()
+            executemany("INSERT OR IGNORE INTO notion_archive_queue (database_id, page_id, updated_at) VALUES (?, ?, ?)",
+                        [(DATABASE_ID, page_id, now) for page_id in expired_page_ids])
+        # 조회에 실패해도 이전 실행에서 기록해 둔 페이지는 처리합니다.
+        # 최대 시도 횟수에 도달한 페이지는 체크포인트에 남겨 두어 다시 추가되거나 시도되지 않게 합니다.
+        pages_to_archive = [row[0] for row in execute(
+            "SELECT page_id FROM notion_archive_queue WHERE database_id = ? AND attempts < ? ORDER BY updated_at",
+            (DATABASE_ID, NOTION_ARCHIVE_MAX_ATTEMPTS))]
+    except sqlite3.Error as e:
+        print(f"[ERROR] 보관 작업 체크포인트 처리 실패: {e}")
+        send_slack_message(f"[ERROR] 보관 작업 체크포인트 처리 실패 ({DATABASE_ID}): {e}")
+        return 0, 0
+
+    if not pages_to_archive:
+        print("삭제(보관)할 오래된 항목이 없습니다.")
+        return 0, 0
+
+    print(f"총 {len(pages_to_archive)}개의 오래된 항목을 찾았습니다. 최대 {NOTION_ARCHIVE_MAX_WORKERS}개씩 동시에 보관 처리합니다.")
+    with ThreadPoolExecutor(max_workers=max(1, NOTION_ARCHIVE_MAX_WORKERS), thread_name_prefix="notion-archive") as executor:
+        results = list(executor.map(lambda page_id: _archive_page(DATABASE_ID, page_id), pages_to_archive))
+
+    archived_count = sum(results)
+    failed_count = len(results) - archived_count
+    # 이번 실행 전에는 모두 최대 시도 횟수 미만이었으므로, 지금 도달한 페이지는 이번에 한 번만 보고됩니다.
+    failed_page_ids = [page_id for page_id, archived in zip(pages_to_archive, results) if not archived]
+    # 보관한 페이지는 Notion 조회 결과에 더 이상 나오지 않으므로 로컬 최근 항목에서도 여기서 제거합니다.
+    remove_recent_entries([page_id for page_id, archived in zip(pages_to_archive, results) if archived])
+    given_up_page_ids = _find_given_up_page_ids(DATABASE_ID, failed_page_ids)
+    duration = time.time() - start_time
+    summary = (f"오래된 항목 삭제(보관) 작업 완료 ({DATABASE_ID}): 보관 {archived_count}개, 실패 {failed_count}개 "
+               f"(소요 시간: {duration:.2f}초)")
+    print(summary)
+    if archived_count or failed_count:
+        level = "WARN" if failed_count else "INFO"
+        suffix = ""
+        if given_up_page_ids:
+            given_up_lines = "\n".join(f"- {page_id}" for page_id in given_up_page_ids)
+            suffix += (f"\n이 중 최대 시도 횟수({NOTION_ARCHIVE_MAX_ATTEMPTS}회)에 도달해 더 이상 시도하지 않는 항목 "
+                       f"(Notion에서 직접 확인해 주세요):\n{given_up_lines}")
+        if failed_count > len(given_up_page_ids):
+            suffix += "\n나머지 실패한 항목은 다음 보관 작업에서 다시 시도합니다."
+        send_slack_message(f"[{level}] {summary}{suffix}")
+    return archived_count, failed_count
@@ -0,0 +1,205 @@
+# modules/notion_block_appender.py
+"""
+페이지 생성 후 남은 Notion 블록을 100개 단위로 추가하는 모듈입니다.
+- 추가할 블록과 다음에 보낼 배치 번호를 로컬 저장소(SQLite)에 기록하므로,
+  중간에 실패해도 다음 실행에서 이미 추가된 배치를 건너뛰고 이어서 추가할 수 있습니다.
+- 긴 주간 블로그 글처럼 여러 번 나눠 추가해야 하는 본문이 반쯤 작성된 채로 남지 않도록 합니다.
+- 잘못된 블록(400 오류 등)처럼 계속 실패하는 작업은 NOTION_BLOCK_APPEND_MAX_ATTEMPTS번 시도한 뒤
+  'failed'로 표시하고 한 번만 보고한 다음 기록을 지우며, 이후 실행에서는 다시 시도하지 않습니다.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import requests
+
+from config import NOTION_BLOCK_APPEND_MAX_ATTEMPTS
+from .local_store import ensure_schema, execute
+from .notion_client import notion_request
+from .utils import send_slack_message
+
+# Notion API는 한 번에 최대 100개의 블록만 추가할 수 있습니다.
+BLOCK_APPEND_BATCH_SIZE = 100
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS notion_block_appends (
+        page_id TEXT PRIMARY KEY,
+        title TEXT,
+        blocks_json TEXT NOT NULL,
+        next_batch INTEGER NOT NULL DEFAULT 0,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL DEFAULT 'pending',
+        updated_at TEXT NOT NULL
+    )
+    """,
+]
+# attempts/status 열이 추가되기 전에 만들어진 테이블에 빠진 열
+_ADDED_COLUMNS = [
+    ("attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("status", "TEXT NOT NULL DEFAULT 'pending'"),
+]
+_columns_checked = False
+
+
+def _ensure_schema():
+    global _columns_checked
+    ensure_schema("notion_block_appends", _SCHEMA)
+    if _columns_checked:
+        return
+    existing_columns = {row[1] for row in execute("PRAGMA table_info(notion_block_appends)")}
+    for column_name, column_type in _ADDED_COLUMNS:
+        if column_name not in existing_columns:
+            execute(f"ALTER TABLE notion_block_appends ADD COLUMN {column_name} {column_type}", commit=True)
+    _columns_checked = True
+
+
+def start_block_append(page_id, title, blocks):
+    """
+    페이지에 추가할 블록 목록을 기록한 뒤 바로 추가를 진행합니다.
+    기록에 실패해도 추가는 시도하며, 모두 추가되면 True를 반환합니다.
+    """
+    try:
+        _ensure_schema()
+        execute(
+            "INSERT OR REPLACE INTO notion_block_appends (page_id, title, blocks_json, next_batch, attempts, status, updated_at) "
+            "VALUES (?, ?, ?, 0, 0, 'pending', ?)",
+            (page_id, title, json.dumps(blocks, ensure_ascii=False), datetime.now().isoformat()),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        # 기록 실패 시에는 이어쓰기만 불가능할 뿐이므로 메모리의 블록으로 바로 추가합니다.
+        print(f"[WARN] 블록 추가 작업 기록 실패 (이어쓰기 불가): {e}")
+        return _append_batches(page_id, title, blocks, 0, persist=False)
+    return _append_batches(page_id, title, blocks, 0, persist=True)
+
+
+def append_pending_blocks(page_id):
+    """
+    기록된 페이지의 남은 블록을 다음 배치부터 이어서 추가합니다.
+    모두 추가되면 기록을 지우고 True를, 도중에 실패하면 진행 위치를 남겨둔 채 False를 반환합니다.
+    """
+    try:
+        _ensure_schema()
+        rows = execute("SELECT title, blocks_json, next_batch FROM notion_block_appends "
+                       "WHERE page_id = ? AND status = 'pending'", (page_id,))
+    except sqlite3.Error as e:
+        print(f"[ERROR] 블록 추가 작업 조회 실패 ({page_id}): {e}")
+        return False
+    if not rows:
+        return True
+    title, blocks_json, next_batch = rows[0]
+    return _append_batches(page_id, title, json.loads(blocks_json), next_batch, persist=True)
+
+
+def _record_failure(page_id, title):
+    """
+    실패 횟수를 늘리고, 최대 시도 횟수에 도달하면 작업을 'failed'로 표시해 한 번만 보고합니다.
+    진행 기록이 저장소 오류로 갱신되지 않아도 페이지 생성 결과에는 영향을 주지 않습니다.
+    """
+    try:
+        execute(
+            "UPDATE notion_block_appends SET attempts = attempts + 1, updated_at = ?, "
+            "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END WHERE page_id = ?",
+            (datetime.now().isoformat(), NOTION_BLOCK_APPEND_MAX_ATTEMPTS, page_id), commit=True)
+        rows = execute("SELECT status FROM notion_block_appends WHERE page_id = ?", (page_id,))
+    except sqlite3.Error as e:
+        print(f"[WARN] 블록 추가 실패 횟수 기록 실패 ({page_id}): {e}")
+        return
+    if rows and rows[0][0] == "failed":
+        give_up_message = (f"Notion 블록 추가가 {NOTION_BLOCK_APPEND_MAX_ATTEMPTS}번 실패하여 더 이상 시도하지 않습니다 "
+                           f"({title}, {page_id}). 페이지 본문을 직접 확인해 주세요.")
+        print(f"❌ {give_up_message}")
+        send_slack_message(f"[ERROR] {give_up_message}")
+        # 보고를 마친 작업의 블록 목록은 더 쓰이지 않으므로 지웁니다. 실패하면 다음 이어쓰기 시작 시 정리됩니다.
+        _delete_failed_appends(page_id)
+
+
+def _delete_failed_appends(page_id=None):
+    """'failed'로 표시된(이미 보고한) 작업 기록을 지웁니다. page_id가 없으면 모든 'failed' 기록을 지웁니다."""
+    try:
+        if page_id is None:
+            execute("DELETE FROM notion_block_appends WHERE status = 'failed'", commit=True)
+        else:
+            execute("DELETE FROM notion_block_appends WHERE page_id = ? AND status = 'failed'", (page_id,), commit=True)
+    except sqlite3.Error as e:
+        print(f"[WARN] 실패한 블록 추가 작업 기록 삭제 실패: {e}")
+
+
+def _append_batches(page_id, title, blocks, next_batch, persist):
+    block_append_path = f"/blocks/{page_id}/children"
+    total_batches = (len(blocks) + BLOCK_APPEND_BATCH_SIZE - 1) // BLOCK_APPEND_BATCH_SIZE
+
+    for batch_index in range(next_batch, total_batches):
+        start = batch_index * BLOCK_APPEND_BATCH_SIZE
+        batch = blocks[start:start + BLOCK_APPEND_BATCH_SIZE]
+        try:
+            append_response = notion_request("PATCH", block_append_path, json={"children": batch},
+                                             timeout=20, idempotent=False)
+        except requests.exceptions.RequestException as e:
+            network_error_message = f"Notion 블록 추가 중 네트워크 에러 ({title}, {page_id}, 배치 {batch_index + 1}/{total_batches}): {e}"
+            print(f"❌ {network_error_message}")
+            send_slack_message(f"[ERROR] {network_error_message}")
+            if persist:
+                _record_failure(page_id, title)
+            return False
+
+        if append_response.status_code != 200:
+            error_message = (f"Notion 블록 추가 에러 ({title}, {page_id}, 배치 {batch_index + 1}/{total_batches}): "
+                             f"{append_response.status_code} - {append_response.text}")
+            print(f"❌ {error_message}")
+            send_slack_message(f"[ERROR] {error_message}")
+            if persist:
+                _record_failure(page_id, title)
+            return False
+
+        print(f"  - {min(start + len(batch), len(blocks))}/{len(blocks)} 블록 추가 완료.")
+        if persist:
+            # 다음 시도가 이미 추가된 배치를 다시 보내지 않도록 진행 위치를 바로 기록합니다.
+            try:
+                execute("UPDATE notion_block_appends SET next_batch = ?, updated_at = ? WHERE page_id = ?",
+                        (batch_index + 1, datetime.now().isoformat(), page_id), commit=True)
+            except sqlite3.Error as e:
+                # 블록은 이미 추가되었으므로 실패로 보고하지 않고 계속 진행합니다. 끝까지 추가되면 아래에서 기록을 지웁니다.
+                print(f"[WARN] 블록 추가 진행 위치 기록 실패 ({page_id}, 배치 {batch_index + 1}/{total_batches}): {e}")
+
+    if persist:
+        try:
+            execute("DELETE FROM notion_block_appends WHERE page_id = ?", (page_id,), commit=True)
+        except sqlite3.Error as e:
+            # 기록이 남으면 다음 이어쓰기에서 일부 블록이 다시 추가될 수 있으므로 알립니다.
+            warning_message = f"완료된 블록 추가 작업 기록 삭제 실패 ({title}, {page_id}): {e}"
+            print(f"[WARN] {warning_message}")
+            send_slack_message(f"[WARN] {warning_message}")
+    return True
+
+
+def resume_pending_block_appends():
+    """
+    이전 실행에서 끝나지 않은 블록 추가 작업을 모두 이어서 진행합니다. 실행 시작 시 호출합니다.
+    (완료된 페이지 수, 남은 페이지 수)를 반환합니다.
+    """
+    try:
+        _ensure_schema()
+        _delete_failed_appends()
+        page_ids = [row[0] for row in execute(
+            "SELECT page_id FROM notion_block_appends WHERE status = 'pending' ORDER BY updated_at")]
+    except sqlite3.Error as e:
+        print(f"[ERROR] 미완료 블록 추가 작업 조회 실패: {e}")
+        return 0, 0
+
+    if not page_ids:
+        return 0, 0
+
+    print(f"이전 실행에서 끝나지 않은 블록 추가 작업 {len(page_ids)}개를 이어서 진행합니다...")
+    completed_count = sum(1 for page_id in page_ids if append_pending_blocks(page_id))
+    # 최대 시도 횟수에 도달해 'failed'로 바뀐 작업은 이미 따로 보고했으므로 남은 작업에서 뺍니다.
+    try:
+        remaining_count = execute("SELECT COUNT(*) FROM notion_block_appends WHERE status = 'pending'")[0][0]
+    except sqlite3.Error:
+        remaining_count = len(page_ids) - completed_count
+    print(f"미완료 블록 추가 작업 이어쓰기 완료: 완료 {completed_count}개, 남음 {remaining_count}개")
+    if remaining_count:
+        send_slack_message(f"[WARN] Notion 블록 추가 이어쓰기 후에도 {remaining_count}개 페이지가 미완료 상태입니다.")
+    return completed_count, remaining_count
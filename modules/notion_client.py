@@ -0,0 +1,93 @@
+# modules/notion_client.py
+"""
+모든 Notion API 호출이 공유하는 요청 모듈입니다.
+- 공통 헤더와 기본 URL을 한 곳에서 관리합니다.
+- 여러 스레드에서 동시에 호출해도 전체 요청 속도가 Notion 제한(초당 약 3회)을 넘지 않도록 합니다.
+- 429(속도 제한)와 일시적 오류는 Retry-After 헤더 또는 지터(jitter)를 둔 지수 백오프로 기다린 뒤 재시도합니다.
+"""
+
+import random
+import threading
+import time
+
+import requests
+
+from config import (NOTION_API_TOKEN, NOTION_REQUESTS_PER_SECOND, NOTION_MAX_RETRIES,
+                    NOTION_BACKOFF_BASE_SECONDS, NOTION_BACKOFF_MAX_SECONDS)
+from .http_client import get_session
+from .rate_limiter import TokenBucket
+
+NOTION_API_BASE_URL = "https://api.notion.com/v1"
+NOTION_API_VERSION = "2022-06-28"
+
+# 재시도할 응답 코드. 멱등하지 않은 요청(페이지 생성, 블록 추가)은 요청이 처리되지 않은 것이 확실한 코드만 재시도합니다.
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_NON_IDEMPOTENT_RETRY_STATUS_CODES = {429, 503}
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def notion_headers():
+    """Notion API 요청 공통 헤더를 반환합니다."""
+    return {
+        "Authorization": f"Bearer {NOTION_API_TOKEN}",
+        "Content-Type": "application/json",
+        "Notion-Version": NOTION_API_VERSION
+    }
+
+
+def _get_rate_limiter():
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            # 순간적으로 몰리는 요청도 초당 제한을 넘지 않도록 버킷 용량을 1초 분량으로 둡니다.
+            _rate_limiter = TokenBucket(capacity=NOTION_REQUESTS_PER_SECOND, refill_rate=NOTION_REQUESTS_PER_SECOND)
+        return _rate_limiter
+
+
+def _retry_wait_seconds(response, attempt):
+    """Retry-After 헤더가 있으면 그 값을, 없으면 지터를 둔 지수 백오프 대기 시간을 반환합니다."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+    backoff = min(NOTION_BACKOFF_MAX_SECONDS, NOTION_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+    # 여러 작성 스레드가 같은 시각에 다시 몰리지 않도록 대기 시간을 절반~전체 범위에서 무작위로 정합니다.
+    return random.uniform(backoff / 2, backoff)
+
+
+def notion_request(method, path, json=None, timeout=30, idempotent=True):
+    """
+    Notion API에 요청을 보내고 Response를 반환합니다. path는 "/pages"처럼 기본 URL 뒤의 경로입니다.
+    공용 속도 제한기에서 토큰을 얻은 뒤 요청하며, 429와 일시적 오류는 최대 NOTION_MAX_RETRIES번 재시도합니다.
+    idempotent=False인 요청(페이지 생성, 블록 추가)은 중복 생성을 막기 위해 처리되지 않은 것이 확실한 경우
+    (429/503 응답, 연결 실패)에만 재시도합니다.
+    재시도 후에도 실패하면 마지막 응답을 반환하고, 네트워크 오류는 requests 예외로 전달됩니다.
+    """
+    retry_status_codes = _RETRY_STATUS_CODES if idempotent else _NON_IDEMPOTENT_RETRY_STATUS_CODES
+    retryable_exceptions = ((requests.exceptions.ConnectionError, requests.exceptions.Timeout) if idempotent
+                            else (requests.exceptions.ConnectTimeout,))
+    url = f"{NOTION_API_BASE_URL}{path}"
+
+    for attempt in range(1, NOTION_MAX_RETRIES + 2):
+        is_last_attempt = attempt > NOTION_MAX_RETRIES
+        _get_rate_limiter().acquire()
+        try:
+            response = get_session().request(method, url, headers=notion_headers(), json=json, timeout=timeout)
+        except retryable_exceptions as e:
+            if is_last_attempt:
+                raise
+            wait_seconds = _retry_wait_seconds(None, attempt)
+            print(f"Notion API 네트워크 오류 ({method} {path}): {e}. {wait_seconds:.1f}초 후 재시도 ({attempt}/{NOTION_MAX_RETRIES})")
+            time.sleep(wait_seconds)
+            continue
+
+        if response.status_code not in retry_status_codes or is_last_attempt:
+            return response
+        wait_seconds = _retry_wait_seconds(response, attempt)
+        print(f"Notion API 응답 {response.status_code} ({method} {path}). {wait_seconds:.1f}초 후 재시도 ({attempt}/{NOTION_MAX_RETRIES})")
+        time.sleep(wait_seconds)
@@ -0,0 +1,81 @@
+# modules/notion_writer.py
+"""
+Notion 페이지 생성을 비동기로 처리하는 작성 큐 모듈입니다.
+- 크롤러는 enqueue_notion_page()로 페이지 생성을 맡기고 바로 다음 항목을 처리합니다.
+- 작성 스레드 여러 개가 페이지 생성과 블록 추가를 동시에 진행하며,
+  전체 요청 속도는 notion_client의 공용 속도 제한기로 Notion 제한 안에 유지됩니다.
+- 실행이 끝날 때 flush_notion_writes()로 모든 작성이 끝나기를 기다리고 페이지별 결과를 보고합니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import NOTION_WRITER_MAX_WORKERS
+from .utils import send_slack_message
+from .notion_handler import create_notion_page, mark_url_pending, clear_url_pending
+
+_writer_lock = threading.Lock()
+_executor = None
+_pending_writes = []
+
+
+def _get_executor():
+    global _executor
+    with _writer_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(1, NOTION_WRITER_MAX_WORKERS), thread_name_prefix="notion")
+        return _executor
+
+
+def _write_page(title, content, url, date, category_, details, DATABASE_ID):
+    try:
+        return create_notion_page(title, content, url, date, category_, details, DATABASE_ID)
+    finally:
+        clear_url_pending(url, DATABASE_ID)
+
+
+def enqueue_notion_page(title, content, url, date, category_, details, DATABASE_ID):
+    """
+    create_notion_page와 같은 인자로 페이지 생성을 작성 큐에 넣고 바로 반환합니다.
+    작성이 끝나기 전에도 Duplicate_check가 이 URL을 중복으로 판단하도록 작성 대기 목록에 기록합니다.
+    작성 결과(create_notion_page의 반환값)를 담을 Future를 반환합니다.
+    """
+    mark_url_pending(url, DATABASE_ID)
+    future = _get_executor().submit(_write_page, title, content, url, date, category_, details, DATABASE_ID)
+    with _writer_lock:
+        _pending_writes.append((title, url, future))
+    return future
+
+
+def flush_notion_writes():
+    """
+    큐에 들어간 모든 페이지 작성이 끝날 때까지 기다린 뒤 페이지별 결과를 출력하고,
+    실패한 페이지가 있으면 Slack으로 알립니다. (제목, URL, 결과) 리스트를 반환하며,
+    결과는 "성공", "실패", "건너뜀" 중 하나입니다.
+    """
+    with _writer_lock:
+        writes = list(_pending_writes)
+        _pending_writes.clear()
+
+    if not writes:
+        return []
+
+    print(f"--- Notion 작성 큐 대기 중인 {len(writes)}개 페이지 완료 대기 ---")
+    results = []
+    for title, url, future in writes:
+        try:
+            created = future.result()
+        except Exception as e:
+            print(f"  [ERROR] Notion 페이지 작성 중 오류 발생: {title} - {e}")
+            created = False
+        status = "성공" if created else ("건너뜀" if created is None else "실패")
+        print(f"  [{status}] {title} ({url})")
+        results.append((title, url, status))
+
+    failed = [(title, url) for title, url, status in results if status == "실패"]
+    succeeded_count = sum(1 for _, _, status in results if status == "성공")
+    print(f"--- Notion 작성 완료: 성공 {succeeded_count}개, 실패 {len(failed)}개, 건너뜀 {len(results) - succeeded_count - len(failed)}개 ---")
+    if failed:
+        failed_lines = "\n".join(f"- {title} ({url})" for title, url in failed)
+        send_slack_message(f"[WARN] Notion 페이지 작성 실패 {len(failed)}/{len(results)}개:\n{failed_lines}")
+    return results
@@ -0,0 +1,98 @@
+# modules/nvd_client.py
+"""
+NVD CVE API v2.0 클라이언트 모듈입니다.
+- totalResults / startIndex를 사용해 모든 페이지를 가져오므로 결과가 잘리지 않습니다.
+- 첫 페이지 이후의 페이지는 NVD 속도 제한 안에서 병렬로 요청합니다.
+- 취약점을 제너레이터로 하나씩 넘겨주며, 동시에 메모리에 올라가는 페이지 수를 제한합니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from config import NVD_API_KEY, NVD_RESULTS_PER_PAGE, NVD_MAX_CONCURRENCY
+from .http_client import get_session
+from .rate_limiter import TokenBucket
+
+NVD_CVE_API_URL = 'https://services.nvd.nist.gov/rest/json/cves/2.0'
+
+# NVD 공개 속도 제한: API 키가 없으면 30초에 5회, 있으면 30초에 50회
+_RATE_LIMIT_WINDOW_SECONDS = 30
+_RATE_LIMIT_WITHOUT_KEY = 5
+_RATE_LIMIT_WITH_KEY = 50
+
+# 속도 제한 초과(403/429) 또는 일시적 서버 오류 시 재시도 설정
+_RETRY_STATUS_CODES = {403, 429, 500, 502, 503, 504}
+_MAX_ATTEMPTS = 4
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def _get_rate_limiter():
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            limit = _RATE_LIMIT_WITH_KEY if NVD_API_KEY else _RATE_LIMIT_WITHOUT_KEY
+            _rate_limiter = TokenBucket(capacity=limit, refill_rate=limit / _RATE_LIMIT_WINDOW_SECONDS)
+        return _rate_limiter
+
+
+def fetch_nvd_page(params, start_index, results_per_page, timeout=30):
+    """
+    NVD API에서 한 페이지를 가져와 JSON(dict)으로 반환합니다.
+    속도 제한 초과나 일시적 오류는 잠시 기다린 뒤 재시도하며, 최종 실패 시 requests 예외를 발생시킵니다.
+    """
+    page_params = dict(params, startIndex=start_index, resultsPerPage=results_per_page)
+    headers = {"apiKey": NVD_API_KEY} if NVD_API_KEY else {}
+
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        _get_rate_limiter().acquire()
+        try:
+            response = get_session().get(NVD_CVE_API_URL, params=page_params, headers=headers, timeout=timeout)
+            if response.status_code in _RETRY_STATUS_CODES and attempt < _MAX_ATTEMPTS:
+                wait_seconds = _RATE_LIMIT_WINDOW_SECONDS / 5 * attempt
+                print(f"NVD API 응답 {response.status_code} (startIndex={start_index}). {wait_seconds:.0f}초 후 재시도 ({attempt}/{_MAX_ATTEMPTS})")
+                time.sleep(wait_seconds)
+                continue
+            response.raise_for_status()
+            return response.json()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt == _MAX_ATTEMPTS:
+                raise
+            wait_seconds = _RATE_LIMIT_WINDOW_SECONDS / 5 * attempt
+            print(f"NVD API 네트워크 오류 (startIndex={start_index}): {e}. {wait_seconds:.0f}초 후 재시도 ({attempt}/{_MAX_ATTEMPTS})")
+            time.sleep(wait_seconds)
+
+
+def iter_nvd_vulnerabilities(params, results_per_page=None):
+    """
+    주어진 검색 조건(pubStartDate 등)에 해당하는 모든 취약점 항목({'cve': {...}})을 순서대로 반환하는 제너레이터입니다.
+    첫 페이지의 totalResults로 전체 페이지 수를 계산하고, 나머지 페이지는 병렬로 미리 요청합니다.
+    미리 요청하는 페이지 수는 NVD_MAX_CONCURRENCY로 제한되어 메모리 사용량이 일정하게 유지됩니다.
+    """
+    results_per_page = results_per_page or NVD_RESULTS_PER_PAGE
+    first_page = fetch_nvd_page(params, 0, results_per_page)
+    total_results = first_page.get("totalResults", 0)
+    print(f"NVD API 검색 결과: 총 {total_results}개 (페이지당 {results_per_page}개)")
+
+    yield from first_page.get("vulnerabilities", [])
+    del first_page
+
+    start_indexes = list(range(results_per_page, total_results, results_per_page))
+    if not start_indexes:
+        return
+
+    max_workers = max(1, NVD_MAX_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nvd") as executor:
+        pending = []
+        next_position = 0
+        while next_position < len(start_indexes) or pending:
+            # 진행 중인 요청이 max_workers개가 되도록 다음 페이지를 미리 요청합니다.
+            while next_position < len(start_indexes) and len(pending) < max_workers:
+                pending.append(executor.submit(fetch_nvd_page, params, start_indexes[next_position], results_per_page))
+                next_position += 1
+            page = pending.pop(0).result()
+            yield from page.get("vulnerabilities", [])
@@ -0,0 +1,47 @@
+# modules/rate_limiter.py
+"""
+여러 스레드가 공유하는 토큰 버킷(token bucket) 방식의 속도 제한 모듈입니다.
+- Gemini 모델별 분당 요청 수(RPM)/토큰 수(TPM) 제한 등에 사용합니다.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    capacity만큼 토큰을 담을 수 있고, 초당 refill_rate개씩 다시 채워지는 버킷입니다.
+    acquire()는 필요한 토큰이 모일 때까지 호출한 스레드를 대기시킵니다.
+    """
+
+    def __init__(self, capacity, refill_rate):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, limit):
+        """분당 limit개를 허용하는 버킷을 만듭니다."""
+        return cls(capacity=limit, refill_rate=limit / 60.0)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate)
+        self._updated_at = now
+
+    def acquire(self, amount=1):
+        """
+        amount개의 토큰을 사용합니다. 토큰이 부족하면 채워질 때까지 대기합니다.
+        버킷 용량보다 큰 요청은 용량만큼으로 간주합니다.
+        """
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait_seconds = (amount - self._tokens) / self.refill_rate
+            time.sleep(wait_seconds)
@@ -0,0 +1,164 @@
+# modules/recent_entries.py
+"""
+Notion 데이터베이스의 최근 항목을 로컬 저장소(SQLite)에 유지하는 롤링 윈도우 모듈입니다.
+- 페이지를 생성할 때 제목, URL, 요약, 날짜를 바로 기록합니다.
+- 다른 경로(Notion에서 직접 수정 등)로 바뀐 항목은 매시간 작업에서 last_edited_time 필터로 변경분만 조회해 반영합니다.
+- 보관(삭제)된 페이지는 쿼리 결과에 나오지 않으므로, 보관 작업(notion_archiver)이 보관한 페이지를 remove_recent_entries()로 제거합니다.
+- 주간 작업은 데이터베이스 전체를 다시 조회하지 않고 로컬에서 최근 항목을 읽습니다.
+"""
+
+import datetime
+import sqlite3
+
+import requests
+
+from .local_store import ensure_schema, execute, executemany
+from .notion_client import notion_request
+from .utils import send_slack_message
+
+# 로컬에 보관하는 기간(일). 주간 작업(7일)보다 여유 있게 유지하고 이보다 오래된 항목은 정리합니다.
+RECENT_ENTRIES_RETENTION_DAYS = 14
+# Notion의 last_edited_time은 분 단위로 내림되므로, 변경분 조회 기준 시각을 이만큼(분) 앞당겨 기록합니다.
+RECENT_ENTRIES_SYNC_MARGIN_MINUTES = 2
+# 처음 동기화할 때 날짜 기준으로 불러오는 기간(일). 주간 작업이 읽는 기간(7일)과 같습니다.
+RECENT_ENTRIES_INITIAL_DAYS = 7
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS recent_entries (
+        page_id TEXT PRIMARY KEY,
+        database_id TEXT NOT NULL,
+        title TEXT,
+        url TEXT,
+        summary TEXT,
+        date TEXT,
+        last_edited_time TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_recent_entries_db_date ON recent_entries (database_id, date)",
+    """
+    CREATE TABLE IF NOT EXISTS recent_entries_sync (
+        database_id TEXT PRIMARY KEY,
+        last_reconciled_at TEXT NOT NULL
+    )
+    """,
+]
+
+
+def record_recent_entry(DATABASE_ID, page_id, title, url, summary, date):
+    """새로 생성한 페이지를 로컬 최근 항목에 기록합니다. 기록 실패는 다음 변경분 조회에서 보완되므로 무시합니다."""
+    try:
+        ensure_schema("recent_entries", _SCHEMA)
+        execute(
+            "INSERT OR REPLACE INTO recent_entries (page_id, database_id, title, url, summary, date, last_edited_time) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (page_id, DATABASE_ID, title, url, summary, date,
+             datetime.datetime.now(datetime.timezone.utc).isoformat()),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        print(f"[WARN] 최근 항목 로컬 기록 실패: {e}")
+
+
+def _entry_from_page(DATABASE_ID, page):
+    properties = page.get("properties", {})
+    title_prop = properties.get("title", {}).get("title", [])
+    content_prop = properties.get("content", {})
+    date_prop = properties.get("date", {}).get("date") or {}
+    return (
+        page["id"],
+        DATABASE_ID,
+        title_prop[0].get("plain_text") if title_prop else "제목 없음",
+        properties.get("url", {}).get("url") or "URL 없음",
+        "".join(t.get("plain_text", "") for t in content_prop.get("rich_text", [])),
+        (date_prop.get("start") or "")[:10],
+        page.get("last_edited_time"),
+    )
+
+
+def reconcile_recent_entries(DATABASE_ID, days=RECENT_ENTRIES_RETENTION_DAYS):
+    """
+    마지막 동기화 이후 Notion에서 수정된 페이지만 조회해 로컬 최근 항목에 반영합니다.
+    처음 실행할 때는 최근 RECENT_ENTRIES_INITIAL_DAYS일 항목을 날짜 기준으로 한 번 모두 불러옵니다.
+    `days`일보다 오래된 로컬 항목은 정리하며, 성공하면 True를 반환합니다.
+    """
+    ensure_schema("recent_entries", _SCHEMA)
+    query_path = f"/databases/{DATABASE_ID}/query"
+    reconcile_started_at = datetime.datetime.now(datetime.timezone.utc)
+    rows = execute("SELECT last_reconciled_at FROM recent_entries_sync WHERE database_id = ?", (DATABASE_ID,))
+
+    if rows:
+        query_filter = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": rows[0][0]}}
+        print(f"Notion DB (ID: {DATABASE_ID}) 최근 항목 변경분 조회 ({rows[0][0]} 이후 수정분)...")
+    else:
+        threshold_date = reconcile_started_at - datetime.timedelta(days=RECENT_ENTRIES_INITIAL_DAYS)
+        query_filter = {"property": "date", "date": {"on_or_after": threshold_date.isoformat()}}
+        print(f"Notion DB (ID: {DATABASE_ID}) 최근 {RECENT_ENTRIES_INITIAL_DAYS}일 항목 초기 조회...")
+
+    upserts = []
+    removed_page_ids = []
+    has_more = True
+    start_cursor = None
+    while has_more:
+        query_payload = {"filter": query_filter, "page_size": 100}
+        if start_cursor:
+            query_payload["start_cursor"] = start_cursor
+        try:
+            response = notion_request("POST", query_path, json=query_payload, timeout=20)
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] Notion 최근 항목 변경분 조회 실패: {e}")
+            send_slack_message(f"[ERROR] Notion 최근 항목 변경분 조회 실패: {e}")
+            return False
+
+        for page in data.get("results", []):
+            if page.get("archived") or page.get("in_trash"):
+                removed_page_ids.append((page["id"],))
+            else:
+                upserts.append(_entry_from_page(DATABASE_ID, page))
+        has_more = data.get("has_more", False)
+        start_cursor = data.get("next_cursor")
+
+    if upserts:
+        executemany("INSERT OR REPLACE INTO recent_entries VALUES (?, ?, ?, ?, ?, ?, ?)", upserts)
+    if removed_page_ids:
+        executemany("DELETE FROM recent_entries WHERE page_id = ?", removed_page_ids)
+    retention_date = (reconcile_started_at - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
+    execute("DELETE FROM recent_entries WHERE database_id = ? AND date < ?", (DATABASE_ID, retention_date), commit=True)
+    # 조회 도중 수정된 항목과 분 단위로 내림된 last_edited_time을 놓치지 않도록
+    # 조회를 시작한 시각보다 RECENT_ENTRIES_SYNC_MARGIN_MINUTES만큼 이른 시각을 기록합니다.
+    sync_point = reconcile_started_at - datetime.timedelta(minutes=RECENT_ENTRIES_SYNC_MARGIN_MINUTES)
+    execute("INSERT OR REPLACE INTO recent_entries_sync (database_id, last_reconciled_at) VALUES (?, ?)",
+            (DATABASE_ID, sync_point.isoformat()), commit=True)
+    print(f"최근 항목 변경분 반영 완료: 갱신 {len(upserts)}개, 제거 {len(removed_page_ids)}개")
+    return True
+
+
+def remove_recent_entries(page_ids):
+    """보관(삭제)한 페이지를 로컬 최근 항목에서 제거합니다. 제거 실패는 주간 작업에만 영향을 주므로 경고만 출력합니다."""
+    if not page_ids:
+        return
+    try:
+        ensure_schema("recent_entries", _SCHEMA)
+        executemany("DELETE FROM recent_entries WHERE page_id = ?", [(page_id,) for page_id in page_ids])
+    except sqlite3.Error as e:
+        print(f"[WARN] 보관한 항목의 로컬 최근 항목 제거 실패: {e}")
+
+
+def load_recent_entries(DATABASE_ID, days=RECENT_ENTRIES_INITIAL_DAYS):
+    """
+    로컬 최근 항목에서 최근 `days`일 항목을 날짜 내림차순으로 (제목, URL, 요약) 리스트로 반환합니다.
+    """
+    ensure_schema("recent_entries", _SCHEMA)
+    threshold_date = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
+    return execute(
+        "SELECT title, url, summary FROM recent_entries WHERE database_id = ? AND date >= ? ORDER BY date DESC",
+        (DATABASE_ID, threshold_date),
+    )
+
+
+def has_reconciled(DATABASE_ID):
+    """이 데이터베이스의 최근 항목을 한 번이라도 Notion과 동기화했는지 여부를 반환합니다."""
+    ensure_schema("recent_entries", _SCHEMA)
+    return bool(execute("SELECT 1 FROM recent_entries_sync WHERE database_id = ?", (DATABASE_ID,)))
@@ -0,0 +1,46 @@
+# modules/rss_parser.py
+"""
+RSS 피드를 스트리밍 방식으로 파싱하는 모듈입니다.
+- ET.iterparse로 <item>을 하나씩 만들어 바로 넘겨주므로 전체 트리를 메모리에 만들지 않습니다.
+- 호출 측에서 반복을 중단하면 이후 본문은 파싱하지 않습니다.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+DC_DATE_TAG = '{http://purl.org/dc/elements/1.1/}date'
+
+
+def _text(element, tag):
+    child = element.find(tag)
+    if child is None or child.text is None:
+        return ''
+    return child.text.strip()
+
+
+def iter_rss_items(xml_bytes):
+    """
+    RSS 본문(bytes)에서 <item>을 순서대로 하나씩 파싱하여 딕셔너리로 반환하는 제너레이터입니다.
+    각 항목은 title, link, description, pubDate, dc_date 키를 가집니다 (값이 없으면 빈 문자열).
+    XML 오류는 해당 위치까지 읽었을 때 ET.ParseError로 발생합니다.
+    """
+    channel = None
+    for event, element in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+        if event == "start":
+            if channel is None and element.tag == "channel":
+                channel = element
+            continue
+        if element.tag != "item":
+            continue
+
+        yield {
+            "title": _text(element, 'title'),
+            "link": _text(element, 'link'),
+            "description": _text(element, 'description'),
+            "pubDate": _text(element, 'pubDate'),
+            "dc_date": _text(element, DC_DATE_TAG),
+        }
+        # 이미 처리한 항목은 트리에서 떼어내 메모리 사용량을 일정하게 유지합니다.
+        element.clear()
+        if channel is not None and len(channel) and channel[-1] is element:
+            channel.remove(element)
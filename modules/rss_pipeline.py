@@ -0,0 +1,186 @@
+# modules/rss_pipeline.py
+"""
+sources.py에 선언된 RSS 소스를 공통 단계로 처리하는 파이프라인 엔진입니다.
+fetch → parse → filter → dedupe → enrich → publish 순서로 실행되며,
+parse/filter/dedupe 단계는 제너레이터로 연결되어 항목을 하나씩 흘려보냅니다.
+"""
+
+import threading
+import xml.etree.ElementTree as ET
+
+import requests
+
+from config import RSS_STOP_AFTER_KNOWN_ITEMS
+from .utils import date_re, send_slack_message
+from .feed_cache import fetch_feed, remember_feed
+from .feed_encoding import prepare_feed_bytes
+from .rss_parser import iter_rss_items
+from .notion_handler import Duplicate_check, is_url_added_this_run
+from .notion_writer import enqueue_notion_page
+from .gemini_handler import summarize_text, details_text, summarize_and_detail_text, run_gemini_tasks
+
+
+def fetch_stage(source, feed):
+    """피드를 조건부 요청으로 가져옵니다. 이전 실행 이후 변경이 없으면 None을 반환합니다."""
+    return fetch_feed(feed["url"], timeout=15, **source.get("request_options", {}))
+
+
+def parse_stage(source, feed, response):
+    """응답 본문에서 항목을 스트리밍으로 파싱하고, 소스 정의에 따라 필드를 정규화합니다."""
+    for item in iter_rss_items(prepare_feed_bytes(feed["url"], response.content)):
+        pub_date_str = next((item[field] for field in source["date_fields"] if item.get(field)), '')
+        yield {
+            "title": item['title'] or '제목 없음',
+            "link": item['link'],
+            "description": item['description'] or '내용 없음',
+            "pub_date_str": pub_date_str,
+        }
+
+
+def filter_stage(source, feed, items):
+    """URL·날짜가 없는 항목과 피드별 필터를 통과하지 못한 항목을 제외하고 게시일을 채웁니다."""
+    source_name = source["name"]
+    title_must_contain = feed.get("title_must_contain")
+    for item in items:
+        if not item["link"]:
+            print(f"  [{source_name}-SKIP] URL 없는 항목: {item['title']}")
+            continue
+
+        posting_date = date_re(item["pub_date_str"])
+        if not posting_date:
+            print(f"  [{source_name}-SKIP] 날짜 변환 실패 항목: {item['title']} (원본 날짜: '{item['pub_date_str']}')")
+            continue
+
+        if title_must_contain and title_must_contain not in item["title"]:
+            continue
+
+        item["posting_date"] = posting_date
+        yield item
+
+
+def dedupe_stage(source, items):
+    """
+    이미 발행된 항목을 제외합니다.
+    stop_on_known 정책이 켜져 있으면 이전 실행에서 발행된 항목을 RSS_STOP_AFTER_KNOWN_ITEMS개 연속으로 만난 시점에서
+    파싱을 중단합니다. 중간에 새 항목(이전 실행에서 실패한 항목 포함)이 있으면 개수를 다시 셉니다.
+    """
+    source_name = source["name"]
+    known_streak = 0
+    for item in items:
+        duplicate_status = Duplicate_check(item["link"], source["database_id"])
+        if duplicate_status == 0:
+            known_streak = 0
+            yield item
+        elif duplicate_status == 1:
+            print(f"  [{source_name}-SKIP] 중복된 항목: {item['title']}")
+            # 이번 실행에서 다른 피드가 발행한 항목은 이 피드가 어디까지 처리했는지 알려 주지 않으므로 세지 않습니다.
+            if source.get("stop_on_known") and not is_url_added_this_run(item["link"], source["database_id"]):
+                known_streak += 1
+                if known_streak >= RSS_STOP_AFTER_KNOWN_ITEMS:
+                    # 피드는 최신순이므로 이후 항목은 모두 이미 처리된 항목입니다.
+                    print(f"  [{source_name}-INFO] 이미 발행된 항목을 {known_streak}개 연속으로 만나 나머지 항목을 건너뜁니다.")
+                    return
+        else:
+            known_streak = 0
+            print(f"  [{source_name}-SKIP] 중복 확인 중 오류 발생 항목: {item['title']}")
+
+
+def enrich_stage(source, items):
+    """
+    새 항목마다 Gemini로 요약과 상세 분석을 생성합니다.
+    모든 항목의 요청을 Gemini 작업자 풀에 한 번에 제출하여 병렬로 처리합니다.
+    combined_enrichment가 켜진 소스는 한 번의 호출로 둘을 함께 생성합니다.
+    """
+    source_name = source["name"]
+    for item in items:
+        print(f"  [{source_name}-PROCESSING] 새 항목: {item['title']}")
+
+    if source.get("combined_enrichment"):
+        results = run_gemini_tasks([(summarize_and_detail_text, (item["description"],)) for item in items])
+        for item, (summary, details) in zip(items, results):
+            item["summary"], item["details"] = summary, details
+    else:
+        calls = []
+        for item in items:
+            calls.append((summarize_text, (item["description"],)))
+            calls.append((details_text, (item["description"],)))
+        results = run_gemini_tasks(calls)
+        for index, item in enumerate(items):
+            item["summary"], item["details"] = results[2 * index], results[2 * index + 1]
+
+    for item in items:
+        if "실패" in item["summary"] or "실패" in item["details"]:
+            send_slack_message(f"[WARN] {source_name} '{item['title']}' 처리 중 Gemini API 실패. "
+                               f"요약: {item['summary']}, 상세: {item['details']}")
+    return items
+
+
+def publish_stage(source, items):
+    """
+    가공된 항목을 Notion 작성 큐에 넣습니다. 실제 생성은 flush_notion_writes() 전까지 백그라운드에서 진행됩니다.
+    항목별 작성 결과 Future 리스트를 반환합니다.
+    """
+    return [
+        enqueue_notion_page(item["title"], item["summary"], item["link"], item["posting_date"],
+                            source["category"], item["details"], source["database_id"])
+        for item in items
+    ]
+
+
+def _remember_feed_after_writes(source_name, rss_url, response, write_futures):
+    """
+    이 피드에서 큐에 넣은 Notion 작성이 모두 성공한 뒤에만 피드 검증자를 저장합니다.
+    하나라도 실패하면 저장하지 않으므로, 다음 실행에서 304나 같은 본문 해시로 건너뛰지 않고 실패한 항목을 다시 처리합니다.
+    """
+    if not write_futures:
+        remember_feed(rss_url, response)
+        return
+
+    remaining = [len(write_futures)]
+    remaining_lock = threading.Lock()
+
+    def on_write_done(_future):
+        with remaining_lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        # create_notion_page는 실패 시 False, 중복으로 건너뛰면 None을 반환합니다.
+        if all(future.exception() is None and future.result() is not False for future in write_futures):
+            remember_feed(rss_url, response)
+        else:
+            print(f"  [{source_name}-WARN] RSS ({rss_url}) 항목 작성에 실패하여 다음 실행에서 피드를 다시 처리합니다.")
+
+    for future in write_futures:
+        future.add_done_callback(on_write_done)
+
+
+def run_rss_source(source):
+    """
+    하나의 RSS 소스에 정의된 모든 피드를 파이프라인 단계에 따라 처리합니다.
+    피드 단위 오류는 알림 후 다음 피드로 넘어갑니다.
+    """
+    source_name = source["name"]
+    try:
+        print(f"--- {source_name} 크롤링 시작 ---")
+        for feed in source["feeds"]:
+            rss_url = feed["url"]
+            print(f"  - {rss_url} 처리 중...")
+            try:
+                response = fetch_stage(source, feed)
+                if response is None:
+                    print(f"  [{source_name}-SKIP] RSS ({rss_url})가 이전 실행 이후 변경되지 않았습니다.")
+                    continue
+
+                new_items = list(dedupe_stage(source, filter_stage(source, feed, parse_stage(source, feed, response))))
+                write_futures = publish_stage(source, enrich_stage(source, new_items)) if new_items else []
+
+                _remember_feed_after_writes(source_name, rss_url, response, write_futures)
+            except requests.exceptions.RequestException as e:
+                print(f"  [{source_name}-ERROR] RSS ({rss_url}) 요청 실패: {e}")
+                send_slack_message(f"[ERROR] {source_name} RSS ({rss_url}) 요청 실패: {e}")
+            except ET.ParseError as e:
+                print(f"  [{source_name}-ERROR] RSS ({rss_url}) XML 파싱 실패: {e}")
+                send_slack_message(f"[ERROR] {source_name} RSS ({rss_url}) XML 파싱 실패: {e}")
+    except Exception as e:
+        print(f"{source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
+        send_slack_message(f"[ERROR] {source_name} 크롤링 중 알 수 없는 오류 발생: {e}")
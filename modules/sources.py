@@ -0,0 +1,70 @@
+# modules/sources.py
+"""
+RSS 크롤링 대상 소스를 선언적으로 정의하는 레지스트리 모듈입니다.
+새 RSS 소스를 추가할 때는 이 파일에 항목만 추가하면 rss_pipeline이 동일한 단계로 처리합니다.
+
+각 소스 항목의 키:
+- name: 로그 및 Slack 알림에 사용하는 소스 이름
+- category: Notion 페이지의 category 속성 값
+- database_id: 페이지를 생성할 Notion 데이터베이스 ID
+- feeds: 피드 목록. 각 피드는 url과 선택적 필터(title_must_contain)를 가집니다.
+- date_fields: 게시일로 사용할 항목 필드 (앞에서부터 값이 있는 첫 필드 사용)
+- stop_on_known: 최신순 피드에서 이전 실행에서 발행된 항목을 연속으로 만나면 나머지를 건너뛸지 여부
+- request_options: 피드 요청 시 추가로 전달할 requests 옵션
+- combined_enrichment: 요약과 상세 분석을 한 번의 Gemini 호출로 생성할지 여부
+"""
+
+from config import BOANISSUE_DATABASE_ID, RSS_STOP_ON_KNOWN, GEMINI_COMBINED_ENRICHMENT
+
+RSS_SOURCES = [
+    {
+        "name": "보안뉴스",
+        "category": "보안뉴스",
+        "database_id": BOANISSUE_DATABASE_ID,
+        "feeds": [
+            {"url": 'http://www.boannews.com/media/news_rss.xml?skind=5'},
+            {"url": 'http://www.boannews.com/media/news_rss.xml?skind=6'},
+            # 전체 기사 피드에서는 긴급 기사만 수집합니다.
+            {"url": 'http://www.boannews.com/media/news_rss.xml?mkind=1', "title_must_contain": "[긴급]"},
+        ],
+        "date_fields": ["pubDate", "dc_date"],
+        "stop_on_known": RSS_STOP_ON_KNOWN.get("보안뉴스", False),
+        "combined_enrichment": GEMINI_COMBINED_ENRICHMENT.get("보안뉴스", False),
+        "request_options": {},
+    },
+    {
+        "name": "데일리시큐",
+        "category": "데일리시큐",
+        "database_id": BOANISSUE_DATABASE_ID,
+        "feeds": [
+            {"url": 'https://www.dailysecu.com/rss/S1N2.xml'},
+        ],
+        "date_fields": ["pubDate", "dc_date"],
+        "stop_on_known": RSS_STOP_ON_KNOWN.get("데일리시큐", False),
+        "combined_enrichment": GEMINI_COMBINED_ENRICHMENT.get("데일리시큐", False),
+        "request_options": {},
+    },
+    {
+        "name": "KRCERT 보안공지",
+        "category": "KRCERT",
+        "database_id": BOANISSUE_DATABASE_ID,
+        "feeds": [
+            {"url": 'http://knvd.krcert.or.kr/rss/securityNotice.do'},
+        ],
+        "date_fields": ["pubDate"],
+        "stop_on_known": RSS_STOP_ON_KNOWN.get("KRCERT 보안공지", False),
+        "combined_enrichment": GEMINI_COMBINED_ENRICHMENT.get("KRCERT 보안공지", False),
+        # 기존 ssl_context와 동일하게 인증서 검증 없이 요청합니다.
+        "request_options": {"verify": False},
+    },
+]
+
+
+def get_rss_source(name):
+    """
+    이름으로 RSS 소스 정의를 찾아 반환합니다. 없으면 KeyError를 발생시킵니다.
+    """
+    for source in RSS_SOURCES:
+        if source["name"] == name:
+            return source
+    raise KeyError(f"등록되지 않은 RSS 소스입니다: {name}")
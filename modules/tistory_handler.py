@@ -1,8 +1,16 @@
 # modules/tistory_handler.py
-
-
-import time
-import re
+"""
+Tistory 글 발행 자동화 모듈입니다.
+- 로그인된 Chrome 브라우저 하나를 모듈 전역으로 유지하고 여러 글을 같은 세션으로 발행합니다.
+- 로그인 후 쿠키를 파일(TISTORY_COOKIE_PATH)로 저장해 두고, 새 브라우저를 띄울 때는 쿠키로 세션을 먼저 복원합니다.
+- 글쓰기 페이지가 로그인 페이지로 이동하면 세션이 만료된 것으로 보고 그때만 다시 로그인합니다.
+- 최종 '발행' 버튼을 누른 뒤에 실패하면 글이 이미 올라갔을 수 있으므로 실패가 아닌 '결과 불명'(None)으로 알립니다.
+"""
+
+import atexit
+import json
+import os
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -10,33 +18,133 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoAlertPresentException, UnexpectedAlertPresentException
+from selenium.common.exceptions import (TimeoutException, NoAlertPresentException, UnexpectedAlertPresentException,
+                                        WebDriverException)
 
-from config import TISTORY_EMAIL, TISTORY_PASSWORD, TISTORY_BLOG_NAME
+from config import TISTORY_EMAIL, TISTORY_PASSWORD, TISTORY_BLOG_NAME, TISTORY_COOKIE_PATH, TISTORY_PAGE_TIMEOUT_SECONDS
+
+KAKAO_LOGIN_URL = 'https://accounts.kakao.com/login/?continue=https%3A%2F%2Fkauth.kakao.com%2Foauth%2Fauthorize%3Fclient_id%3D3e6ddd834b023f24221217e370daed18%26prompt%3Dselect_account%26redirect_uri%3Dhttps%253A%252F%252Fwww.tistory.com%252Fauth%252Fkakao%252Fredirect%26response_type%3Dcode'
+
+# 여러 글에 걸쳐 재사용하는 브라우저. 브라우저는 동시에 조작할 수 없으므로 _driver_lock으로 한 번에 하나씩 사용합니다.
+_driver = None
+_driver_lock = threading.RLock()
+# ChromeDriverManager().install()은 버전 확인을 위해 네트워크 요청을 보내므로 경로를 한 번만 받아 둡니다.
+_chromedriver_path = None
+
+
+class TistorySessionExpired(Exception):
+    """글쓰기 페이지 대신 로그인 페이지로 이동해 세션이 만료된 것으로 판단될 때 발생합니다."""
+
+
+class TistoryPublishUnconfirmed(Exception):
+    """최종 '발행' 버튼을 누른 뒤 발행 완료를 확인하지 못했을 때 발생합니다. 글이 이미 발행되었을 수 있습니다."""
 
-def post_to_tistory(title_text, content_text, tags_text, category_name, source_url_text=None):
-    print(f"티스토리 자동 포스팅 시작: '{title_text}'")
 
+def _manage_url(path=""):
+    return f'https://{TISTORY_BLOG_NAME}.tistory.com/manage{path}'
+
+
+def _is_login_page(url):
+    return "accounts.kakao.com" in url or "kauth.kakao.com" in url or "tistory.com/auth/login" in url
+
+
+def _create_driver():
+    global _chromedriver_path
     chrome_options = Options()
-    # 화면을 보면서 디버깅합니다.
+    # 화면을 보면서 디버깅하려면 --headless를 제거하세요.
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
 
-    driver = None
-    posting_successful = False
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    driver = webdriver.Chrome(service=Service(_chromedriver_path), options=chrome_options)
+    print("WebDriver 시작됨")
+    return driver
+
 
+def _is_driver_alive(driver):
     try:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-        print("WebDriver 시작됨")
+        driver.current_url
+        return True
+    except UnexpectedAlertPresentException:
+        return True
+    except WebDriverException:
+        return False
+
+
+def _open_manage_page(driver):
+    """
+    관리 페이지로 이동해 로그인 상태인지 확인합니다.
+    관리 페이지가 열리면 True, 로그인 페이지로 이동하거나 시간 안에 열리지 않으면 False를 반환합니다.
+    """
+    driver.get(_manage_url())
+    try:
+        WebDriverWait(driver, TISTORY_PAGE_TIMEOUT_SECONDS).until(
+            lambda d: _is_login_page(d.current_url) or d.find_elements(By.ID, "kakaoServiceLogo") # 관리 페이지 상단 로고
+        )
+    except TimeoutException:
+        return False
+    return not _is_login_page(driver.current_url)
 
-        driver.get('https://accounts.kakao.com/login/?continue=https%3A%2F%2Fkauth.kakao.com%2Foauth%2Fauthorize%3Fclient_id%3D3e6ddd834b023f24221217e370daed18%26prompt%3Dselect_account%26redirect_uri%3Dhttps%253A%252F%252Fwww.tistory.com%252Fauth%252Fkakao%252Fredirect%26response_type%3Dcode')
-        print(f"카카오 로그인 페이지 접속: {driver.current_url}")
 
+def _save_cookies(driver):
+    """현재 세션의 쿠키를 파일로 저장합니다. 저장에 실패해도 발행에는 영향이 없으므로 경고만 출력합니다."""
+    try:
+        cookie_dir = os.path.dirname(TISTORY_COOKIE_PATH)
+        if cookie_dir:
+            os.makedirs(cookie_dir, exist_ok=True)
+        cookies = driver.get_cookies()
+        # 로그인 세션이 담긴 파일이므로 소유자만 읽고 쓸 수 있게 만듭니다. 이미 있던 파일도 권한을 좁힙니다.
+        fd = os.open(TISTORY_COOKIE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), 0o600)
+            json.dump(cookies, f)
+        print(f"Tistory 세션 쿠키 저장 완료: {TISTORY_COOKIE_PATH}")
+    except (OSError, WebDriverException) as e:
+        print(f"[WARN] Tistory 세션 쿠키 저장 실패: {e}")
+
+
+def _restore_cookies(driver):
+    """저장된 쿠키로 로그인 세션을 복원합니다. 복원한 세션으로 관리 페이지가 열리면 True를 반환합니다."""
+    if not os.path.exists(TISTORY_COOKIE_PATH):
+        return False
+    try:
+        with open(TISTORY_COOKIE_PATH, encoding="utf-8") as f:
+            cookies = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Tistory 세션 쿠키 파일을 읽지 못했습니다: {e}")
+        return False
+
+    # 쿠키는 같은 도메인의 페이지에서만 추가할 수 있으므로 블로그 주소를 먼저 엽니다.
+    driver.get(f'https://{TISTORY_BLOG_NAME}.tistory.com/')
+    for cookie in cookies:
         try:
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.NAME, 'loginId')))
+            driver.add_cookie(cookie)
+        except WebDriverException:
+            # 다른 하위 도메인 전용 쿠키 등은 건너뜁니다.
+            pass
+
+    if _open_manage_page(driver):
+        print("저장된 쿠키로 Tistory 세션을 복원했습니다.")
+        return True
+    print("저장된 Tistory 세션 쿠키가 만료되었습니다.")
+    return False
+
+
+def _login(driver):
+    """카카오 계정으로 Tistory에 로그인하고, 관리 페이지 접근을 확인한 뒤 쿠키를 저장합니다."""
+    driver.get(KAKAO_LOGIN_URL)
+    print(f"카카오 로그인 페이지 접속: {driver.current_url}")
+
+    try:
+        WebDriverWait(driver, 10).until(
+            lambda d: d.find_elements(By.NAME, 'loginId') or not _is_login_page(d.current_url)
+        )
+        if driver.find_elements(By.NAME, 'loginId'):
             email_input = driver.find_element(By.NAME, 'loginId')
             email_input.send_keys(TISTORY_EMAIL)
             password_input = driver.find_element(By.NAME, 'password')
@@ -49,278 +157,317 @@ def post_to_tistory(title_text, content_text, tags_text, category_name, source_u
             )
             driver.execute_script("arguments[0].click();", login_button)
             print("1차 카카오 로그인 버튼 클릭 (JavaScript 실행).")
+        else:
+            print("카카오 계정이 이미 로그인되어 있어 로그인 입력을 건너뜁니다.")
 
-        except Exception as e:
-            print(f"1차 카카오 로그인 과정 중 오류 발생: {e}")
-            driver.save_screenshot("debug_screenshot_kakao_login_error.png")
-            raise
+    except Exception as e:
+        print(f"1차 카카오 로그인 과정 중 오류 발생: {e}")
+        driver.save_screenshot("debug_screenshot_kakao_login_error.png")
+        raise
 
-        try:
-            tistory_kakao_login_button_xpath = "//*[contains(text(), '카카오계정으로 로그인')]"
-            tistory_login_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, tistory_kakao_login_button_xpath))
-            )
-            print("중간 티스토리 로그인 페이지 확인. '카카오계정으로 로그인' 버튼 클릭 시도.")
-            driver.execute_script("arguments[0].click();", tistory_login_button)
-        except TimeoutException:
-            print("중간 티스토리 로그인 페이지가 감지되지 않았습니다. 직접 로그인 된 것으로 간주하고 계속 진행합니다.")
-
-        # --- [핵심 수정 1]: 기본 관리 페이지로 먼저 이동 ---
-        manage_page_url = f'https://{TISTORY_BLOG_NAME}.tistory.com/manage'
-        print(f"기본 관리 페이지로 이동 시도: {manage_page_url}")
-        driver.get(manage_page_url)
-
-        print(f"1. 기본 관리 페이지({manage_page_url})로 URL 변경 및 로드 확인 중...")
-        WebDriverWait(driver, 20).until(EC.url_contains(f"{TISTORY_BLOG_NAME}.tistory.com/manage")) # /manage 까지는 가는지
-        # 페이지 타이틀이나 특정 요소가 있는지 확인하여 로드가 완료되었는지 검증할 수 있습니다.
-        WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.ID, "kakaoServiceLogo"))) # 예: 관리 페이지 상단 로고
-        print(f"   기본 관리 페이지 로드 확인 완료: {driver.current_url}")
-
-        print("기본 관리 페이지에서 3초 대기...")
-        time.sleep(3)
-        # -------------------------------------------------
-
-        # --- [핵심 수정 2]: 글쓰기 페이지로 이동 및 안정성 확보 ---
-        write_page_url = f'https://{TISTORY_BLOG_NAME}.tistory.com/manage/newpost'
-        print(f"글쓰기 페이지로 직접 이동 시도: {write_page_url}")
-        driver.get(write_page_url)
-
-       # --- [핵심 수정: 알림창 처리 로직 - 페이지 로드 직후 가장 먼저 실행] ---
-        alert_handled_successfully = False
-        try:
-            print("DEBUG: 글쓰기 페이지 진입. 알림창 즉시 확인 및 처리 시도 (최대 7초 대기)...")
-            WebDriverWait(driver, 7).until(EC.alert_is_present())
+    try:
+        tistory_kakao_login_button_xpath = "//*[contains(text(), '카카오계정으로 로그인')]"
+        tistory_login_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, tistory_kakao_login_button_xpath))
+        )
+        print("중간 티스토리 로그인 페이지 확인. '카카오계정으로 로그인' 버튼 클릭 시도.")
+        driver.execute_script("arguments[0].click();", tistory_login_button)
+    except TimeoutException:
+        print("중간 티스토리 로그인 페이지가 감지되지 않았습니다. 직접 로그인 된 것으로 간주하고 계속 진행합니다.")
+
+    print(f"기본 관리 페이지({_manage_url()})로 이동하여 로그인 상태 확인 중...")
+    if not _open_manage_page(driver):
+        raise Exception(f"로그인 후에도 관리 페이지에 접근할 수 없습니다. 현재 URL: {driver.current_url}")
+    print(f"   기본 관리 페이지 로드 확인 완료: {driver.current_url}")
+    _save_cookies(driver)
+
+
+def _ensure_session(force_login=False):
+    """
+    로그인된 브라우저를 반환합니다. 브라우저가 없거나 종료되었으면 새로 띄워 쿠키로 복원하고,
+    복원에 실패했거나 force_login이 True이면 다시 로그인합니다. _driver_lock을 잡은 상태에서 호출해야 합니다.
+    """
+    global _driver
+    if _driver is not None and not _is_driver_alive(_driver):
+        print("Tistory 브라우저가 응답하지 않아 새로 시작합니다.")
+        close_tistory_session()
+
+    if _driver is None:
+        _driver = _create_driver()
+        if not force_login and _restore_cookies(_driver):
+            return _driver
+        force_login = True
+
+    if force_login:
+        _login(_driver)
+    return _driver
+
+
+def close_tistory_session():
+    """유지 중인 브라우저를 종료합니다. 저장된 쿠키는 남겨 두어 다음 실행에서 재사용합니다."""
+    global _driver
+    with _driver_lock:
+        if _driver is not None:
+            try:
+                _driver.quit()
+                print("WebDriver 종료됨.")
+            except WebDriverException:
+                pass
+            _driver = None
 
-            alert = driver.switch_to.alert
-            alert_text = alert.text
-            print(f"DEBUG: 알림 발견! 내용: '{alert_text}'")
 
-            if "저장된 글이 있습니다" in alert_text:
-                print("DEBUG: '저장된 글' 알림. alert.dismiss()로 '취소'를 시도합니다.")
-                alert.dismiss() # 표준적인 취소 방법
-                print("DEBUG: alert.dismiss() 실행 완료.")
-            else:
-                print(f"WARN: 예상치 못한 다른 알림입니다: '{alert_text}'. '확인' (accept) 처리합니다.")
-                alert.accept()
+atexit.register(close_tistory_session)
 
-            alert_handled_successfully = True
-            time.sleep(0.5) # DOM 안정화를 위한 짧은 대기
 
-        except TimeoutException:
-            print("DEBUG: 알림창이 지정된 시간 내에 나타나지 않았습니다 (정상적인 경우).")
-            alert_handled_successfully = True
-        except NoAlertPresentException:
-             print("DEBUG: NoAlertPresentException. 알림창 없음 (정상적인 경우).")
-             alert_handled_successfully = True
-        except UnexpectedAlertPresentException as uap_inner:
-            # 이 블록 안에서 UnexpectedAlertPresentException이 발생하면,
-            # WebDriverWait(EC.alert_is_present())가 true를 반환했음에도
-            # driver.switch_to.alert 등의 작업 중 다른 alert이 끼어들었거나 매우 특이한 상황.
-            print(f"ERROR: 알림 처리 중 다시 UnexpectedAlertPresentException 발생: {uap_inner.alert_text if hasattr(uap_inner, 'alert_text') else 'N/A'}")
-            # 이 경우, 일단 현재 떠 있는 알림을 닫는 시도를 한번 더 할 수 있습니다.
-            try:
-                current_alert = driver.switch_to.alert
-                print(f"   (Fallback) 실제 알림 텍스트: {current_alert.text}. Dismiss 시도.")
-                current_alert.dismiss()
-                time.sleep(1)
-                alert_handled_successfully = True # 일단 처리된 것으로 간주하고 로깅
-            except Exception as e_double_fault:
-                print(f"   (Fallback) 알림 처리 완전 실패: {e_double_fault}")
-                raise uap_inner # 원래 오류를 다시 발생시켜 중단
-        except Exception as e_alert_handler_other:
-             print(f"ERROR: 알림창 처리 중 예상 못한 오류 발생: {e_alert_handler_other}")
-             raise e_alert_handler_other # 더 진행하지 않고 오류 발생
-
-        if not alert_handled_successfully: # 이 조건에 걸리면 심각한 문제
-            print("CRITICAL: 알림창 처리에 실패했습니다. 스크립트를 중단합니다.")
-            # driver.save_screenshot("debug_screenshot_alert_critical_failure.png") # 최종 오류 블록에서 처리
-            raise Exception("Alert was not handled successfully on new post page.")
-        # --- 알림창 처리 로직 끝 ---
-
-
-        # 알림창 처리 후, 페이지 URL 및 기본 요소 로드 확인
-        print(f"DEBUG: 알림 처리 후 URL 확인 중... 현재 URL: {driver.current_url}")
-        WebDriverWait(driver, 15).until(EC.url_contains("/manage/newpost"))
-        print(f"   URL 변경 재확인 완료: {driver.current_url}")
-
-        print("DEBUG: 페이지 기본 요소(body) 로드 대기 중...")
-        WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        print("   페이지 기본 요소 로드 확인 완료.")
-        time.sleep(1)
-
-        print("DEBUG: 글쓰기 페이지 제목 입력창 활성화 대기 중...")
-        # title_input_element는 알림 처리 후 다시 가져오는 것이 안전합니다.
-        title_input_element = WebDriverWait(driver, 20).until(
-            EC.element_to_be_clickable((By.ID, "post-title-inp"))
+def _handle_alert(driver):
+    """
+    글쓰기 페이지에 떠 있는 알림창을 처리합니다.
+    '저장된 글이 있습니다' 알림은 취소하고, 그 밖의 알림은 확인을 누릅니다. 알림이 없으면 아무것도 하지 않습니다.
+    """
+    try:
+        alert = driver.switch_to.alert
+        alert_text = alert.text
+    except NoAlertPresentException:
+        return
+    print(f"DEBUG: 알림 발견! 내용: '{alert_text}'")
+
+    if "저장된 글이 있습니다" in alert_text:
+        print("DEBUG: '저장된 글' 알림. alert.dismiss()로 '취소'를 시도합니다.")
+        alert.dismiss() # 표준적인 취소 방법
+    else:
+        print(f"WARN: 예상치 못한 다른 알림입니다: '{alert_text}'. '확인' (accept) 처리합니다.")
+        alert.accept()
+    # 알림이 닫히고 DOM이 다시 조작 가능해질 때까지 대기
+    WebDriverWait(driver, 5).until_not(EC.alert_is_present())
+
+
+def _publish_post(driver, title_text, content_text, tags_text, category_name, source_url_text=None):
+    """로그인된 브라우저로 글쓰기 페이지를 열어 글 하나를 발행합니다. 실패하면 예외를 발생시킵니다."""
+    write_page_url = _manage_url("/newpost")
+    print(f"글쓰기 페이지로 이동: {write_page_url}")
+    # 이전 글 작성이 중간에 실패해 '페이지를 떠나시겠습니까' 알림이 남아 있을 수 있으므로 먼저 처리합니다.
+    _handle_alert(driver)
+    driver.get(write_page_url)
+
+    # --- 알림창 처리 로직: 에디터가 준비되거나 알림이 뜰 때까지 대기 ---
+    try:
+        print("DEBUG: 글쓰기 페이지 진입. 에디터 로드 또는 알림창 대기...")
+        WebDriverWait(driver, TISTORY_PAGE_TIMEOUT_SECONDS).until(
+            lambda d: EC.alert_is_present()(d)
+            or _is_login_page(d.current_url)
+            or d.find_elements(By.ID, "editor-tistory_ifr")
         )
-        print(f"   글쓰기 페이지 제목 입력창 활성화 확인: {driver.current_url}")
-
-
-        #1단계: 카테고리 선택
-        try:
-            # 원하시는 카테고리 이름으로 이 변수 값을 변경하세요.
-            category_name_to_select = category_name
-            print(f"카테고리 '{category_name_to_select}' 선택 시도...")
+        _handle_alert(driver)
+    except UnexpectedAlertPresentException as uap_inner:
+        # 대기 도중 다른 알림이 끼어든 경우, 현재 떠 있는 알림을 한 번 더 처리합니다.
+        print(f"ERROR: 알림 처리 중 다시 UnexpectedAlertPresentException 발생: {uap_inner.alert_text if hasattr(uap_inner, 'alert_text') else 'N/A'}")
+        _handle_alert(driver)
+    # --- 알림창 처리 로직 끝 ---
+
+    if _is_login_page(driver.current_url):
+        raise TistorySessionExpired(f"글쓰기 페이지 대신 로그인 페이지로 이동했습니다: {driver.current_url}")
+
+    # 알림창 처리 후, 페이지 URL 및 제목 입력창 확인
+    WebDriverWait(driver, 15).until(EC.url_contains("/manage/newpost"))
+    print("DEBUG: 글쓰기 페이지 제목 입력창 활성화 대기 중...")
+    title_input_element = WebDriverWait(driver, TISTORY_PAGE_TIMEOUT_SECONDS).until(
+        EC.element_to_be_clickable((By.ID, "post-title-inp"))
+    )
+    print(f"   글쓰기 페이지 제목 입력창 활성화 확인: {driver.current_url}")
+
+
+    #1단계: 카테고리 선택
+    try:
+        category_name_to_select = category_name
+        print(f"카테고리 '{category_name_to_select}' 선택 시도...")
 
-            # 카테고리 선택 드롭다운 버튼 클릭
-            category_dropdown_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "category-btn"))
-            )
-            category_dropdown_button.click()
-            print("카테고리 메뉴 열기 완료.")
+        # 카테고리 선택 드롭다운 버튼 클릭
+        category_dropdown_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "category-btn"))
+        )
+        category_dropdown_button.click()
+        print("카테고리 메뉴 열기 완료.")
 
-            # [수정] 제공된 HTML 구조에 맞춰 XPath를 수정합니다.
-            # role이 'option'인 div 요소 중, 자식 span의 텍스트가 일치하는 것을 찾습니다.
-            category_option_xpath = f"//div[@role='option'][span/text()='{category_name_to_select}']"
+        # role이 'option'인 div 요소 중, 자식 span의 텍스트가 일치하는 것을 찾습니다.
+        category_option_xpath = f"//div[@role='option'][span/text()='{category_name_to_select}']"
 
-            print(f"카테고리 옵션({category_option_xpath}) 대기 중...")
-            category_option = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, category_option_xpath))
-            )
-            category_option.click()
-            print(f"카테고리 '{category_name_to_select}' 선택 완료.")
-            time.sleep(1) # 선택 후 UI가 안정적으로 반영될 때까지 대기
-        except Exception as e:
-            # 카테고리 선택은 부가 기능으로, 실패하더라도 전체 발행 과정이 중단되지 않도록 합니다.
-            print(f"경고: 카테고리('{category_name_to_select}') 선택 중 오류가 발생했습니다. '카테고리 없음'으로 발행될 수 있습니다. 오류: {e}")
-            driver.save_screenshot("debug_screenshot_category_error.png")
+        print(f"카테고리 옵션({category_option_xpath}) 대기 중...")
+        category_option = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.XPATH, category_option_xpath))
+        )
+        category_option.click()
+        # 선택한 카테고리가 드롭다운 버튼에 반영될 때까지 대기
+        WebDriverWait(driver, 5).until(EC.text_to_be_present_in_element((By.ID, "category-btn"), category_name_to_select))
+        print(f"카테고리 '{category_name_to_select}' 선택 완료.")
+    except Exception as e:
+        # 카테고리 선택은 부가 기능으로, 실패하더라도 전체 발행 과정이 중단되지 않도록 합니다.
+        print(f"경고: 카테고리('{category_name_to_select}') 선택 중 오류가 발생했습니다. '카테고리 없음'으로 발행될 수 있습니다. 오류: {e}")
+        driver.save_screenshot("debug_screenshot_category_error.png")
 
 
-        # 제목 입력
-        title_input_element.send_keys("["+tags_text+"]"+title_text)
-        print("제목 입력 완료: ", "["+tags_text+"]"+title_text)
+    # 제목 입력
+    title_input_element.send_keys("["+tags_text+"]"+title_text)
+    print("제목 입력 완료: ", "["+tags_text+"]"+title_text)
 
-        time.sleep(1)
+    try:
+        html_content_to_post = content_text
 
-        try:
-            html_content_to_post = content_text
+        if source_url_text:
+            html_content_to_post += f'<br><p><b>출처:</b> <a href="{source_url_text}" target="_blank" rel="noopener noreferrer">{source_url_text}</a></p>'
 
-            if source_url_text:
-                html_content_to_post += f'<br><p><b>출처:</b> <a href="{source_url_text}" target="_blank" rel="noopener noreferrer">{source_url_text}</a></p>'
+        # iframe으로 전환
+        WebDriverWait(driver, TISTORY_PAGE_TIMEOUT_SECONDS).until(
+            EC.frame_to_be_available_and_switch_to_it((By.ID, "editor-tistory_ifr"))
+        )
+        print("본문 편집 iframe으로 전환 성공. 👍")
 
-            # iframe으로 전환
-            WebDriverWait(driver, 20).until(
-                EC.frame_to_be_available_and_switch_to_it((By.ID, "editor-tistory_ifr"))
-            )
-            print("본문 편집 iframe으로 전환 성공. 👍")
+        # 에디터의 body 요소를 찾습니다.
+        body_element = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "tinymce"))
+        )
 
-            # 에디터의 body 요소를 찾습니다.
-            body_element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "tinymce"))
-            )
+        # 1. JavaScript로 HTML 내용을 먼저 주입합니다.
+        driver.execute_script("arguments[0].innerHTML = arguments[1];", body_element, html_content_to_post)
+        print("본문 HTML 내용 주입 완료.")
+
+        # 2. 주입 후, 에디터 본문을 클릭하여 '활성화'하고 '포커스'를 줍니다.
+        # 이 과정은 에디터가 변경된 내용을 자신의 '상태'로 인식하게 하는 중요한 역할을 합니다.
+        print("에디터 본문 활성화를 위해 클릭 실행...")
+        body_element.click()
+        print("본문 활성화 완료.")
+
+        # 3. 기본 콘텐츠(iframe 외부)로 돌아오기
+        driver.switch_to.default_content()
+        print("기본 콘텐츠로 돌아오기 완료.")
+    except Exception as e:
+        print(f"본문 입력 중 오류 발생: {e} 😥")
+        driver.save_screenshot("debug_screenshot_body_input_error.png")
+        # 오류 발생 시에도 안전하게 기본 콘텐츠로 돌아오도록 시도합니다.
+        try:
+            driver.switch_to.default_content()
+        except: pass
+        raise
 
-            # 1. JavaScript로 HTML 내용을 먼저 주입합니다.
-            driver.execute_script("arguments[0].innerHTML = arguments[1];", body_element, html_content_to_post)
-            print("본문 HTML 내용 주입 완료.")
+    # --- 태그 입력 ---
+    try:
+        print("태그 입력 시도...")
+        tag_input_element = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "tagText"))
+        )
+        tag_input_element.send_keys(tags_text)
+        print(f"태그 입력 완료: {tags_text} 🏷️")
+    except Exception as e:
+        # 태그 입력은 부가 기능이므로, 실패해도 포스팅은 계속될 수 있도록 오류 메시지만 출력합니다.
+        print(f"태그 입력 중 오류 발생 (ID: tagText). 태그 없이 진행합니다: {e} 😥")
+        driver.save_screenshot("debug_screenshot_tag_input_error.png")
 
-            # [핵심 추가] 2. 주입 후, 에디터 본문을 클릭하여 '활성화'하고 '포커스'를 줍니다.
-            # 이 과정은 에디터가 변경된 내용을 자신의 '상태'로 인식하게 하는 중요한 역할을 합니다.
-            print("에디터 본문 활성화를 위해 클릭 실행...")
-            body_element.click()
-            time.sleep(1) # 클릭 후 에디터가 반응할 시간을 줍니다.
-            print("본문 활성화 완료.")
 
-            # 3. 기본 콘텐츠(iframe 외부)로 돌아오기
-            driver.switch_to.default_content()
-            print("기본 콘텐츠로 돌아오기 완료.")
-        except Exception as e:
-            print(f"본문 입력 중 오류 발생: {e} 😥")
-            driver.save_screenshot("debug_screenshot_body_input_error.png")
-            # 오류 발생 시에도 안전하게 기본 콘텐츠로 돌아오도록 시도합니다.
-            try:
-                driver.switch_to.default_content()
-            except: pass
-            raise
+    # --- 발행 버튼 클릭 ---
+    try:
+        # 1단계: '발행' 버튼 클릭하여 발행 설정 창 열기
+        print("1단계: '발행' 버튼을 눌러 설정 창 열기 시도...")
+        publish_layer_open_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "publish-layer-btn"))
+        )
+        publish_layer_open_button.click()
+        print("'발행' 버튼 클릭 완료.")
+
+        # 2단계: 발행 설정 창이 화면에 완전히 나타날 때까지 대기
+        publish_layer_container_selector = "div.editor_layer"
+        print(f"발행 설정 창({publish_layer_container_selector})이 나타날 때까지 대기...")
+        WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, publish_layer_container_selector))
+        )
+        print("발행 설정 창 확인 완료.")
 
-        # --- 태그 입력 ---
+        # 3단계: '공개' 옵션 클릭
+        # 기본값이 '비공개'로 설정되어 있으므로, '공개' 라디오 버튼(ID: open20)을 명시적으로 클릭합니다.
+        print("'공개' 라디오 버튼 클릭 시도 (ID: open20)...")
+        public_radio_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "open20")) # HTML에서 확인한 '공개' 라디오 버튼의 ID
+        )
+        public_radio_button.click()
+        # 옵션 선택이 반영될 때까지 대기 (선택 상태를 확인하지 못해도 발행은 계속 시도합니다)
         try:
-            print("태그 입력 시도...")
-            tag_input_element = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "tagText"))
-            )
-            # 이전에 입력된 태그가 있다면 지웁니다. (선택 사항)
-            # tag_input_element.clear()
-            tag_input_element.send_keys(tags_text)
-            print(f"태그 입력 완료: {tags_text} 🏷️")
-            time.sleep(1) # 입력 후 안정화를 위한 짧은 대기
-        except Exception as e:
-            # 태그 입력은 부가 기능이므로, 실패해도 포스팅은 계속될 수 있도록 오류 메시지만 출력합니다.
-            print(f"태그 입력 중 오류 발생 (ID: tagText). 태그 없이 진행합니다: {e} 😥")
-            driver.save_screenshot("debug_screenshot_tag_input_error.png")
-
-
-        # --- 발행 버튼 클릭 (안정성 강화 최종 버전) ---
+            WebDriverWait(driver, 5).until(EC.element_located_to_be_selected((By.ID, "open20")))
+        except TimeoutException:
+            print("경고: '공개' 옵션 선택 상태를 확인하지 못했습니다. 그대로 발행을 시도합니다.")
+        print("'공개' 옵션 선택 완료.")
+
+        # 4단계: 설정 창 안의 최종 '발행' 버튼 클릭
+        print("최종 '발행' 버튼 클릭 시도 (ID: publish-btn)...")
+        final_publish_button = WebDriverWait(driver, 10).until(
+            EC.element_to_be_clickable((By.ID, "publish-btn"))
+        )
+        final_publish_button.click()
+        print("최종 '발행' 버튼 클릭 완료! 🚀")
+    except Exception as e:
+        print(f"발행 과정 중 오류 발생: {e} 😥")
+        driver.save_screenshot("debug_screenshot_publish_process_error.png")
+        raise
+
+    # 5단계: 발행이 완료되고 글쓰기 페이지를 떠날 때까지 대기
+    # 여기서부터의 실패는 글이 이미 발행되었을 수 있으므로 다시 시도하면 중복 글이 생길 수 있습니다.
+    try:
+        print("게시글 발행 후 페이지 이동 대기 중 (글 목록 페이지로 이동 예상)...")
+        WebDriverWait(driver, 30).until(
+            EC.url_contains("/manage/posts/")
+        )
+    except Exception as e:
+        print(f"발행 버튼을 누른 뒤 발행 완료를 확인하지 못했습니다: {e} 😥")
         try:
-            # 1단계: '발행' 버튼 클릭하여 발행 설정 창 열기
-            print("1단계: '발행' 버튼을 눌러 설정 창 열기 시도...")
-            publish_layer_open_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "publish-layer-btn"))
-            )
-            publish_layer_open_button.click()
-            print("'발행' 버튼 클릭 완료.")
-
-            # 2단계: 발행 설정 창이 화면에 완전히 나타날 때까지 대기
-            # [수정] 제공해주신 HTML을 분석하여 올바른 CSS 선택자('div.editor_layer')로 변경했습니다.
-            publish_layer_container_selector = "div.editor_layer"
-            print(f"발행 설정 창({publish_layer_container_selector})이 나타날 때까지 대기...")
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, publish_layer_container_selector))
-            )
-            print("발행 설정 창 확인 완료.")
+            driver.save_screenshot("debug_screenshot_publish_unconfirmed.png")
+        except Exception:
+            pass
+        raise TistoryPublishUnconfirmed(f"발행 버튼 클릭 후 발행 완료 확인 실패: {e}") from e
 
-            # [핵심 추가] 3단계: '공개' 옵션 클릭
-            # 기본값이 '비공개'로 설정되어 있으므로, '공개' 라디오 버튼(ID: open20)을 명시적으로 클릭합니다.
-            print("'공개' 라디오 버튼 클릭 시도 (ID: open20)...")
-            public_radio_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "open20")) # HTML에서 확인한 '공개' 라디오 버튼의 ID
-            )
-            public_radio_button.click()
-            print("'공개' 옵션 선택 완료.")
-            # 옵션 선택 후, 최종 발행 버튼의 상태(예: 텍스트 변경)가 업데이트될 시간을 줍니다.
-            time.sleep(1)
-
-            # 4단계: 설정 창 안의 최종 '발행' 버튼 클릭
-            print("최종 '발행' 버튼 클릭 시도 (ID: publish-btn)...")
-            final_publish_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "publish-btn"))
-            )
-            final_publish_button.click()
-            print("최종 '발행' 버튼 클릭 완료! 🚀")
+    print("게시글 발행 성공 확인! 글 목록 페이지로 이동했습니다. 현재 URL:", driver.current_url)
 
-            # 5단계: 발행이 완료되고 글쓰기 페이지를 떠날 때까지 대기
-            print("게시글 발행 후 페이지 이동 대기 중 (글 목록 페이지로 이동 예상)...")
-            WebDriverWait(driver, 30).until(
-                EC.url_contains("/manage/posts/")
-            )
 
-            print("게시글 발행 성공 확인! 글 목록 페이지로 이동했습니다. 현재 URL:", driver.current_url)
-            posting_successful = True
-        except Exception as e:
-            print(f"발행 과정 중 오류 발생: {e} 😥")
-            driver.save_screenshot("debug_screenshot_publish_process_error.png")
-            raise
+def post_to_tistory(title_text, content_text, tags_text, category_name, source_url_text=None):
+    """
+    유지 중인 로그인 세션으로 Tistory에 글 하나를 발행하고 성공 여부를 반환합니다.
+    세션이 만료된 경우 한 번 다시 로그인한 뒤 재시도합니다.
+    발행 버튼을 누른 뒤 완료를 확인하지 못하면 다시 시도하지 않고 None(결과 불명)을 반환합니다.
+    """
+    print(f"티스토리 자동 포스팅 시작: '{title_text}'")
 
-    except Exception as e_global:
-        print(f"💥 스크립트 실행 중 예외 발생: {e_global}")
-        if driver:
+    with _driver_lock:
+        for attempt in range(2):
+            driver = None
             try:
-                current_url_on_error = "N/A"
-                page_source_on_error_snippet = "N/A"
-                try:
-                    current_url_on_error = driver.current_url
-                    page_source_on_error_snippet = driver.page_source[:500]
-                except: pass
-                print(f"  오류 발생 시점 URL: {current_url_on_error}")
-                print(f"  오류 발생 시점 페이지 소스 (일부): {page_source_on_error_snippet}")
-
-                final_error_screenshot_name = "debug_screenshot_fatal_error.png"
-                driver.save_screenshot(final_error_screenshot_name)
-                print(f"함수 실행 중 치명적 오류 발생 시 스크린샷 저장됨: {final_error_screenshot_name}")
-            except Exception as screenshot_err:
-                print(f"치명적 오류 스크린샷 저장 실패: {screenshot_err}")
-    finally:
-        if driver:
-            driver.quit()
-            print("WebDriver 종료됨.")
-
-    return posting_successful
\ No newline at end of file
+                driver = _ensure_session(force_login=attempt > 0)
+                _publish_post(driver, title_text, content_text, tags_text, category_name, source_url_text)
+                return True
+            except TistorySessionExpired as e:
+                print(f"Tistory 세션이 만료되었습니다. 다시 로그인합니다: {e}")
+            except TistoryPublishUnconfirmed as e:
+                print(f"⚠️ 글이 발행되었는지 확인할 수 없어 다시 시도하지 않습니다: {e}")
+                if not _is_driver_alive(driver):
+                    close_tistory_session()
+                return None
+            except Exception as e_global:
+                print(f"💥 스크립트 실행 중 예외 발생: {e_global}")
+                if driver:
+                    try:
+                        current_url_on_error = "N/A"
+                        page_source_on_error_snippet = "N/A"
+                        try:
+                            current_url_on_error = driver.current_url
+                            page_source_on_error_snippet = driver.page_source[:500]
+                        except: pass
+                        print(f"  오류 발생 시점 URL: {current_url_on_error}")
+                        print(f"  오류 발생 시점 페이지 소스 (일부): {page_source_on_error_snippet}")
+
+                        final_error_screenshot_name = "debug_screenshot_fatal_error.png"
+                        driver.save_screenshot(final_error_screenshot_name)
+                        print(f"함수 실행 중 치명적 오류 발생 시 스크린샷 저장됨: {final_error_screenshot_name}")
+                    except Exception as screenshot_err:
+                        print(f"치명적 오류 스크린샷 저장 실패: {screenshot_err}")
+                    # 브라우저가 죽은 경우에만 종료하고, 살아 있으면 다음 글에서 그대로 재사용합니다.
+                    if not _is_driver_alive(driver):
+                        close_tistory_session()
+                return False
+
+    print("❌ 다시 로그인한 뒤에도 Tistory 세션을 사용할 수 없어 포스팅을 중단합니다.")
+    return False
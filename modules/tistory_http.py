@@ -0,0 +1,128 @@
+# modules/tistory_http.py
+"""
+브라우저 없이 HTTP 요청으로 Tistory 글을 발행하는 모듈입니다.
+- tistory_handler가 Selenium 로그인 후 저장한 쿠키(TISTORY_COOKIE_PATH)를 그대로 사용합니다.
+- 글쓰기 에디터가 발행할 때 호출하는 /manage/post.json에 글 내용을 직접 보냅니다.
+- 글이 발행되지 않은 것이 확실할 때(쿠키 없음·만료, 카테고리 ID 미설정, 서버 연결 실패)만 False를 반환하며,
+  이때는 호출한 쪽에서 Selenium 발행(post_to_tistory)으로 대체합니다.
+  Selenium 발행이 다시 로그인하면서 쿠키를 갱신하므로 다음 발행부터는 다시 HTTP로 발행할 수 있습니다.
+- 요청을 보낸 뒤 응답을 받지 못했거나 응답을 해석할 수 없으면 글이 이미 발행되었을 수 있으므로 None(결과 불명)을 반환합니다.
+  이 경우 Selenium으로 다시 발행하면 중복 글이 생길 수 있으므로 대체하지 않습니다.
+"""
+
+import json
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from config import TISTORY_BLOG_NAME, TISTORY_COOKIE_PATH, TISTORY_HTTP_BASE_URL, TISTORY_CATEGORY_IDS
+from .http_client import get_session
+
+# Tistory 글 공개 설정 값 (0: 비공개, 15: 보호, 20: 공개). 에디터의 '공개' 라디오 버튼(open20)과 같습니다.
+TISTORY_VISIBILITY_PUBLIC = 20
+
+
+def _base_url():
+    return (TISTORY_HTTP_BASE_URL or f"https://{TISTORY_BLOG_NAME}.tistory.com").rstrip("/")
+
+
+def _load_session_cookies():
+    """Selenium이 저장한 쿠키 파일을 requests 쿠키 저장소로 불러옵니다. 파일이 없거나 읽을 수 없으면 None을 반환합니다."""
+    try:
+        with open(TISTORY_COOKIE_PATH, encoding="utf-8") as f:
+            cookies = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    cookie_jar = requests.cookies.RequestsCookieJar()
+    for cookie in cookies:
+        if "name" in cookie and "value" in cookie:
+            # 로컬 대체 서버(TISTORY_HTTP_BASE_URL)로도 보낼 수 있도록 도메인을 지정하지 않고 담습니다.
+            cookie_jar.set(cookie["name"], cookie["value"])
+    return cookie_jar
+
+
+def _is_connect_failure(error):
+    """요청이 서버에 전달되기 전에 연결 단계에서 실패했는지 확인합니다."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def post_to_tistory_http(title_text, content_text, tags_text, category_name, source_url_text=None):
+    """
+    post_to_tistory와 같은 인자로 HTTP 요청을 보내 글 하나를 발행합니다.
+    성공하면 True, 발행되지 않은 것이 확실하면 False, 발행 여부를 알 수 없으면 None을 반환합니다.
+    제목과 본문은 Selenium 발행과 같은 형식(제목 앞 [태그], 본문 끝 출처 링크)으로 만듭니다.
+    """
+    cookie_jar = _load_session_cookies()
+    if not cookie_jar:
+        print("Tistory 세션 쿠키가 없어 HTTP 발행을 건너뜁니다.")
+        return False
+
+    category_id = TISTORY_CATEGORY_IDS.get(category_name)
+    if not category_id:
+        # ID 없이 보내면 '카테고리 없음'으로 발행되므로, 카테고리 이름으로 선택하는 Selenium 발행에 맡깁니다.
+        print(f"카테고리 '{category_name}'의 ID가 TISTORY_CATEGORY_IDS에 설정되지 않아 HTTP 발행을 건너뜁니다.")
+        return False
+
+    html_content_to_post = content_text
+    if source_url_text:
+        html_content_to_post += f'<br><p><b>출처:</b> <a href="{source_url_text}" target="_blank" rel="noopener noreferrer">{source_url_text}</a></p>'
+
+    base_url = _base_url()
+    payload = {
+        "id": "0",
+        "title": "[" + tags_text + "]" + title_text,
+        "content": html_content_to_post,
+        "visibility": TISTORY_VISIBILITY_PUBLIC,
+        "category": category_id,
+        "tag": tags_text,
+        "published": 1,
+        "password": "",
+        "uselessMarginForEntry": 1,
+        "cclCommercial": 0,
+        "cclDerive": 0,
+        "attachments": [],
+        "recaptchaValue": "",
+        "draftSequence": None,
+    }
+    headers = {
+        "Referer": f"{base_url}/manage/newpost",
+        "Origin": base_url,
+        "X-Requested-With": "XMLHttpRequest",
+    }
+
+    print(f"티스토리 HTTP 발행 시작: '{title_text}'")
+    try:
+        # 세션이 만료되면 로그인 페이지로 리다이렉트되므로 따라가지 않고 상태 코드로 판단합니다.
+        response = get_session().post(f"{base_url}/manage/post.json", json=payload, headers=headers,
+                                      cookies=cookie_jar, timeout=30, allow_redirects=False)
+    except requests.exceptions.RequestException as e:
+        if _is_connect_failure(e):
+            print(f"Tistory 서버에 연결하지 못해 HTTP 발행에 실패했습니다: {e}")
+            return False
+        # 요청이 전달된 뒤의 오류(응답 시간 초과 등)는 글이 이미 발행되었을 수 있습니다.
+        print(f"Tistory HTTP 발행 요청 후 응답을 받지 못해 발행 여부를 확인할 수 없습니다: {e}")
+        return None
+
+    if response.status_code in (301, 302, 303, 307, 308, 401, 403):
+        print(f"Tistory 세션이 만료되어 HTTP 발행에 실패했습니다 (상태 코드: {response.status_code}).")
+        return False
+    if response.status_code != 200:
+        print(f"Tistory HTTP 발행 응답 오류로 발행 여부를 확인할 수 없습니다: {response.status_code} - {response.text[:200]}")
+        return None
+
+    try:
+        entry_url = response.json().get("entryUrl")
+    except ValueError:
+        entry_url = None
+    if not entry_url:
+        print(f"Tistory HTTP 발행 응답에서 글 주소를 찾지 못해 발행 여부를 확인할 수 없습니다: {response.text[:200]}")
+        return None
+
+    print(f"게시글 HTTP 발행 성공! 글 주소: {entry_url}")
+    return True
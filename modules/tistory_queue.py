@@ -0,0 +1,165 @@
+# modules/tistory_queue.py
+"""
+Tistory 발행을 Notion 작성과 분리하는 발행 큐 모듈입니다.
+- create_notion_page는 발행할 글을 enqueue_tistory_post()로 로컬 저장소(SQLite)에 넣고 바로 반환합니다.
+- 별도로 스케줄된 drain_tistory_queue()가 대기 중인 글을 차례로 발행하고, 글마다 성공/실패와 시도 횟수를 기록합니다.
+- 발행은 HTTP 요청(tistory_http)을 먼저 시도하고, 발행되지 않은 것이 확실한 글만 하나의 브라우저 세션(tistory_handler)으로 발행합니다.
+- 실패한 글은 다음 실행에서 다시 시도하며, TISTORY_PUBLISH_MAX_ATTEMPTS번 실패하면 'failed'로 남겨 둡니다.
+- 발행 요청을 보내거나 발행 버튼을 누른 뒤 결과를 확인하지 못한 글은 중복 발행을 막기 위해 'unknown'으로 남기고 자동으로 다시 시도하지 않습니다.
+  블로그에서 직접 확인한 뒤, 발행되지 않았다면 status를 'pending'으로 되돌리면 다음 실행에서 발행합니다.
+"""
+
+import datetime
+import sqlite3
+import threading
+
+from config import TISTORY_PUBLISH_MAX_ATTEMPTS, TISTORY_PUBLISH_RETENTION_DAYS, TISTORY_HTTP_ENABLED
+from .local_store import ensure_schema, execute
+from .tistory_handler import post_to_tistory, close_tistory_session
+from .tistory_http import post_to_tistory_http
+from .utils import send_slack_message
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS tistory_publish_queue (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        content_html TEXT NOT NULL,
+        tags TEXT,
+        category_name TEXT,
+        source_url TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_tistory_publish_queue_status ON tistory_publish_queue (status, id)",
+]
+
+# 스케줄된 발행 작업이 겹쳐 실행되지 않도록 합니다.
+_drain_lock = threading.Lock()
+
+
+def enqueue_tistory_post(title, content_html, tags, category_name, source_url=None):
+    """
+    post_to_tistory와 같은 인자로 발행할 글을 큐에 넣습니다. 성공하면 True를 반환합니다.
+    """
+    now = datetime.datetime.now().isoformat()
+    try:
+        ensure_schema("tistory_publish_queue", _SCHEMA)
+        execute(
+            "INSERT INTO tistory_publish_queue (title, content_html, tags, category_name, source_url, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (title, content_html, tags, category_name, source_url, now, now),
+            commit=True,
+        )
+        return True
+    except sqlite3.Error as e:
+        print(f"[ERROR] Tistory 발행 큐 추가 실패: {title} - {e}")
+        send_slack_message(f"[ERROR] Tistory 발행 큐 추가 실패: {title} - {e}")
+        return False
+
+
+def _publish_post(title, content_html, tags, category_name, source_url):
+    """
+    HTTP 발행을 먼저 시도하고, 실패하면 Selenium 발행으로 대체합니다.
+    성공하면 True, 실패하면 False, 발행 여부를 확인하지 못하면 None을 반환합니다.
+    """
+    if TISTORY_HTTP_ENABLED:
+        http_result = post_to_tistory_http(title, content_html, tags, category_name, source_url)
+        # 발행 여부를 알 수 없는 경우(None)에는 중복 발행을 막기 위해 브라우저로 다시 발행하지 않습니다.
+        if http_result is not False:
+            return http_result
+        print("HTTP 발행에 실패하여 브라우저 발행으로 다시 시도합니다.")
+    return post_to_tistory(title, content_html, tags, category_name, source_url)
+
+
+def drain_tistory_queue(max_attempts=TISTORY_PUBLISH_MAX_ATTEMPTS):
+    """
+    대기 중인 글을 모두 발행하고 글마다 결과를 기록합니다. 브라우저가 필요한 글은 하나의 세션으로 발행합니다.
+    (제목, URL, 결과) 리스트를 반환하며, 결과는 "성공", "실패" 또는 "확인 필요"입니다.
+    이미 다른 발행 작업이 진행 중이면 아무것도 하지 않고 빈 리스트를 반환합니다.
+    """
+    if not _drain_lock.acquire(blocking=False):
+        print("이전 Tistory 발행 작업이 아직 진행 중이므로 이번 실행은 건너뜁니다.")
+        return []
+
+    try:
+        ensure_schema("tistory_publish_queue", _SCHEMA)
+        pending_posts = execute(
+            "SELECT id, title, content_html, tags, category_name, source_url FROM tistory_publish_queue "
+            "WHERE status = 'pending' ORDER BY id"
+        )
+        if not pending_posts:
+            print("발행 대기 중인 Tistory 글이 없습니다.")
+            return []
+
+        print(f"--- Tistory 발행 큐: 대기 중인 {len(pending_posts)}개 글 발행 시작 ---")
+        results = []
+        given_up = []
+        unconfirmed = []
+        try:
+            for post_id, title, content_html, tags, category_name, source_url in pending_posts:
+                try:
+                    published = _publish_post(title, content_html, tags, category_name, source_url)
+                    error = None if published else "발행 실패 (tistory_handler 로그 참고)"
+                except Exception as e:
+                    published = False
+                    error = str(e)
+
+                now = datetime.datetime.now().isoformat()
+                if published:
+                    execute("UPDATE tistory_publish_queue SET status = 'published', attempts = attempts + 1, "
+                            "last_error = NULL, updated_at = ? WHERE id = ?", (now, post_id), commit=True)
+                    status = "성공"
+                elif published is None:
+                    # 이미 발행되었을 수 있으므로 다시 시도하지 않고 직접 확인하도록 남겨 둡니다.
+                    execute("UPDATE tistory_publish_queue SET status = 'unknown', attempts = attempts + 1, "
+                            "last_error = ?, updated_at = ? WHERE id = ?",
+                            ("발행 요청 후 결과 확인 실패", now, post_id), commit=True)
+                    unconfirmed.append((title, source_url))
+                    status = "확인 필요"
+                else:
+                    execute(
+                        "UPDATE tistory_publish_queue SET attempts = attempts + 1, last_error = ?, updated_at = ?, "
+                        "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END WHERE id = ?",
+                        (error, now, max_attempts, post_id), commit=True)
+                    rows = execute("SELECT status FROM tistory_publish_queue WHERE id = ?", (post_id,))
+                    if rows and rows[0][0] == "failed":
+                        given_up.append((title, source_url))
+                    status = "실패"
+                print(f"  [{status}] {title}")
+                results.append((title, source_url, status))
+        finally:
+            # 발행 사이에는 브라우저를 띄워 두지 않습니다. 로그인 쿠키는 남아 있으므로 다음 실행에서 세션을 복원합니다.
+            close_tistory_session()
+
+        retention_date = (datetime.datetime.now() - datetime.timedelta(days=TISTORY_PUBLISH_RETENTION_DAYS)).isoformat()
+        execute("DELETE FROM tistory_publish_queue WHERE status = 'published' AND updated_at < ?",
+                (retention_date,), commit=True)
+    except sqlite3.Error as e:
+        print(f"[ERROR] Tistory 발행 큐 처리 실패: {e}")
+        send_slack_message(f"[ERROR] Tistory 발행 큐 처리 실패: {e}")
+        return []
+    finally:
+        _drain_lock.release()
+
+    failed = [(title, url) for title, url, status in results if status == "실패"]
+    print(f"--- Tistory 발행 완료: 성공 {len(results) - len(failed) - len(unconfirmed)}개, 실패 {len(failed)}개, "
+          f"확인 필요 {len(unconfirmed)}개 ---")
+    if unconfirmed:
+        unconfirmed_lines = "\n".join(f"- {title} ({url})" for title, url in unconfirmed)
+        send_slack_message(f"[WARN] Tistory 발행 결과를 확인하지 못한 글 {len(unconfirmed)}개 (중복 방지를 위해 자동으로 다시 시도하지 않음, "
+                           f"블로그에서 직접 확인 필요):\n{unconfirmed_lines}")
+    if failed:
+        failed_lines = "\n".join(f"- {title} ({url})" for title, url in failed)
+        message = f"[WARN] Tistory 발행 실패 {len(failed)}/{len(results)}개:\n{failed_lines}"
+        if given_up:
+            given_up_lines = "\n".join(f"- {title} ({url})" for title, url in given_up)
+            message += f"\n이 중 최대 시도 횟수({max_attempts}회)에 도달해 더 이상 시도하지 않는 글:\n{given_up_lines}"
+        if len(given_up) < len(failed):
+            message += "\n나머지 글은 다음 발행 작업에서 다시 시도합니다."
+        send_slack_message(message)
+    return results
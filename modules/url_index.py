@@ -0,0 +1,99 @@
+# modules/url_index.py
+"""
+Notion 데이터베이스별로 이미 발행된 URL을 로컬에 기록하는 인덱스 모듈입니다.
+- 중복 확인 시 Notion API 호출 전에 먼저 조회하여 불필요한 네트워크 요청을 줄입니다.
+- recorded_at은 URL이 Notion에 있는 것을 마지막으로 확인한 시각입니다. 실행 시작 시 불러온 스냅샷으로
+  기록을 갱신하고, 스냅샷에 없는(삭제된) URL과 보관 기간이 지난 URL은 정리하여 다시 수집될 수 있게 합니다.
+"""
+
+import sqlite3
+import time
+
+from config import URL_INDEX_RETENTION_DAYS
+from .local_store import ensure_schema, execute, executemany
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS seen_urls (
+        database_id TEXT NOT NULL,
+        url TEXT NOT NULL,
+        recorded_at REAL NOT NULL,
+        PRIMARY KEY (database_id, url)
+    )
+    """,
+]
+
+
+def is_known_url(url, DATABASE_ID):
+    """
+    URL이 해당 데이터베이스에 이미 발행된 것으로 기록되어 있는지 확인합니다.
+    """
+    ensure_schema("seen_urls", _SCHEMA)
+    rows = execute(
+        "SELECT 1 FROM seen_urls WHERE database_id = ? AND url = ? LIMIT 1",
+        (DATABASE_ID, url.strip()),
+    )
+    return bool(rows)
+
+
+def mark_url_seen(url, DATABASE_ID):
+    """
+    URL을 해당 데이터베이스에 발행된 것으로 기록합니다.
+    """
+    if not url:
+        return
+    try:
+        ensure_schema("seen_urls", _SCHEMA)
+        execute(
+            "INSERT OR IGNORE INTO seen_urls (database_id, url, recorded_at) VALUES (?, ?, ?)",
+            (DATABASE_ID, url.strip(), time.time()),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        # 기록 실패 시 다음 실행에서 Notion 조회로 대체되므로 경고만 출력합니다.
+        print(f"로컬 URL 인덱스 기록 실패 ({url}): {e}")
+
+
+def sync_seen_urls(urls, DATABASE_ID):
+    """
+    Notion에서 불러온 최근 URL 스냅샷으로 인덱스를 맞춥니다.
+    스냅샷의 URL은 확인 시각을 갱신하고, 스냅샷에 없는 기존 URL(Notion에서 삭제·보관된 항목)은 제거합니다.
+    """
+    sync_started_at = time.time()
+    rows = [(DATABASE_ID, url.strip(), sync_started_at) for url in urls if url]
+    try:
+        ensure_schema("seen_urls", _SCHEMA)
+        executemany(
+            "INSERT OR REPLACE INTO seen_urls (database_id, url, recorded_at) VALUES (?, ?, ?)",
+            rows,
+        )
+        execute(
+            "DELETE FROM seen_urls WHERE database_id = ? AND recorded_at < ?",
+            (DATABASE_ID, sync_started_at),
+            commit=True,
+        )
+    except sqlite3.Error as e:
+        print(f"로컬 URL 인덱스 동기화 실패: {e}")
+
+
+def prune_seen_urls(DATABASE_ID, days=URL_INDEX_RETENTION_DAYS):
+    """
+    마지막 확인 후 `days`일이 지난 URL을 인덱스에서 제거하고 제거한 개수를 반환합니다.
+    """
+    threshold = time.time() - days * 86400
+    try:
+        ensure_schema("seen_urls", _SCHEMA)
+        expired = execute(
+            "SELECT COUNT(*) FROM seen_urls WHERE database_id = ? AND recorded_at < ?",
+            (DATABASE_ID, threshold),
+        )[0][0]
+        if expired:
+            execute(
+                "DELETE FROM seen_urls WHERE database_id = ? AND recorded_at < ?",
+                (DATABASE_ID, threshold),
+                commit=True,
+            )
+        return expired
+    except sqlite3.Error as e:
+        print(f"로컬 URL 인덱스 정리 실패: {e}")
+        return 0
@@ -10,6 +10,7 @@ import requests
 import datetime
 import re
 from config import SLACK_WEBHOOK_URL
+from .http_client import get_session
 
 def filter_bmp_characters(s):
     """
@@ -25,7 +26,7 @@ def send_slack_message(message):
     """
     payload = {"text": message}
     try:
-        response = requests.post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
+        response = get_session().post(SLACK_WEBHOOK_URL, json=payload, timeout=10)
         response.raise_for_status()  # HTTP 오류 발생 시 예외를 발생시킴
         print("슬랙 메시지 전송 성공!")
     except requests.exceptions.RequestException as e:
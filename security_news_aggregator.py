@@ -8,17 +8,40 @@ import time
 import datetime
 import schedule
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 설정 및 모듈 함수 임포트
-from config import GEMINI_API_KEY, NOTION_API_TOKEN, BOANISSUE_DATABASE_ID, CVE_DATABASE_ID, SLACK_WEBHOOK_URL
+from config import GEMINI_API_KEY, NOTION_API_TOKEN, BOANISSUE_DATABASE_ID, CVE_DATABASE_ID, SLACK_WEBHOOK_URL, CRAWLING_MAX_WORKERS, ARCHIVE_INTERVAL_HOURS, TISTORY_PUBLISH_INTERVAL_MINUTES
 # generate_weekly_tech_keywords 함수 임포트 추가
 from modules.crawlers import boanNews_crawling, dailysecu_crawling, securityNotice_crawling, crawl_ncsc_page, nvd_cve_crawling, Week_nvd_cve_crawling, generate_weekly_tech_keywords
-from modules.notion_handler import delete_old_entries
+from modules.notion_handler import delete_old_entries, preload_url_snapshot, clear_url_snapshot, sync_recent_entries
+from modules.notion_writer import flush_notion_writes
+from modules.notion_block_appender import resume_pending_block_appends
+from modules.tistory_queue import drain_tistory_queue
 from modules.utils import send_slack_message
 
+def run_crawling_task(task_name, task_function):
+    """
+    하나의 크롤링 작업을 실행하고 소요 시간과 오류를 기록합니다.
+    작업 내부의 예외는 여기서 처리되므로 다른 작업의 실행에 영향을 주지 않습니다.
+    """
+    task_start_time = time.time()
+    try:
+        print(f"--- {task_name} 크롤링 시작 ---")
+        task_function()
+        task_duration = time.time() - task_start_time
+        print(f"--- {task_name} 크롤링 완료 (소요 시간: {task_duration:.2f}초) ---")
+    except Exception as e:
+        task_duration = time.time() - task_start_time
+        error_msg = f"{task_name} 크롤링 전체 실행 중 오류 발생 (소요 시간: {task_duration:.2f}초): {e}"
+        print(f"[CRITICAL] {error_msg}")
+        send_slack_message(f"[CRITICAL ERROR] {error_msg}")
+
 def start_regular_tasks():
     """
-    매시간 실행되는 일반 크롤링 작업 및 오래된 항목 삭제 작업을 수행합니다.
+    매시간 실행되는 일반 크롤링 작업을 수행합니다.
+    오래된 항목 삭제 작업은 start_archive_tasks()에서 ARCHIVE_INTERVAL_HOURS 주기로 따로 실행됩니다.
     """
     overall_start_time = time.time()
     current_time_str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -26,6 +49,13 @@ def start_regular_tasks():
     print(f"[{current_time_str}] 일반 크롤링 작업을 시작합니다.")
     send_slack_message(f"[{current_time_str}] 일반 보안뉴스 크롤링 및 Notion 업데이트 작업을 시작합니다.")
 
+    # 모든 크롤러가 공유할 최근 90일 URL 스냅샷을 한 번에 불러옵니다.
+    # 실패하더라도 항목별 중복 확인으로 동작하므로 작업은 계속 진행됩니다.
+    preload_url_snapshot(BOANISSUE_DATABASE_ID)
+
+    # 이전 실행에서 중단된 Notion 블록 추가 작업을 먼저 이어서 마무리합니다.
+    resume_pending_block_appends()
+
     crawling_tasks = [
         ("보안뉴스", boanNews_crawling),
         ("데일리시큐", dailysecu_crawling),
@@ -33,20 +63,32 @@ def start_regular_tasks():
         ("NCSC 보안공지", crawl_ncsc_page)
     ]
 
-    for task_name, task_function in crawling_tasks:
-        task_start_time = time.time()
-        try:
-            print(f"--- {task_name} 크롤링 시작 ---")
-            task_function()
-            task_duration = time.time() - task_start_time
-            print(f"--- {task_name} 크롤링 완료 (소요 시간: {task_duration:.2f}초) ---")
-        except Exception as e:
-            task_duration = time.time() - task_start_time
-            error_msg = f"{task_name} 크롤링 전체 실행 중 오류 발생 (소요 시간: {task_duration:.2f}초): {e}"
-            print(f"[CRITICAL] {error_msg}")
-            send_slack_message(f"[CRITICAL ERROR] {error_msg}")
-        time.sleep(1)
+    # 서로 독립적인 크롤링 작업을 병렬로 실행합니다. (최대 동시 실행 수는 config에서 설정)
+    with ThreadPoolExecutor(max_workers=max(1, CRAWLING_MAX_WORKERS), thread_name_prefix="crawler") as executor:
+        futures = [executor.submit(run_crawling_task, task_name, task_function) for task_name, task_function in crawling_tasks]
+        for future in futures:
+            future.result()
+
+    # 크롤러가 작성 큐에 넣은 Notion 페이지가 모두 생성될 때까지 기다리고 결과를 보고합니다.
+    flush_notion_writes()
 
+    # 주간 작업이 읽는 로컬 최근 항목을 이번 시간의 Notion 변경분으로 갱신해 둡니다.
+    sync_recent_entries(BOANISSUE_DATABASE_ID)
+
+    # 다음 실행에서는 최신 상태로 다시 불러오도록 스냅샷을 비웁니다.
+    clear_url_snapshot()
+
+    overall_duration = time.time() - overall_start_time
+    current_time_str_end = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    completion_message = (f"[{current_time_str_end}] 모든 일반 작업 완료. "
+                          f"(총 소요 시간: {overall_duration:.2f}초)")
+    print(completion_message)
+    send_slack_message(completion_message)
+
+def start_archive_tasks():
+    """
+    ARCHIVE_INTERVAL_HOURS 주기로 실행되는 오래된 항목 삭제(보관) 작업을 수행합니다.
+    """
     # 오래된 항목 삭제 작업
     BOANISSUE_delete_task_start_time = time.time()
     try:
@@ -72,12 +114,30 @@ def start_regular_tasks():
         print(f"[CRITICAL] {error_msg}")
         send_slack_message(f"[CRITICAL ERROR] {error_msg}")
 
-    overall_duration = time.time() - overall_start_time
-    current_time_str_end = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    completion_message = (f"[{current_time_str_end}] 모든 일반 작업 완료. "
-                          f"(총 소요 시간: {overall_duration:.2f}초)")
-    print(completion_message)
-    send_slack_message(completion_message)
+def start_tistory_publish_tasks():
+    """
+    TISTORY_PUBLISH_INTERVAL_MINUTES 주기로 실행되는 Tistory 발행 작업을 수행합니다.
+    Notion 작성 시 큐에 쌓인 글을 하나의 브라우저 세션으로 모두 발행합니다.
+    """
+    task_start_time = time.time()
+    try:
+        print("--- Tistory 발행 작업 시작 ---")
+        drain_tistory_queue()
+        task_duration = time.time() - task_start_time
+        print(f"--- Tistory 발행 작업 완료 (소요 시간: {task_duration:.2f}초) ---")
+    except Exception as e:
+        task_duration = time.time() - task_start_time
+        error_msg = f"Tistory 발행 작업 중 오류 발생 (소요 시간: {task_duration:.2f}초): {e}"
+        print(f"[CRITICAL] {error_msg}")
+        send_slack_message(f"[CRITICAL ERROR] {error_msg}")
+
+def run_tistory_publish_in_background():
+    """
+    스케줄러 루프가 크롤링 작업을 제때 실행할 수 있도록 Tistory 발행 작업을 별도 스레드에서 실행합니다.
+    이전 발행 작업이 아직 진행 중이면 drain_tistory_queue가 이번 실행을 건너뜁니다.
+    """
+    threading.Thread(target=start_tistory_publish_tasks, name="tistory-publisher", daemon=True).start()
+
 
 def start_weekly_nvd_cve():
     """
@@ -123,17 +183,25 @@ if __name__ == "__main__":
 
         start_regular_tasks()
 
+        start_archive_tasks()
+
+        start_tistory_publish_tasks()
+
         # 환경 변수에 따라 스케줄러 실행 여부 결정
         run_scheduler_env = os.environ.get("RUN_SCHEDULER", "true").lower()
         if run_scheduler_env == "true":
             # 일반 작업은 매시간 정각에 실행
             schedule.every(1).hours.at(":00").do(start_regular_tasks)
+            # 오래된 항목 삭제(보관)는 ARCHIVE_INTERVAL_HOURS 주기로 실행 (정각 작업과 겹치지 않도록 30분에 실행)
+            schedule.every(ARCHIVE_INTERVAL_HOURS).hours.at(":30").do(start_archive_tasks)
+            # Tistory 발행은 TISTORY_PUBLISH_INTERVAL_MINUTES 주기로 별도 스레드에서 실행
+            schedule.every(TISTORY_PUBLISH_INTERVAL_MINUTES).minutes.do(run_tistory_publish_in_background)
             # NVD CVE 크롤링은 매주 월요일 오전 9시에 실행
             schedule.every().monday.at("09:00").do(start_weekly_nvd_cve)
 
             current_time_for_log = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            print(f"[{current_time_for_log}] 스케줄러가 설정되었습니다. 일반 작업은 매시간 정각, NVD CVE는 매주 월요일 09:00에 실행됩니다.")
-            send_slack_message(f"[{current_time_for_log}] 스케줄러 시작됨. 일반 작업은 매시간 정각, NVD CVE는 매주 월요일 09:00에 실행 예정.")
+            print(f"[{current_time_for_log}] 스케줄러가 설정되었습니다. 일반 작업은 매시간 정각, 오래된 항목 보관은 {ARCHIVE_INTERVAL_HOURS}시간마다, Tistory 발행은 {TISTORY_PUBLISH_INTERVAL_MINUTES}분마다, NVD CVE는 매주 월요일 09:00에 실행됩니다.")
+            send_slack_message(f"[{current_time_for_log}] 스케줄러 시작됨. 일반 작업은 매시간 정각, 오래된 항목 보관은 {ARCHIVE_INTERVAL_HOURS}시간마다, Tistory 발행은 {TISTORY_PUBLISH_INTERVAL_MINUTES}분마다, NVD CVE는 매주 월요일 09:00에 실행 예정.")
 
             try:
                 while True:
@@ -0,0 +1,45 @@
+# tests/test_feed_encoding.py
+"""
+modules/feed_encoding.py가 XML 선언의 인코딩에 따라 피드 본문을 그대로 두거나 UTF-8로 변환하는지 확인하는 테스트입니다.
+- expat이 직접 디코딩하는 인코딩(latin-1, us-ascii 등 별칭 포함)은 변환하지 않음
+- 멀티바이트 인코딩(euc-kr)은 UTF-8로 변환
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.feed_encoding import prepare_feed_bytes  # noqa: E402
+
+FEED_URL = "https://example.com/rss"
+
+
+def make_feed(encoding, title):
+    return f'<?xml version="1.0" encoding="{encoding}"?><rss><title>{title}</title></rss>'.encode(encoding)
+
+
+class PrepareFeedBytesTest(unittest.TestCase):
+    def test_expat_native_encodings_are_returned_unchanged(self):
+        for encoding, title in (("latin-1", "Café"), ("ISO-8859-1", "Café"), ("us-ascii", "Cafe")):
+            with self.subTest(encoding=encoding):
+                content = make_feed(encoding, title)
+
+                prepared = prepare_feed_bytes(FEED_URL, content)
+
+                self.assertIs(prepared, content)
+                self.assertEqual(ET.fromstring(prepared).find("title").text, title)
+
+    def test_multibyte_encoding_is_converted_to_utf8(self):
+        prepared = prepare_feed_bytes(FEED_URL, make_feed("euc-kr", "보안 뉴스"))
+
+        self.assertTrue(prepared.startswith(b'<?xml version="1.0" encoding="utf-8"?>'))
+        self.assertEqual(ET.fromstring(prepared).find("title").text, "보안 뉴스")
+
+
+if __name__ == "__main__":
+    unittest.main()
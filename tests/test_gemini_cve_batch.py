@@ -0,0 +1,178 @@
+# tests/test_gemini_cve_batch.py
+"""
+modules/gemini_handler.py의 CVE 묶음 응답 파싱과 개별 재시도를 고정된 응답 문자열로 확인하는 테스트입니다.
+- 구역 순서가 바뀌거나 요청하지 않은 CVE 구역이 섞인 응답
+- CVE 구역이나 제목/요약/본문 구역이 빠진 응답
+- 묶음 응답에서 찾지 못한 CVE만 개별 재시도되는지
+Gemini API는 호출하지 않고 _generate_text와 _CVE_details_text_single을 가짜 함수로 대체합니다.
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import gemini_handler  # noqa: E402
+
+CVE_ITEMS = [
+    ("CVE-2026-0001", "첫 번째 취약점 설명"),
+    ("CVE-2026-0002", "두 번째 취약점 설명"),
+    ("CVE-2026-0003", "세 번째 취약점 설명"),
+]
+CVE_IDS = [cve_id for cve_id, _ in CVE_ITEMS]
+
+
+def cve_block(cve_id, sections=("제목", "요약", "본문")):
+    """지정한 구역만 담은 CVE 구역 문자열을 만듭니다. 각 구역 내용은 '<CVE ID> <구역 이름>'입니다."""
+    lines = [f"===CVE start: {cve_id}==="]
+    for section in sections:
+        lines += [f"--{section} start---", f"{cve_id} {section}", f"---{section} end---"]
+    lines.append(f"===CVE end: {cve_id}===")
+    return "\n".join(lines)
+
+
+def expected_result(cve_id):
+    return (f"{cve_id} 제목", f"{cve_id} 요약", f"{cve_id} 본문")
+
+
+class ParseCveBatchResponseTest(unittest.TestCase):
+    def test_all_blocks_present(self):
+        response = "\n".join(cve_block(cve_id) for cve_id in CVE_IDS)
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS),
+                         {cve_id: expected_result(cve_id) for cve_id in CVE_IDS})
+
+    def test_reordered_blocks(self):
+        response = "\n\n".join(cve_block(cve_id) for cve_id in reversed(CVE_IDS))
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS),
+                         {cve_id: expected_result(cve_id) for cve_id in CVE_IDS})
+
+    def test_reordered_sections_inside_block(self):
+        response = cve_block(CVE_IDS[0], sections=("본문", "제목", "요약"))
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS[:1]),
+                         {CVE_IDS[0]: expected_result(CVE_IDS[0])})
+
+    def test_extra_block_is_ignored(self):
+        response = "\n".join([cve_block(CVE_IDS[0]), cve_block("CVE-2026-9999"), cve_block(CVE_IDS[1])])
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS[:2]),
+                         {cve_id: expected_result(cve_id) for cve_id in CVE_IDS[:2]})
+
+    def test_extra_section_does_not_leak_into_result(self):
+        response = cve_block(CVE_IDS[0], sections=("제목", "참고", "요약", "본문"))
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS[:1]),
+                         {CVE_IDS[0]: expected_result(CVE_IDS[0])})
+
+    def test_missing_block_and_missing_section_are_excluded(self):
+        response = "\n".join([cve_block(CVE_IDS[0]), cve_block(CVE_IDS[2], sections=("제목", "요약"))])
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS),
+                         {CVE_IDS[0]: expected_result(CVE_IDS[0])})
+
+    def test_empty_section_is_excluded(self):
+        response = cve_block(CVE_IDS[0]).replace(f"{CVE_IDS[0]} 요약", " ")
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS[:1]), {})
+
+    def test_id_prefix_does_not_match_longer_id(self):
+        response = cve_block("CVE-2026-00010")
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, ["CVE-2026-0001"]), {})
+
+    def test_unterminated_block_is_excluded(self):
+        response = cve_block(CVE_IDS[0]).rsplit("\n", 1)[0]
+
+        self.assertEqual(gemini_handler._parse_cve_batch_response(response, CVE_IDS[:1]), {})
+
+
+class CveDetailsTextPackedTest(unittest.TestCase):
+    def setUp(self):
+        self.prompts = []
+        self.retried_ids = []
+        patches = [
+            mock.patch.object(gemini_handler, "run_gemini_tasks",
+                              lambda calls: [function(*args) for function, args in calls]),
+            mock.patch.object(gemini_handler, "_CVE_details_text_single", self._fake_single),
+            mock.patch.object(gemini_handler, "send_slack_message", lambda message: None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fake_single(self, cve_id, description):
+        self.retried_ids.append(cve_id)
+        return (f"{cve_id} 개별 제목", f"{cve_id} 개별 요약", f"{cve_id} 개별 본문")
+
+    def _run_packed(self, responses, max_items=len(CVE_ITEMS)):
+        """묶음마다 responses의 응답을 차례로 돌려주도록 _generate_text를 대체하고 CVE_details_text_packed를 실행합니다."""
+        remaining_responses = list(responses)
+
+        def fake_generate_text(prompt_name, model_name, prompt, source_text, is_cacheable=None):
+            self.prompts.append(source_text)
+            return remaining_responses.pop(0)
+
+        with mock.patch.object(gemini_handler, "_generate_text", fake_generate_text):
+            return gemini_handler.CVE_details_text_packed(CVE_ITEMS, token_budget=100000, max_items=max_items)
+
+    def test_complete_response_needs_no_retry(self):
+        results = self._run_packed(["\n".join(cve_block(cve_id) for cve_id in CVE_IDS)])
+
+        self.assertEqual(len(self.prompts), 1)
+        self.assertEqual(self.retried_ids, [])
+        self.assertEqual(results, [expected_result(cve_id) for cve_id in CVE_IDS])
+
+    def test_reordered_and_extra_blocks_keep_input_order(self):
+        response = "\n".join([cve_block(CVE_IDS[2]), cve_block("CVE-2026-9999"),
+                              cve_block(CVE_IDS[0]), cve_block(CVE_IDS[1])])
+
+        results = self._run_packed([response])
+
+        self.assertEqual(self.retried_ids, [])
+        self.assertEqual(results, [expected_result(cve_id) for cve_id in CVE_IDS])
+
+    def test_only_missing_cves_are_retried(self):
+        # 두 번째 CVE는 구역이 없고, 세 번째 CVE는 본문 구역이 없습니다.
+        response = "\n".join([cve_block(CVE_IDS[0]), cve_block(CVE_IDS[2], sections=("제목", "요약"))])
+
+        results = self._run_packed([response])
+
+        self.assertEqual(self.retried_ids, [CVE_IDS[1], CVE_IDS[2]])
+        self.assertEqual(results, [
+            expected_result(CVE_IDS[0]),
+            (f"{CVE_IDS[1]} 개별 제목", f"{CVE_IDS[1]} 개별 요약", f"{CVE_IDS[1]} 개별 본문"),
+            (f"{CVE_IDS[2]} 개별 제목", f"{CVE_IDS[2]} 개별 요약", f"{CVE_IDS[2]} 개별 본문"),
+        ])
+
+    def test_block_from_other_batch_is_not_used(self):
+        # 두 개씩 묶었을 때 첫 묶음 응답에 두 번째 묶음의 CVE가 섞여 와도 그 묶음의 결과로 쓰지 않습니다.
+        first_response = "\n".join(cve_block(cve_id) for cve_id in CVE_IDS)
+        second_response = "형식이 맞지 않는 응답"
+
+        results = self._run_packed([first_response, second_response], max_items=2)
+
+        self.assertEqual(len(self.prompts), 2)
+        self.assertNotIn(CVE_IDS[2], self.prompts[0])
+        self.assertEqual(self.retried_ids, [CVE_IDS[2]])
+        self.assertEqual(results[:2], [expected_result(cve_id) for cve_id in CVE_IDS[:2]])
+        self.assertEqual(results[2][0], f"{CVE_IDS[2]} 개별 제목")
+
+    def test_batch_error_retries_every_cve_in_that_batch(self):
+        def failing_generate_text(*args, **kwargs):
+            raise RuntimeError("quota exceeded")
+
+        with mock.patch.object(gemini_handler, "_generate_text", failing_generate_text):
+            results = gemini_handler.CVE_details_text_packed(CVE_ITEMS, token_budget=100000, max_items=3)
+
+        self.assertEqual(self.retried_ids, CVE_IDS)
+        self.assertEqual(len(results), len(CVE_ITEMS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+# tests/test_markdown_ir.py
+"""
+modules/markdown_ir.py의 마크다운 파싱과 Notion/HTML 렌더링을 확인하는 테스트입니다.
+- 헤딩, 목록, 인용, 코드 블록, 표, 구분선
+- 인라인 굵게/기울임/취소선/코드/링크
+- Notion 텍스트 제한(2000자, rich_text 100개)에 맞춘 분할 경계
+- http/https 외의 링크 제거
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.markdown_ir import (  # noqa: E402
+    NOTION_MAX_RICH_TEXT_ITEMS,
+    NOTION_MAX_TEXT_LENGTH,
+    _split_spans,
+    parse_inline,
+    parse_markdown,
+    render_html,
+    render_notion_blocks,
+)
+
+
+def plain_span(text):
+    return (text, False, False, False, False, None)
+
+
+def block_text(block):
+    return "".join(rich_text["text"]["content"] for rich_text in block[block["type"]]["rich_text"])
+
+
+class ParseMarkdownTest(unittest.TestCase):
+    def test_headings(self):
+        ir_blocks = parse_markdown("# 제목1\n## 제목2\n### 제목3\n#### 문단")
+
+        self.assertEqual([block_type for block_type, _, _ in ir_blocks],
+                         ["heading_1", "heading_2", "heading_3", "paragraph"])
+        self.assertEqual(ir_blocks[0][1], [plain_span("제목1")])
+
+    def test_lists_quote_and_divider(self):
+        ir_blocks = parse_markdown("- 항목 A\n* 항목 B\n1. 첫째\n12. 열두째\n> 인용 1\n> 인용 2\n---")
+
+        self.assertEqual([block_type for block_type, _, _ in ir_blocks], [
+            "bulleted_list_item", "bulleted_list_item", "numbered_list_item", "numbered_list_item", "quote", "divider",
+        ])
+        self.assertEqual(ir_blocks[3][1], [plain_span("열두째")])
+        self.assertEqual(ir_blocks[4][1], [plain_span("인용 1\n인용 2")])
+
+    def test_consecutive_lines_form_one_paragraph(self):
+        ir_blocks = parse_markdown("첫 줄\n둘째 줄\n\n다음 문단")
+
+        self.assertEqual(ir_blocks, [
+            ("paragraph", [plain_span("첫 줄\n둘째 줄")], None),
+            ("paragraph", [plain_span("다음 문단")], None),
+        ])
+
+    def test_code_block_keeps_raw_lines(self):
+        ir_blocks = parse_markdown("```Python\nif x:  \n    **not bold**\n```\n뒤 문단")
+
+        self.assertEqual(ir_blocks[0], ("code", "if x:  \n    **not bold**", "python"))
+        self.assertEqual(ir_blocks[1][0], "paragraph")
+
+    def test_code_block_without_language(self):
+        self.assertEqual(parse_markdown("```\nx = 1\n```"), [("code", "x = 1", "plaintext")])
+
+    def test_table(self):
+        ir_blocks = parse_markdown("| 이름 | 점수 |\n|---|:---:|\n| CVE-1 | 9.8 |")
+
+        self.assertEqual(ir_blocks[0][0], "table")
+        self.assertEqual(ir_blocks[0][1], [["이름", "점수"], ["CVE-1", "9.8"]])
+
+    def test_empty_input(self):
+        self.assertEqual(parse_markdown(""), [])
+        self.assertEqual(parse_markdown("  \n "), [])
+
+
+class ParseInlineTest(unittest.TestCase):
+    def test_inline_formats(self):
+        spans = parse_inline("a **b** *c* ~~d~~ `e` [f](https://x.test/f)")
+
+        self.assertEqual(spans, [
+            ("a ", False, False, False, False, None),
+            ("b", True, False, False, False, None),
+            (" ", False, False, False, False, None),
+            ("c", False, True, False, False, None),
+            (" ", False, False, False, False, None),
+            ("d", False, False, True, False, None),
+            (" ", False, False, False, False, None),
+            ("e", False, False, False, True, None),
+            (" ", False, False, False, False, None),
+            ("f", False, False, False, False, "https://x.test/f"),
+        ])
+
+    def test_nested_format_inside_link(self):
+        spans = parse_inline("[**굵은 링크**](https://x.test)")
+
+        self.assertEqual(spans, [("굵은 링크", True, False, False, False, "https://x.test")])
+
+    def test_code_content_is_not_parsed(self):
+        self.assertEqual(parse_inline("`**x**`"), [("**x**", False, False, False, True, None)])
+
+    def test_list_marker_asterisk_is_not_italic(self):
+        self.assertEqual(parse_inline("2 * 3 * 4"), [plain_span("2 * 3 * 4")])
+
+
+class SplitSpansTest(unittest.TestCase):
+    def test_exact_limit_fits_one_chunk(self):
+        chunks = _split_spans([plain_span("a" * NOTION_MAX_TEXT_LENGTH)])
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(len(chunks[0][0]["text"]["content"]), NOTION_MAX_TEXT_LENGTH)
+
+    def test_one_over_limit_splits(self):
+        chunks = _split_spans([plain_span("a" * (NOTION_MAX_TEXT_LENGTH + 1))])
+
+        self.assertEqual([sum(len(r["text"]["content"]) for r in chunk) for chunk in chunks],
+                         [NOTION_MAX_TEXT_LENGTH, 1])
+
+    def test_span_crossing_boundary_keeps_format_on_both_sides(self):
+        bold_span = ("b" * 20, True, False, False, False, None)
+        chunks = _split_spans([plain_span("a" * (NOTION_MAX_TEXT_LENGTH - 10)), bold_span])
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(chunks[0][1]["text"]["content"], "b" * 10)
+        self.assertEqual(chunks[1][0]["text"]["content"], "b" * 10)
+        self.assertTrue(chunks[0][1]["annotations"]["bold"])
+        self.assertTrue(chunks[1][0]["annotations"]["bold"])
+
+    def test_rich_text_item_limit(self):
+        spans = [("x", index % 2 == 0, False, False, False, None) for index in range(NOTION_MAX_RICH_TEXT_ITEMS + 1)]
+
+        chunks = _split_spans(spans)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [NOTION_MAX_RICH_TEXT_ITEMS, 1])
+
+    def test_no_spans_gives_one_empty_chunk(self):
+        self.assertEqual(_split_spans([]), [[]])
+
+    def test_long_paragraph_becomes_several_blocks(self):
+        text = "가" * 4500
+
+        blocks = render_notion_blocks(parse_markdown(text))
+
+        self.assertEqual([block["type"] for block in blocks], ["paragraph"] * 3)
+        self.assertEqual("".join(block_text(block) for block in blocks), text)
+
+
+class RenderNotionBlocksTest(unittest.TestCase):
+    def test_block_types_and_annotations(self):
+        blocks = render_notion_blocks(parse_markdown("## 제목\n- **굵게** [링크](https://x.test)\n---\n```bash\nls\n```"))
+
+        self.assertEqual([block["type"] for block in blocks], ["heading_2", "bulleted_list_item", "divider", "code"])
+        list_rich_text = blocks[1]["bulleted_list_item"]["rich_text"]
+        self.assertTrue(list_rich_text[0]["annotations"]["bold"])
+        self.assertEqual(list_rich_text[2]["text"]["link"], {"url": "https://x.test"})
+        self.assertEqual(blocks[3]["code"]["language"], "bash")
+        self.assertEqual(block_text(blocks[3]), "ls")
+
+    def test_table_kept_as_raw_text_paragraph(self):
+        table_text = "| a | b |\n|---|---|\n| 1 | 2 |"
+
+        blocks = render_notion_blocks(parse_markdown(table_text))
+
+        self.assertEqual(blocks[0]["type"], "paragraph")
+        self.assertEqual(block_text(blocks[0]), table_text)
+
+    def test_empty_input_gives_placeholder(self):
+        blocks = render_notion_blocks([])
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(block_text(blocks[0]), "처리할 수 있는 상세 내용이 없습니다.")
+
+
+class RenderHtmlTest(unittest.TestCase):
+    def test_headings_lists_and_inline(self):
+        rendered = render_html(parse_markdown("# 제목\n- **A** *B*\n- `C`\n1. 하나\n문단 ~~D~~"))
+
+        self.assertEqual(rendered.split("\n"), [
+            "<h1>제목</h1>",
+            "<ul>",
+            "<li><strong>A</strong> <em>B</em></li>",
+            "<li><code>C</code></li>",
+            "</ul>",
+            "<ol>",
+            "<li>하나</li>",
+            "</ol>",
+            "<p>문단 <del>D</del></p>",
+        ])
+
+    def test_code_block_is_escaped(self):
+        rendered = render_html(parse_markdown("```html\n<script>alert(1)</script>\n```"))
+
+        self.assertEqual(rendered, '<pre><code class="language-html">&lt;script&gt;alert(1)&lt;/script&gt;</code></pre>')
+
+    def test_text_is_escaped(self):
+        self.assertEqual(render_html(parse_markdown("a < b & c")), "<p>a &lt; b &amp; c</p>")
+
+    def test_table(self):
+        rendered = render_html(parse_markdown("| a | b |\n|---|---|\n| **1** | 2 |"))
+
+        self.assertEqual(rendered, "<table><thead><tr><th>a</th><th>b</th></tr></thead>"
+                                   "<tbody><tr><td><strong>1</strong></td><td>2</td></tr></tbody></table>")
+
+
+class LinkFilterTest(unittest.TestCase):
+    def test_http_and_https_links_are_kept(self):
+        ir_blocks = parse_markdown("[a](https://x.test/a?q=1&r=2) [b](HTTP://X.TEST/b)")
+
+        self.assertEqual(render_html(ir_blocks),
+                         '<p><a href="https://x.test/a?q=1&amp;r=2">a</a> <a href="HTTP://X.TEST/b">b</a></p>')
+        rich_text = render_notion_blocks(ir_blocks)[0]["paragraph"]["rich_text"]
+        self.assertEqual(rich_text[0]["text"]["link"], {"url": "https://x.test/a?q=1&r=2"})
+
+    def test_other_schemes_become_plain_text(self):
+        for link in ("javascript:alert%28document.cookie%29", "data:text/html;base64,PHNjcmlwdD4=", "/relative/path"):
+            with self.subTest(link=link):
+                ir_blocks = parse_markdown(f"[클릭]({link})")
+
+                self.assertEqual(render_html(ir_blocks), "<p>클릭</p>")
+                rich_text = render_notion_blocks(ir_blocks)[0]["paragraph"]["rich_text"]
+                self.assertNotIn("link", rich_text[0]["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# tests/test_notion_block_appender.py
+"""
+modules/notion_block_appender.py의 이어쓰기와 최대 시도 횟수 처리를 임시 SQLite 파일로 확인하는 테스트입니다.
+Notion 요청(notion_request)과 Slack 알림은 가짜 함수로 대체합니다.
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import local_store, notion_block_appender  # noqa: E402
+
+PAGE_ID = "page-1"
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = "" if status_code == 200 else "validation_error"
+
+
+class FakeNotion:
+    """블록 추가 요청을 기록하고, fail_calls에 지정한 순번(1부터)의 요청은 실패시킵니다."""
+
+    def __init__(self, fail_calls=(), fail_always=False, error=None):
+        self.fail_calls = set(fail_calls)
+        self.fail_always = fail_always
+        self.error = error
+        self.sent_batches = []
+
+    def __call__(self, method, path, json=None, **kwargs):
+        call_number = len(self.sent_batches) + 1
+        self.sent_batches.append(json["children"])
+        if self.fail_always or call_number in self.fail_calls:
+            if self.error:
+                raise self.error
+            return FakeResponse(400)
+        return FakeResponse(200)
+
+    def first_block_ids(self):
+        return [batch[0]["id"] for batch in self.sent_batches]
+
+
+def make_blocks(count):
+    return [{"id": index} for index in range(count)]
+
+
+class NotionBlockAppenderTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.slack_messages = []
+        patches = [
+            mock.patch.object(local_store, "LOCAL_DB_PATH", os.path.join(self.temp_dir.name, "local_store.sqlite3")),
+            mock.patch.object(local_store, "_connection", None),
+            mock.patch.object(local_store, "_initialized_schemas", set()),
+            mock.patch.object(notion_block_appender, "_columns_checked", False),
+            mock.patch.object(notion_block_appender, "send_slack_message", self.slack_messages.append),
+            mock.patch.object(notion_block_appender, "NOTION_BLOCK_APPEND_MAX_ATTEMPTS", 3),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        if local_store._connection is not None:
+            local_store._connection.close()
+        self.temp_dir.cleanup()
+
+    def _use_notion(self, fake_notion):
+        patcher = mock.patch.object(notion_block_appender, "notion_request", fake_notion)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return fake_notion
+
+    def _rows(self):
+        return local_store.execute("SELECT page_id, next_batch, attempts, status FROM notion_block_appends")
+
+    def test_appends_all_batches_and_deletes_record(self):
+        fake_notion = self._use_notion(FakeNotion())
+
+        self.assertTrue(notion_block_appender.start_block_append(PAGE_ID, "제목", make_blocks(250)))
+
+        self.assertEqual([len(batch) for batch in fake_notion.sent_batches], [100, 100, 50])
+        self.assertEqual(self._rows(), [])
+
+    def test_failure_keeps_next_batch_and_resume_skips_appended_batches(self):
+        fake_notion = self._use_notion(FakeNotion(fail_calls={2}))
+
+        self.assertFalse(notion_block_appender.start_block_append(PAGE_ID, "제목", make_blocks(250)))
+        self.assertEqual(self._rows(), [(PAGE_ID, 1, 1, "pending")])
+
+        completed, remaining = notion_block_appender.resume_pending_block_appends()
+
+        self.assertEqual((completed, remaining), (1, 0))
+        # 첫 배치(0번 블록부터)는 다시 보내지 않고, 실패한 두 번째 배치부터 이어서 보냅니다.
+        self.assertEqual(fake_notion.first_block_ids(), [0, 100, 100, 200])
+        self.assertEqual(self._rows(), [])
+
+    def test_gives_up_after_max_attempts_and_reports_once(self):
+        fake_notion = self._use_notion(FakeNotion(fail_always=True))
+
+        self.assertFalse(notion_block_appender.start_block_append(PAGE_ID, "제목", make_blocks(150)))
+        self.assertEqual(notion_block_appender.resume_pending_block_appends(), (0, 1))
+        self.assertEqual(self._rows(), [(PAGE_ID, 0, 2, "pending")])
+
+        # 세 번째 실패에서 포기하고, 보고한 뒤 기록을 지웁니다.
+        self.assertEqual(notion_block_appender.resume_pending_block_appends(), (0, 0))
+        self.assertEqual(self._rows(), [])
+        give_up_messages = [message for message in self.slack_messages if "더 이상 시도하지 않습니다" in message]
+        self.assertEqual(len(give_up_messages), 1)
+
+        sent_count = len(fake_notion.sent_batches)
+        self.assertEqual(notion_block_appender.resume_pending_block_appends(), (0, 0))
+        self.assertEqual(len(fake_notion.sent_batches), sent_count)
+
+    def test_network_error_counts_as_attempt(self):
+        self._use_notion(FakeNotion(fail_always=True, error=requests.exceptions.ConnectionError("down")))
+
+        self.assertFalse(notion_block_appender.start_block_append(PAGE_ID, "제목", make_blocks(10)))
+
+        self.assertEqual(self._rows(), [(PAGE_ID, 0, 1, "pending")])
+
+    def test_progress_save_error_does_not_fail_appended_page(self):
+        fake_notion = self._use_notion(FakeNotion())
+        original_execute = notion_block_appender.execute
+
+        def execute_failing_progress_updates(sql, *args, **kwargs):
+            if sql.startswith("UPDATE notion_block_appends SET next_batch"):
+                raise sqlite3.OperationalError("database is locked")
+            return original_execute(sql, *args, **kwargs)
+
+        with mock.patch.object(notion_block_appender, "execute", execute_failing_progress_updates):
+            self.assertTrue(notion_block_appender.start_block_append(PAGE_ID, "제목", make_blocks(250)))
+
+        self.assertEqual(len(fake_notion.sent_batches), 3)
+        self.assertEqual(self._rows(), [])
+
+    def test_adds_missing_columns_to_existing_table(self):
+        self._use_notion(FakeNotion())
+        # attempts/status 열이 없던 이전 버전의 테이블과 미완료 작업
+        local_store.execute(
+            "CREATE TABLE notion_block_appends (page_id TEXT PRIMARY KEY, title TEXT, blocks_json TEXT NOT NULL, "
+            "next_batch INTEGER NOT NULL DEFAULT 0, updated_at TEXT NOT NULL)", commit=True)
+        local_store.execute("INSERT INTO notion_block_appends VALUES (?, ?, ?, 0, '2026-01-01T00:00:00')",
+                            (PAGE_ID, "제목", "[{\"id\": 0}]"), commit=True)
+
+        self.assertEqual(notion_block_appender.resume_pending_block_appends(), (1, 0))
+        self.assertEqual(self._rows(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
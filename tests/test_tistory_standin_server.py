@@ -0,0 +1,150 @@
+# tests/test_tistory_standin_server.py
+"""
+tools/tistory_standin_server.py를 임시 포트로 띄워 Tistory HTTP 발행 경로를 확인하는 테스트입니다.
+- 올바른 세션 쿠키로 발행에 성공하는지
+- 세션이 만료되면(302) 발행되지 않고 False를 반환하는지
+- 발행 큐가 HTTP 발행이 확실히 실패한 글만 Selenium 발행(post_to_tistory)으로 대체하는지
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import local_store, tistory_http, tistory_queue  # noqa: E402
+from tools.tistory_standin_server import StandinState, make_handler, write_cookie_file  # noqa: E402
+
+SESSION_VALUE = "test-session"
+CATEGORY_IDS = {"CVE": 3, "보안이슈": 0}
+
+
+class TistoryStandinServerTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.state = StandinState(SESSION_VALUE)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(self.state))
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.cookie_path = os.path.join(self.temp_dir.name, "tistory_cookies.json")
+
+        patches = [
+            mock.patch.object(tistory_http, "TISTORY_COOKIE_PATH", self.cookie_path),
+            mock.patch.object(tistory_http, "TISTORY_HTTP_BASE_URL", self.base_url),
+            mock.patch.object(tistory_http, "TISTORY_CATEGORY_IDS", CATEGORY_IDS),
+            mock.patch.object(local_store, "LOCAL_DB_PATH", os.path.join(self.temp_dir.name, "local_store.sqlite3")),
+            mock.patch.object(local_store, "_connection", None),
+            mock.patch.object(local_store, "_initialized_schemas", set()),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if local_store._connection is not None:
+            local_store._connection.close()
+        self.temp_dir.cleanup()
+
+    def _write_cookies(self, session_value):
+        write_cookie_file(self.cookie_path, session_value, "127.0.0.1")
+
+    def _drain_with_selenium_stub(self):
+        """Selenium 발행을 대체한 채 큐를 비우고 (결과, Selenium 호출 목록)을 반환합니다."""
+        selenium_calls = []
+
+        def fake_post_to_tistory(*args):
+            selenium_calls.append(args)
+            return True
+
+        with mock.patch.object(tistory_queue, "TISTORY_HTTP_ENABLED", True), \
+                mock.patch.object(tistory_queue, "post_to_tistory", fake_post_to_tistory), \
+                mock.patch.object(tistory_queue, "close_tistory_session", lambda: None), \
+                mock.patch.object(tistory_queue, "send_slack_message", lambda message: None):
+            results = tistory_queue.drain_tistory_queue()
+        return results, selenium_calls
+
+    def test_publish_success(self):
+        self._write_cookies(SESSION_VALUE)
+
+        result = tistory_http.post_to_tistory_http("제목", "<p>본문</p>", "CVE", "CVE", "https://example.com/a")
+
+        self.assertIs(result, True)
+        self.assertEqual(len(self.state.posts), 1)
+        post = self.state.posts[0]
+        self.assertEqual(post["title"], "[CVE]제목")
+        self.assertEqual(post["category"], 3)
+        self.assertIn("https://example.com/a", post["content"])
+
+    def test_expired_session_redirect(self):
+        self._write_cookies("expired-session")
+
+        result = tistory_http.post_to_tistory_http("제목", "<p>본문</p>", "CVE", "CVE")
+
+        self.assertIs(result, False)
+        self.assertEqual(self.state.posts, [])
+
+    def test_queue_falls_back_to_selenium_on_expired_session(self):
+        self._write_cookies("expired-session")
+        self.assertTrue(tistory_queue.enqueue_tistory_post("제목", "<p>본문</p>", "CVE", "CVE", "https://example.com/a"))
+
+        results, selenium_calls = self._drain_with_selenium_stub()
+
+        self.assertEqual(results, [("제목", "https://example.com/a", "성공")])
+        self.assertEqual(len(selenium_calls), 1)
+        self.assertEqual(self.state.posts, [])
+
+    def test_queue_uses_http_without_selenium_when_session_is_valid(self):
+        self._write_cookies(SESSION_VALUE)
+        tistory_queue.enqueue_tistory_post("제목", "<p>본문</p>", "CVE", "CVE", "https://example.com/a")
+
+        results, selenium_calls = self._drain_with_selenium_stub()
+
+        self.assertEqual(results, [("제목", "https://example.com/a", "성공")])
+        self.assertEqual(selenium_calls, [])
+        self.assertEqual(len(self.state.posts), 1)
+
+    def test_missing_category_id_skips_http(self):
+        self._write_cookies(SESSION_VALUE)
+        tistory_queue.enqueue_tistory_post("제목", "<p>본문</p>", "보안이슈", "보안이슈", "https://example.com/a")
+
+        results, selenium_calls = self._drain_with_selenium_stub()
+
+        self.assertEqual(results, [("제목", "https://example.com/a", "성공")])
+        self.assertEqual(len(selenium_calls), 1)
+        self.assertEqual(self.state.posts, [])
+
+    def test_connection_refused_allows_fallback(self):
+        self._write_cookies(SESSION_VALUE)
+        self.server.shutdown()
+        self.server.server_close()
+
+        result = tistory_http.post_to_tistory_http("제목", "<p>본문</p>", "CVE", "CVE")
+
+        self.assertIs(result, False)
+
+    def test_response_without_entry_url_is_not_retried(self):
+        self._write_cookies(SESSION_VALUE)
+        tistory_queue.enqueue_tistory_post("제목", "<p>본문</p>", "CVE", "CVE", "https://example.com/a")
+
+        # 서버는 글을 저장했지만 응답에서 글 주소를 읽지 못한 경우를 흉내 냅니다.
+        with mock.patch("requests.models.Response.json", return_value={}):
+            results, selenium_calls = self._drain_with_selenium_stub()
+
+        self.assertEqual(results, [("제목", "https://example.com/a", "확인 필요")])
+        self.assertEqual(selenium_calls, [])
+        self.assertEqual(len(self.state.posts), 1)
+        status_rows = local_store.execute("SELECT status FROM tistory_publish_queue")
+        self.assertEqual(status_rows, [("unknown",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
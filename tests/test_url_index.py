@@ -0,0 +1,103 @@
+# tests/test_url_index.py
+"""
+modules/url_index.py의 로컬 URL 인덱스를 임시 SQLite 파일로 확인하는 테스트입니다.
+- 기록한 URL과 기록하지 않은 URL의 조회 결과
+- Notion 스냅샷 동기화 시 스냅샷에 없는 URL 제거 (다른 데이터베이스의 기록은 유지)
+- 보관 기간이 지난 URL 정리
+
+실행: python -m pytest -q tests  (또는 python -m unittest discover tests)
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import local_store, url_index  # noqa: E402
+
+DATABASE_ID = "db-1"
+OTHER_DATABASE_ID = "db-2"
+
+
+class UrlIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        patches = [
+            mock.patch.object(local_store, "LOCAL_DB_PATH", os.path.join(self.temp_dir.name, "local_store.sqlite3")),
+            mock.patch.object(local_store, "_connection", None),
+            mock.patch.object(local_store, "_initialized_schemas", set()),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        if local_store._connection is not None:
+            local_store._connection.close()
+        self.temp_dir.cleanup()
+
+    def _set_recorded_at(self, url, DATABASE_ID, recorded_at):
+        local_store.execute("UPDATE seen_urls SET recorded_at = ? WHERE database_id = ? AND url = ?",
+                            (recorded_at, DATABASE_ID, url), commit=True)
+
+    def test_known_and_unknown_urls(self):
+        url_index.mark_url_seen(" https://example.com/a ", DATABASE_ID)
+
+        self.assertTrue(url_index.is_known_url("https://example.com/a", DATABASE_ID))
+        self.assertFalse(url_index.is_known_url("https://example.com/b", DATABASE_ID))
+        # 같은 URL이라도 다른 데이터베이스에는 기록되지 않은 것으로 봅니다.
+        self.assertFalse(url_index.is_known_url("https://example.com/a", OTHER_DATABASE_ID))
+
+    def test_empty_url_is_not_recorded(self):
+        url_index.mark_url_seen("", DATABASE_ID)
+
+        self.assertFalse(url_index.is_known_url("", DATABASE_ID))
+        self.assertEqual(local_store.execute("SELECT COUNT(*) FROM seen_urls")[0][0], 0)
+
+    def test_sync_removes_urls_missing_from_snapshot(self):
+        url_index.mark_url_seen("https://example.com/kept", DATABASE_ID)
+        url_index.mark_url_seen("https://example.com/removed", DATABASE_ID)
+        url_index.mark_url_seen("https://example.com/removed", OTHER_DATABASE_ID)
+        # 스냅샷을 불러오기 전에 기록된 URL로 만들기 위해 기록 시각을 과거로 옮깁니다.
+        for url in ("https://example.com/kept", "https://example.com/removed"):
+            self._set_recorded_at(url, DATABASE_ID, time.time() - 60)
+
+        url_index.sync_seen_urls(["https://example.com/kept", "https://example.com/new", None], DATABASE_ID)
+
+        self.assertTrue(url_index.is_known_url("https://example.com/kept", DATABASE_ID))
+        self.assertTrue(url_index.is_known_url("https://example.com/new", DATABASE_ID))
+        self.assertFalse(url_index.is_known_url("https://example.com/removed", DATABASE_ID))
+        self.assertTrue(url_index.is_known_url("https://example.com/removed", OTHER_DATABASE_ID))
+
+    def test_sync_refreshes_recorded_at(self):
+        url_index.mark_url_seen("https://example.com/a", DATABASE_ID)
+        old_recorded_at = time.time() - 100 * 86400
+        self._set_recorded_at("https://example.com/a", DATABASE_ID, old_recorded_at)
+
+        url_index.sync_seen_urls(["https://example.com/a"], DATABASE_ID)
+
+        recorded_at = local_store.execute("SELECT recorded_at FROM seen_urls WHERE url = ?", ("https://example.com/a",))[0][0]
+        self.assertGreater(recorded_at, old_recorded_at)
+
+    def test_prune_removes_only_expired_urls(self):
+        url_index.mark_url_seen("https://example.com/old", DATABASE_ID)
+        url_index.mark_url_seen("https://example.com/recent", DATABASE_ID)
+        url_index.mark_url_seen("https://example.com/old", OTHER_DATABASE_ID)
+        self._set_recorded_at("https://example.com/old", DATABASE_ID, time.time() - 91 * 86400)
+        self._set_recorded_at("https://example.com/old", OTHER_DATABASE_ID, time.time() - 91 * 86400)
+
+        pruned = url_index.prune_seen_urls(DATABASE_ID, days=90)
+
+        self.assertEqual(pruned, 1)
+        self.assertFalse(url_index.is_known_url("https://example.com/old", DATABASE_ID))
+        self.assertTrue(url_index.is_known_url("https://example.com/recent", DATABASE_ID))
+        self.assertTrue(url_index.is_known_url("https://example.com/old", OTHER_DATABASE_ID))
+        self.assertEqual(url_index.prune_seen_urls(DATABASE_ID, days=90), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
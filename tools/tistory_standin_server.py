@@ -0,0 +1,138 @@
+# tools/tistory_standin_server.py
+"""
+Tistory HTTP 발행(modules/tistory_http.py)을 오프라인에서 시험하기 위한 로컬 대체 서버입니다.
+표준 라이브러리 http.server만 사용하며, 실제 Tistory의 다음 동작만 흉내 냅니다.
+
+- POST /manage/post.json : 세션 쿠키(TSSESSION)를 확인하고 글을 메모리에 저장한 뒤 {"entryUrl": ...}를 반환
+                           쿠키가 없거나 다르면 로그인 페이지(/auth/login)로 302 리다이렉트 (세션 만료 흉내)
+- GET  /manage/posts.json : 지금까지 받은 글 목록(JSON)
+- GET  /<번호>            : 받은 글의 제목과 본문 HTML
+
+--write-cookies 옵션을 주면 서버가 인정하는 세션 쿠키를 Selenium 저장 형식으로 파일에 씁니다.
+
+사용 예:
+    python tools/tistory_standin_server.py --port 8765 --write-cookies data/tistory_cookies_standin.json
+    # config.py에서 TISTORY_HTTP_BASE_URL = "http://127.0.0.1:8765", TISTORY_COOKIE_PATH = "data/tistory_cookies_standin.json"으로 바꾼 뒤 발행 큐를 실행합니다.
+"""
+
+import argparse
+import html
+import json
+import os
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SESSION_COOKIE_NAME = "TSSESSION"
+REQUIRED_FIELDS = ("title", "content", "visibility", "category")
+
+
+class StandinState:
+    """서버가 받은 글과 인정하는 세션 값을 보관합니다."""
+
+    def __init__(self, session_value):
+        self.session_value = session_value
+        self.posts = []
+        self.lock = threading.Lock()
+
+
+def make_handler(state):
+    class TistoryStandinHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _has_valid_session(self):
+            cookie = SimpleCookie(self.headers.get("Cookie", ""))
+            return SESSION_COOKIE_NAME in cookie and cookie[SESSION_COOKIE_NAME].value == state.session_value
+
+        def do_POST(self):
+            if self.path != "/manage/post.json":
+                self._send_json(404, {"error": "not found"})
+                return
+            if not self._has_valid_session():
+                self.send_response(302)
+                self.send_header("Location", "/auth/login")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length).decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                self._send_json(400, {"error": "invalid json"})
+                return
+            missing = [field for field in REQUIRED_FIELDS if field not in payload]
+            if missing:
+                self._send_json(400, {"error": f"missing fields: {', '.join(missing)}"})
+                return
+
+            with state.lock:
+                state.posts.append(payload)
+                entry_id = len(state.posts)
+            host = self.headers.get("Host", f"127.0.0.1:{self.server.server_port}")
+            print(f"[standin] 글 {entry_id} 발행: {payload['title']} (카테고리 {payload['category']}, 공개 {payload['visibility']})")
+            self._send_json(200, {"entryUrl": f"http://{host}/{entry_id}"})
+
+        def do_GET(self):
+            if self.path == "/manage/posts.json":
+                with state.lock:
+                    posts = [{"id": index + 1, "title": post["title"], "category": post["category"], "tag": post.get("tag")}
+                             for index, post in enumerate(state.posts)]
+                self._send_json(200, {"items": posts})
+                return
+
+            entry_id = self.path.strip("/")
+            with state.lock:
+                post = state.posts[int(entry_id) - 1] if entry_id.isdigit() and 0 < int(entry_id) <= len(state.posts) else None
+            if post is None:
+                self._send_json(404, {"error": "not found"})
+                return
+            data = f"<html><head><title>{html.escape(post['title'])}</title></head><body>{post['content']}</body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return TistoryStandinHandler
+
+
+def write_cookie_file(path, session_value, host):
+    """서버가 인정하는 세션 쿠키를 Selenium driver.get_cookies() 형식으로 저장합니다."""
+    cookie_dir = os.path.dirname(path)
+    if cookie_dir:
+        os.makedirs(cookie_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([{"name": SESSION_COOKIE_NAME, "value": session_value, "domain": host, "path": "/"}], f)
+    print(f"세션 쿠키 파일 저장: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--session", default="standin-session", help="서버가 인정하는 TSSESSION 쿠키 값")
+    parser.add_argument("--write-cookies", help="세션 쿠키를 저장할 파일 경로 (TISTORY_COOKIE_PATH와 같게 지정)")
+    args = parser.parse_args()
+
+    if args.write_cookies:
+        write_cookie_file(args.write_cookies, args.session, args.host)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(StandinState(args.session)))
+    print(f"Tistory 대체 서버 실행 중: http://{args.host}:{args.port} (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()